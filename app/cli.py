@@ -0,0 +1,75 @@
+"""Command line tools for the FootballHub API.
+
+    python -m app.cli migrate
+    python -m app.cli standings --championship 3
+    python -m app.cli summaries
+    python -m app.cli import player players.csv
+    python -m app.cli import match matches.ndjson --chunk-size 5000
+"""
+import argparse
+import json
+import sys
+
+from app.config.migrations import apply_migrations
+from app.services.CountryService import CountryService
+from app.services.ImportService import DEFAULT_IMPORT_CHUNK_SIZE, FORMATS, ImportService
+from app.services.StandingService import StandingService
+
+
+def _import(args: argparse.Namespace) -> int:
+    format = args.format or ("csv" if args.file.endswith(".csv") else "ndjson")
+    with open(args.file, encoding="utf-8", newline="") as file:
+        report = ImportService().import_lines(args.entity, file, format, args.chunk_size)
+    print(json.dumps(report.model_dump(), ensure_ascii=False, indent=2))
+    return 1 if report.error_count else 0
+
+
+def _migrate(args: argparse.Namespace) -> int:
+    applied = apply_migrations()
+    for name in applied:
+        print(f"aplicada: {name}")
+    if not applied:
+        print("nenhuma migração pendente")
+    return 0
+
+
+def _standings(args: argparse.Namespace) -> int:
+    rows = StandingService().rebuild_standings(args.championship or None)
+    print(f"linhas da classificação recalculadas: {rows}")
+    return 0
+
+
+def _summaries(args: argparse.Namespace) -> int:
+    rows = CountryService().rebuild_summaries(args.country or None)
+    print(f"resumos de países recalculados: {rows}")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate = commands.add_parser("migrate", help="aplica as migrações de database/migrations")
+    migrate.set_defaults(handler=_migrate)
+
+    standings = commands.add_parser("standings", help="recalcula as tabelas de classificação a partir das partidas")
+    standings.add_argument("--championship", type=int, action="append", help="ID do campeonato (repetível; padrão: todos)")
+    standings.set_defaults(handler=_standings)
+
+    summaries = commands.add_parser("summaries", help="recalcula os resumos dos países (times, jogadores, estádios...)")
+    summaries.add_argument("--country", type=int, action="append", help="ID do país (repetível; padrão: todos)")
+    summaries.set_defaults(handler=_summaries)
+
+    importer = commands.add_parser("import", help="importa um arquivo NDJSON ou CSV")
+    importer.add_argument("entity", help="country, team, player, championship, match, ...")
+    importer.add_argument("file")
+    importer.add_argument("--format", choices=FORMATS)
+    importer.add_argument("--chunk-size", type=int, default=DEFAULT_IMPORT_CHUNK_SIZE)
+    importer.set_defaults(handler=_import)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from dotenv import load_dotenv
+
+from app.config.settings import _env_int
+
+_MISSING = object()
+
+
+class LocalVersions:
+    """Namespace versions kept in this process only."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions: Dict[str, int] = {}
+        self._modified: Dict[str, float] = {}
+        # Versions restart at 0 with the process: the token tells them apart.
+        self.token = uuid.uuid4().hex
+        self.started_at = time.time()
+
+    def get(self, namespace: str) -> int:
+        with self._lock:
+            return self._versions.get(namespace, 0)
+
+    def modified(self, namespace: str) -> float:
+        """Wall-clock time of the last bump (the process start if there was none)."""
+        with self._lock:
+            return self._modified.get(namespace, self.started_at)
+
+    def bump(self, namespace: str) -> int:
+        with self._lock:
+            self._versions[namespace] = self._versions.get(namespace, 0) + 1
+            self._modified[namespace] = time.time()
+            return self._versions[namespace]
+
+
+class SharedVersions:
+    """Namespace versions stored in a Redis-compatible server (anything with ``get``, ``set`` and ``incr``).
+
+    Every worker reads the version before using its local entries, so an
+    invalidation made by one worker is seen by all the others on their next read.
+    """
+
+    def __init__(self, client, prefix: str = "footballhub:cache:"):
+        self.client = client
+        self.prefix = prefix
+        self.token = prefix
+        self.started_at = 0.0
+
+    def get(self, namespace: str) -> int:
+        value = self.client.get(self.prefix + namespace)
+        return int(value) if value is not None else 0
+
+    def modified(self, namespace: str) -> float:
+        value = self.client.get(self.prefix + namespace + ":modified")
+        return float(value) if value is not None else self.started_at
+
+    def bump(self, namespace: str) -> int:
+        version = int(self.client.incr(self.prefix + namespace))
+        self.client.set(self.prefix + namespace + ":modified", time.time())
+        return version
+
+
+class TTLCache:
+    """Thread-safe LRU cache with a time to live, split into namespaces.
+
+    Entries are keyed by ``(namespace, version, key)``; invalidating a namespace
+    bumps its version, which makes all of its entries unreachable (they are
+    evicted by the LRU policy). The cached objects are shared between callers
+    and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 300, versions=None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.versions = versions or LocalVersions()
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def version(self, namespace: str) -> int:
+        """Current version of ``namespace``; pass it to ``get`` and ``set`` around a load."""
+        return self.versions.get(namespace)
+
+    def get(self, namespace: str, key: Hashable, default: Any = None, version: Optional[int] = None) -> Any:
+        entry_key = (namespace, self.version(namespace) if version is None else version, key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None and entry[0] > self.clock():
+                self._entries.move_to_end(entry_key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[entry_key]
+            self.misses += 1
+            return default
+
+    def set(self, namespace: str, key: Hashable, value: Any, version: Optional[int] = None) -> None:
+        """Store ``value``; with ``version`` (read before loading it), under that version.
+
+        A value loaded before an invalidation then lands under the old version
+        and is never served, instead of being filed under the new one.
+        """
+        entry_key = (namespace, self.version(namespace) if version is None else version, key)
+        with self._lock:
+            self._entries[entry_key] = (self.clock() + self.ttl, value)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, namespace: str, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value or call ``loader`` and cache its result (``None`` is not cached)."""
+        if self.max_entries <= 0:
+            return loader()
+        version = self.version(namespace)
+        value = self.get(namespace, key, _MISSING, version)
+        if value is _MISSING:
+            value = loader()
+            if value is not None:
+                self.set(namespace, key, value, version)
+        return value
+
+    def invalidate(self, *namespaces: str) -> None:
+        """Drop every entry of the given namespaces, in this process and in the other workers."""
+        for namespace in namespaces:
+            self.versions.bump(namespace)
+        with self._lock:
+            self.invalidations += len(namespaces)
+            for entry_key in [k for k in self._entries if k[0] in namespaces]:
+                del self._entries[entry_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "backend": type(self.versions).__name__,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+_cache: Optional[TTLCache] = None
+_cache_lock = threading.Lock()
+
+
+def _redis_client(url: str):
+    try:
+        import redis
+    except ImportError:
+        raise RuntimeError("CACHE_URL requires the 'redis' package (pip install redis).")
+    return redis.Redis.from_url(url)
+
+
+def create_cache() -> TTLCache:
+    """Build the cache from CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS and the optional CACHE_URL."""
+    load_dotenv()
+    url = os.getenv("CACHE_URL")
+    versions = SharedVersions(_redis_client(url)) if url else LocalVersions()
+    return TTLCache(
+        max_entries=_env_int("CACHE_MAX_ENTRIES", 1024),
+        ttl=_env_int("CACHE_TTL_SECONDS", 300),
+        versions=versions,
+    )
+
+
+def get_cache() -> TTLCache:
+    """Return the process-wide cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = create_cache()
+    return _cache
+
+
+def set_cache(cache: Optional[TTLCache]) -> None:
+    """Replace the process-wide cache (used by tests)."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
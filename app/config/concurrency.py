@@ -0,0 +1,69 @@
+import functools
+import os
+from typing import Any, Callable, Optional, TypeVar
+
+from anyio import CapacityLimiter, to_thread
+from anyio.lowlevel import RunVar
+
+from app.config.settings import get_database_settings
+
+T = TypeVar("T")
+
+# One limiter per event loop, like anyio's own default thread limiter.
+_limiter: RunVar[CapacityLimiter] = RunVar("db_thread_limiter")
+_threads: Optional[int] = None
+
+
+def _default_threads() -> int:
+    value = os.getenv("DB_THREADPOOL_SIZE")
+    if value is not None and value.strip() != "":
+        return int(value)
+    # Enough threads to use every pooled connection, and no more: extra threads
+    # would only block waiting for a connection to be checked in.
+    try:
+        settings = get_database_settings()
+    except ValueError:
+        return 10
+    return settings.pool_size + settings.max_overflow
+
+
+def get_db_threads() -> int:
+    global _threads
+    if _threads is None:
+        _threads = _default_threads()
+    return _threads
+
+
+def configure_db_threads(threads: Optional[int]) -> None:
+    """Set how many blocking database calls may run at once.
+
+    ``None`` goes back to the configured default. ``0`` runs the calls inline
+    on the event loop, which is only useful as a baseline for benchmarks.
+    """
+    global _threads
+    _threads = threads
+
+
+def _get_limiter() -> CapacityLimiter:
+    threads = get_db_threads()
+    try:
+        limiter = _limiter.get()
+    except LookupError:
+        limiter = CapacityLimiter(threads)
+        _limiter.set(limiter)
+    if limiter.total_tokens != threads:
+        limiter.total_tokens = threads
+    return limiter
+
+
+async def run_db(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking service/repository call without blocking the event loop.
+
+    The call goes to a worker thread from a pool bounded by DB_THREADPOOL_SIZE
+    (by default the size of the connection pool plus its overflow).
+    """
+    if get_db_threads() <= 0:
+        return func(*args, **kwargs)
+    return await to_thread.run_sync(
+        functools.partial(func, *args, **kwargs), limiter=_get_limiter()
+    )
@@ -0,0 +1,128 @@
+import threading
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlmodel import Session, create_engine
+
+from app.config.metrics import instrument_engine
+from app.config.settings import DatabaseSettings, get_database_settings
+from app.config.versions import track_writes
+
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
+
+class PoolCounters:
+    """Cumulative pool events, updated from SQLAlchemy pool listeners."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def as_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+            }
+
+
+def _attach_counters(engine: Engine) -> None:
+    counters = PoolCounters()
+    engine.pool_counters = counters
+
+    event.listen(engine, "connect", lambda *_: counters.incr("connects"))
+    event.listen(engine, "checkout", lambda *_: counters.incr("checkouts"))
+    event.listen(engine, "checkin", lambda *_: counters.incr("checkins"))
+    event.listen(engine, "invalidate", lambda *_: counters.incr("invalidations"))
+
+
+def create_db_engine(settings: Optional[DatabaseSettings] = None) -> Engine:
+    """Build an engine with the pool configuration from the settings."""
+    settings = settings or get_database_settings()
+    url = make_url(settings.url)
+
+    kwargs = {"echo": settings.echo, "pool_pre_ping": settings.pool_pre_ping}
+    if url.get_backend_name() == "sqlite":
+        # SQLite uses its own single-file pools; the sizing options do not apply.
+        kwargs["connect_args"] = {"check_same_thread": False}
+    else:
+        kwargs.update(
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
+            pool_timeout=settings.pool_timeout,
+            pool_recycle=settings.pool_recycle,
+        )
+        if url.get_backend_name() == "postgresql" and settings.statement_timeout_ms > 0:
+            kwargs["connect_args"] = {
+                "options": f"-c statement_timeout={settings.statement_timeout_ms}"
+            }
+
+    engine = create_engine(url, **kwargs)
+    _attach_counters(engine)
+    track_writes(engine)
+    instrument_engine(engine)
+    return engine
+
+
+def get_engine() -> Engine:
+    """Return the process-wide engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_db_engine()
+    return _engine
+
+
+def set_engine(engine: Optional[Engine]) -> None:
+    """Replace the process-wide engine (used by tests to inject their own database)."""
+    global _engine
+    if engine is not None and not hasattr(engine, "pool_counters"):
+        _attach_counters(engine)
+    if engine is not None and not getattr(engine, "tracks_writes", False):
+        track_writes(engine)
+    if engine is not None and not getattr(engine, "instrumented", False):
+        instrument_engine(engine)
+    with _engine_lock:
+        _engine = engine
+
+
+def dispose_engine() -> None:
+    """Close every pooled connection and forget the process-wide engine."""
+    global _engine
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose()
+        _engine = None
+
+
+def get_session() -> Session:
+    return Session(get_engine())
+
+
+def pool_status(engine: Optional[Engine] = None) -> Dict[str, object]:
+    """Snapshot of the connection pool usage."""
+    engine = engine or get_engine()
+    pool = engine.pool
+    status: Dict[str, object] = {"pool_class": type(pool).__name__}
+
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            status[name] = method()
+
+    counters = getattr(engine, "pool_counters", None)
+    if counters is not None:
+        status.update(counters.as_dict())
+    return status
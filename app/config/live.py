@@ -0,0 +1,166 @@
+import asyncio
+import threading
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, Hashable, Optional, Set
+
+from dotenv import load_dotenv
+
+from app.config.settings import _env_int
+
+
+class SlowConsumer(Exception):
+    """The subscriber fell more than ``queue_size`` messages behind and was dropped."""
+
+
+class Subscription:
+    """Bounded queue of the messages published on one channel since it was subscribed."""
+
+    def __init__(self, channel: Hashable, queue_size: int):
+        self.channel = channel
+        self.queue_size = queue_size
+        self.messages: Deque[Any] = deque()
+        self.dropped = False
+        self._waiter: Optional[asyncio.Future] = None
+
+    def offer(self, message: Any) -> bool:
+        if self.dropped:
+            return False
+        if len(self.messages) >= self.queue_size:
+            self.dropped = True
+            return False
+        self.messages.append(message)
+        self.wake()
+        return True
+
+    def wake(self) -> None:
+        """Make a waiting ``get`` return None (the heartbeat of an idle subscriber)."""
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def get(self) -> Any:
+        """
+        Next message, or None when woken by the hub's heartbeat while idle.
+        Raises SlowConsumer once the queued messages of a dropped subscriber
+        are consumed.
+        """
+        if not self.messages:
+            if self.dropped:
+                raise SlowConsumer()
+            # A bare future rather than a Queue (and wait_for for the heartbeat):
+            # no task or timer per wait, which adds up with thousands of subscribers.
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+            if not self.messages:
+                return None
+        return self.messages.popleft()
+
+
+class LiveHub:
+    """
+    In-process publish/subscribe with one channel per key (e.g. a match ID).
+
+    ``publish`` never waits: each subscriber has a queue of ``queue_size``
+    messages and one that falls further behind is dropped instead of making
+    the publisher (or the other subscribers) wait or holding an unbounded
+    backlog; it gets SlowConsumer and is expected to reconnect and replay
+    from the last message it saw. Every ``heartbeat`` seconds a single timer
+    wakes the idle subscribers (``get`` returns None), so streams can send
+    keep-alives. Subscribe, publish and get from the event loop of the
+    worker: the hub does not reach the other workers.
+    """
+
+    def __init__(self, queue_size: int = 256, heartbeat: Optional[float] = None):
+        self.queue_size = queue_size
+        self.heartbeat = heartbeat
+        self._channels: Dict[Hashable, Set[Subscription]] = defaultdict(set)
+        self._ticker: Optional[asyncio.TimerHandle] = None
+        self._ticker_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    def subscribe(self, channel: Hashable) -> Subscription:
+        subscription = Subscription(channel, self.queue_size)
+        self._channels[channel].add(subscription)
+        if self.heartbeat is not None and (self._ticker is None or self._ticker_loop is not asyncio.get_running_loop()):
+            self._ticker_loop = asyncio.get_running_loop()
+            self._ticker = self._ticker_loop.call_later(self.heartbeat, self._tick)
+        return subscription
+
+    def _tick(self) -> None:
+        for subscribers in self._channels.values():
+            for subscription in subscribers:
+                subscription.wake()
+        # The timer stops with the last subscriber; the next subscribe starts it again.
+        self._ticker = self._ticker_loop.call_later(self.heartbeat, self._tick) if self._channels else None
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._channels.get(subscription.channel)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._channels[subscription.channel]
+
+    def publish(self, channel: Hashable, message: Any) -> int:
+        """Queue ``message`` for every subscriber of ``channel``; returns how many got it."""
+        subscribers = self._channels.get(channel)
+        self.published += 1
+        if not subscribers:
+            return 0
+        delivered = 0
+        for subscription in list(subscribers):
+            if subscription.offer(message):
+                delivered += 1
+            else:
+                subscribers.discard(subscription)
+                self.dropped += 1
+        if not subscribers:
+            del self._channels[channel]
+        self.delivered += delivered
+        return delivered
+
+    def subscribers(self, channel: Hashable) -> int:
+        return len(self._channels.get(channel, ()))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "channels": len(self._channels),
+            "subscribers": sum(len(subscribers) for subscribers in self._channels.values()),
+            "queue_size": self.queue_size,
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+        }
+
+
+_hub: Optional[LiveHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_hub() -> LiveHub:
+    """
+    Return the process-wide hub, creating it on first use: LIVE_QUEUE_SIZE
+    messages per subscriber (default 256) and a keep-alive every
+    LIVE_HEARTBEAT_SECONDS (default 15).
+    """
+    global _hub
+    if _hub is None:
+        with _hub_lock:
+            if _hub is None:
+                load_dotenv()
+                _hub = LiveHub(
+                    queue_size=_env_int("LIVE_QUEUE_SIZE", 256),
+                    heartbeat=_env_int("LIVE_HEARTBEAT_SECONDS", 15),
+                )
+    return _hub
+
+
+def set_hub(hub: Optional[LiveHub]) -> None:
+    """Replace the process-wide hub (used by tests)."""
+    global _hub
+    with _hub_lock:
+        _hub = hub
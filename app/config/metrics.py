@@ -0,0 +1,223 @@
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "footballhub"
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 250)
+
+_QUERY_START = "metrics_query_start"
+
+
+def n_plus_one_threshold() -> int:
+    """Queries per request above which a request is reported as a probable N+1 (0 disables it)."""
+    value = os.getenv("N_PLUS_ONE_THRESHOLD")
+    if value is None or value.strip() == "":
+        return 20
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"N_PLUS_ONE_THRESHOLD must be an integer, got {value!r}.")
+
+
+class RequestStats:
+    """What one request did in the database, filled in by the engine listeners.
+
+    The object travels in a context variable, so the queries run by ``run_db``
+    in worker threads are counted for the request that started them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.rows = 0
+        self.slowest: Tuple[float, Optional[str]] = (0.0, None)
+        self.statements: Counter = Counter()
+        self.endpoint_done: Optional[float] = None
+        self.serialization_seconds = 0.0
+
+    def record_query(self, statement: str, seconds: float, rows: int) -> None:
+        with self._lock:
+            self.queries += 1
+            self.db_seconds += seconds
+            # DBAPIs report -1 when they do not know the count (SQLite SELECTs).
+            self.rows += max(rows, 0)
+            self.statements[statement] += 1
+            if seconds >= self.slowest[0]:
+                self.slowest = (seconds, statement)
+
+    def most_repeated(self) -> Tuple[Optional[str], int]:
+        with self._lock:
+            common = self.statements.most_common(1)
+        return common[0] if common else (None, 0)
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def start_request() -> Tuple[RequestStats, object]:
+    stats = RequestStats()
+    return stats, _current.set(stats)
+
+
+def end_request(token) -> None:
+    _current.reset(token)
+
+
+def current_stats() -> Optional[RequestStats]:
+    return _current.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault(_QUERY_START, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    starts = conn.info.get(_QUERY_START)
+    if stats is None or not starts:
+        return
+    stats.record_query(statement, time.perf_counter() - starts.pop(), cursor.rowcount)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Count and time the statements run on this engine for the current request."""
+    engine.instrumented = True
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+class Metrics:
+    """Process-wide counters and histograms, rendered in the Prometheus text format."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._help: Dict[str, Tuple[str, str]] = {}
+        self._counters: Dict[Tuple[str, Tuple], float] = {}
+        self._histograms: Dict[Tuple[str, Tuple], List[float]] = {}
+        self._buckets: Dict[str, Tuple[float, ...]] = {}
+
+    def describe(self, name: str, kind: str, help: str, buckets: Tuple[float, ...] = ()) -> None:
+        self._help[name] = (kind, help)
+        if kind == "histogram":
+            self._buckets[name] = buckets
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        buckets = self._buckets[name]
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            # One count per bucket, then the sum and the total count.
+            counts = self._histograms.setdefault(key, [0.0] * (len(buckets) + 2))
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    counts[index] += 1
+            counts[-2] += value
+            counts[-1] += 1
+
+    def render(self) -> str:
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items())
+        lines: List[str] = []
+        described = set()
+
+        def header(name: str) -> None:
+            if name not in described and name in self._help:
+                kind, help = self._help[name]
+                lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {kind}")
+                described.add(name)
+
+        for (name, labels), value in counters:
+            header(name)
+            lines.append(f"{name}{_labels(labels)} {value:g}")
+        for (name, labels), counts in histograms:
+            header(name)
+            for bound, count in zip(self._buckets[name], counts):
+                lines.append(f"{name}_bucket{_labels(labels + (('le', f'{bound:g}'),))} {count:g}")
+            lines.append(f"{name}_bucket{_labels(labels + (('le', '+Inf'),))} {counts[-1]:g}")
+            lines.append(f"{name}_sum{_labels(labels)} {counts[-2]:g}")
+            lines.append(f"{name}_count{_labels(labels)} {counts[-1]:g}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+def _create_metrics() -> Metrics:
+    metrics = Metrics()
+    metrics.describe(f"{PREFIX}_http_requests_total", "counter", "HTTP requests by route and status.")
+    metrics.describe(
+        f"{PREFIX}_http_request_duration_seconds", "histogram", "Time to answer a request.", DURATION_BUCKETS
+    )
+    metrics.describe(f"{PREFIX}_db_queries_total", "counter", "SQL statements run by the requests.")
+    metrics.describe(
+        f"{PREFIX}_db_queries_per_request", "histogram", "SQL statements per request.", QUERY_BUCKETS
+    )
+    metrics.describe(f"{PREFIX}_db_duration_seconds_total", "counter", "Time spent in SQL statements.")
+    metrics.describe(f"{PREFIX}_db_rows_total", "counter", "Rows reported by the driver (returned or written).")
+    metrics.describe(
+        f"{PREFIX}_serialization_duration_seconds_total", "counter", "Time spent validating and encoding responses."
+    )
+    metrics.describe(f"{PREFIX}_n_plus_one_total", "counter", "Requests over the N+1 query threshold.")
+    return metrics
+
+
+_metrics = _create_metrics()
+
+
+def get_metrics() -> Metrics:
+    return _metrics
+
+
+def record_request(method: str, route: str, status: int, stats: RequestStats) -> None:
+    """Add a finished request to the process metrics and report it if it looks like an N+1."""
+    seconds = time.perf_counter() - stats.started
+    metrics = get_metrics()
+    metrics.inc(f"{PREFIX}_http_requests_total", method=method, route=route, status=str(status))
+    metrics.observe(f"{PREFIX}_http_request_duration_seconds", seconds, route=route)
+    metrics.observe(f"{PREFIX}_db_queries_per_request", stats.queries, route=route)
+    if stats.queries:
+        metrics.inc(f"{PREFIX}_db_queries_total", stats.queries, route=route)
+        metrics.inc(f"{PREFIX}_db_duration_seconds_total", stats.db_seconds, route=route)
+        metrics.inc(f"{PREFIX}_db_rows_total", stats.rows, route=route)
+    if stats.serialization_seconds:
+        metrics.inc(f"{PREFIX}_serialization_duration_seconds_total", stats.serialization_seconds, route=route)
+
+    threshold = n_plus_one_threshold()
+    if threshold > 0 and stats.queries > threshold:
+        metrics.inc(f"{PREFIX}_n_plus_one_total", route=route)
+        statement, count = stats.most_repeated()
+        logger.warning(
+            "Possible N+1 in %s %s: %d queries (threshold %d); repeated %d times: %s",
+            method, route, stats.queries, threshold, count, statement,
+        )
@@ -0,0 +1,63 @@
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from app.config.database import get_engine
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "database" / "migrations"
+
+# V001__description.sql runs on every database; V002__description.postgresql.sql
+# only on that dialect.
+_FILE_PATTERN = re.compile(r"^V(?P<version>\d+)__[\w-]+?(?:\.(?P<dialect>[a-z]+))?\.sql$")
+
+
+def _split_statements(sql: str) -> List[str]:
+    lines = [line for line in sql.splitlines() if not line.strip().startswith("--")]
+    return [statement.strip() for statement in "\n".join(lines).split(";") if statement.strip()]
+
+
+def _ensure_table(connection: Connection) -> None:
+    connection.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_migrations ("
+        "version VARCHAR(255) PRIMARY KEY, applied_at TIMESTAMP NOT NULL)"
+    ))
+
+
+def pending_migrations(connection: Connection, directory: Path = MIGRATIONS_DIR) -> List[Path]:
+    """Migration files not applied yet and meant for this connection's dialect, in order."""
+    _ensure_table(connection)
+    applied = set(connection.execute(text("SELECT version FROM schema_migrations")).scalars())
+    dialect = connection.dialect.name
+    files = []
+    for path in directory.glob("V*.sql"):
+        match = _FILE_PATTERN.match(path.name)
+        if not match or path.name in applied:
+            continue
+        if match.group("dialect") not in (None, dialect):
+            continue
+        files.append((int(match.group("version")), path))
+    return [path for _, path in sorted(files)]
+
+
+def apply_migrations(engine: Optional[Engine] = None, directory: Path = MIGRATIONS_DIR) -> List[str]:
+    """Apply the pending migrations, each one in its own transaction. Returns the applied file names."""
+    engine = engine or get_engine()
+    with engine.begin() as connection:
+        pending = pending_migrations(connection, directory)
+
+    applied = []
+    with engine.connect() as connection:
+        for path in pending:
+            with connection.begin():
+                for statement in _split_statements(path.read_text(encoding="utf-8")):
+                    connection.execute(text(statement))
+                connection.execute(
+                    text("INSERT INTO schema_migrations (version, applied_at) VALUES (:version, :applied_at)"),
+                    {"version": path.name, "applied_at": datetime.utcnow()},
+                )
+            applied.append(path.name)
+    return applied
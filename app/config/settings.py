@@ -0,0 +1,78 @@
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from dotenv import load_dotenv
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}.")
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class DatabaseSettings:
+    """Connection and pool settings shared by every repository."""
+
+    url: str
+    echo: bool = False
+    pool_size: int = 5
+    max_overflow: int = 5
+    pool_timeout: int = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_timeout_ms: int = 15000
+
+
+def get_database_settings(url: Optional[str] = None) -> DatabaseSettings:
+    """Read the database settings from the environment (and the .env file)."""
+    load_dotenv()
+
+    db_uri = url or os.getenv("DATABASE_URL")
+    if not db_uri:
+        raise ValueError("DATABASE_URL not found.")
+
+    return DatabaseSettings(
+        url=db_uri,
+        echo=_env_bool("DB_ECHO", False),
+        pool_size=_env_int("DB_POOL_SIZE", 5),
+        max_overflow=_env_int("DB_MAX_OVERFLOW", 5),
+        pool_timeout=_env_int("DB_POOL_TIMEOUT", 30),
+        pool_recycle=_env_int("DB_POOL_RECYCLE", 1800),
+        pool_pre_ping=_env_bool("DB_POOL_PRE_PING", True),
+        statement_timeout_ms=_env_int("DB_STATEMENT_TIMEOUT_MS", 15000),
+    )
+
+
+@dataclass(frozen=True)
+class CompressionSettings:
+    """Response compression (see app/routes/compression.py)."""
+
+    enabled: bool = True
+    minimum_size: int = 1024
+    gzip_level: int = 6
+    brotli_quality: int = 4
+
+
+def get_compression_settings() -> CompressionSettings:
+    """Read the compression settings from the environment (and the .env file)."""
+    load_dotenv()
+
+    return CompressionSettings(
+        enabled=_env_bool("COMPRESSION", True),
+        minimum_size=_env_int("COMPRESSION_MINIMUM_SIZE", 1024),
+        gzip_level=_env_int("COMPRESSION_GZIP_LEVEL", 6),
+        brotli_quality=_env_int("COMPRESSION_BROTLI_QUALITY", 4),
+    )
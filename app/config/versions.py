@@ -0,0 +1,66 @@
+from typing import Iterable, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.dml import UpdateBase
+
+from app.config.cache import get_cache
+
+_PENDING = "pending_writes"
+_COMMITTED = "committed_writes"
+
+
+def _namespace(table: str) -> str:
+    return f"table:{table}"
+
+
+def _after_execute(conn, clauseelement, multiparams, params, execution_options, result):
+    if isinstance(clauseelement, UpdateBase) and clauseelement.table is not None:
+        conn.info.setdefault(_PENDING, set()).add(clauseelement.table.name)
+
+
+def _commit(conn):
+    pending = conn.info.pop(_PENDING, None)
+    if pending:
+        conn.info.setdefault(_COMMITTED, set()).update(pending)
+
+
+def _rollback(conn):
+    conn.info.pop(_PENDING, None)
+
+
+def _checkin(dbapi_connection, connection_record):
+    # The versions are bumped only once the connection is back in the pool,
+    # i.e. after the commit is visible: a reader never pairs a new version
+    # with old rows.
+    committed = connection_record.info.pop(_COMMITTED, None)
+    if committed:
+        bump_tables(*committed)
+
+
+def track_writes(engine: Engine) -> None:
+    """Bump the version of every table an INSERT/UPDATE/DELETE committed on this engine touched.
+
+    Only statements built with SQLAlchemy (ORM flushes, ``insert()``...) are
+    seen; raw SQL and writes made outside the API are not.
+    """
+    engine.tracks_writes = True
+    event.listen(engine, "after_execute", _after_execute)
+    event.listen(engine, "commit", _commit)
+    event.listen(engine, "rollback", _rollback)
+    event.listen(engine, "checkin", _checkin)
+
+
+def bump_tables(*tables: str) -> None:
+    versions = get_cache().versions
+    for table in tables:
+        versions.bump(_namespace(table))
+
+
+def table_versions(tables: Iterable[str]) -> Tuple[str, Tuple[int, ...], float]:
+    """Return the versions store token, the version of each table and their latest modification time."""
+    versions = get_cache().versions
+    tables = list(tables)
+    numbers = tuple(versions.get(_namespace(table)) for table in tables)
+    modified = max((versions.modified(_namespace(table)) for table in tables), default=0.0)
+    return versions.token, numbers, modified
@@ -3,12 +3,31 @@ from app.routes.routes_championship import router as championship
 from app.routes.routes_stadium import router as stadium
 from app.routes.routes_player import router as player
 from app.routes.routes_team import router as team
+from app.routes.routes_match import router as match
+from app.routes.routes_health import router as health
+from app.routes.routes_import import router as importer
+from app.routes.routes_export import router as export
+from app.routes.routes_metrics import router as metrics
+from app.routes.routes_search import router as search
+from app.routes.routes_live import router as live
+from app.routes.instrumentation import MetricsMiddleware
+from app.routes.compression import CompressionMiddleware
+from app.config.database import dispose_engine
+from contextlib import asynccontextmanager
 import uvicorn
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # close the pooled connections when the worker shuts down
+    dispose_engine()
+
+
+app = FastAPI(lifespan=lifespan)
 # allow cors
 app.add_middleware(
     CORSMiddleware,
@@ -17,12 +36,23 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# gzip/brotli for large bodies (COMPRESSION, COMPRESSION_MINIMUM_SIZE, ...)
+app.add_middleware(CompressionMiddleware)
+# query counts, database and serialization time per request (Server-Timing and /metrics)
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(country)
 app.include_router(championship)
 app.include_router(stadium)
 app.include_router(player)
 app.include_router(team)
+app.include_router(match)
+app.include_router(health)
+app.include_router(importer)
+app.include_router(export)
+app.include_router(metrics)
+app.include_router(search)
+app.include_router(live)
 
 
 @app.get("/")
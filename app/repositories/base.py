@@ -0,0 +1,67 @@
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import Select, Table, insert, select, update
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from app.config.database import get_engine
+
+
+class BaseRepository:
+    """Common plumbing for the repositories: all of them share the process-wide engine.
+
+    An engine can be passed explicitly (or assigned to ``repository.engine``)
+    to run a repository against another database, e.g. in tests.
+    """
+
+    def __init__(self, engine: Optional[Engine] = None):
+        self._engine = engine
+
+    @property
+    def engine(self) -> Engine:
+        return self._engine if self._engine is not None else get_engine()
+
+    @engine.setter
+    def engine(self, engine: Optional[Engine]) -> None:
+        self._engine = engine
+
+    def _get_session(self, **kwargs) -> Session:
+        return Session(self.engine, **kwargs)
+
+
+def rows_of(model, fields: Optional[Sequence[str]] = None) -> Select:
+    """Select of the model's table columns (only ``fields``, when given). Its
+    rows are read-only named tuples (``row.id``, ``row._asdict()``): no ORM
+    objects are built, for list endpoints that only serialize what they read."""
+    columns = model.__table__.columns
+    if fields is None:
+        return select(*columns)
+    return select(*(columns[name] for name in fields))
+
+
+def increment(session: Session, table: Table, keys: Dict[str, Any], totals: Dict[str, int]) -> None:
+    """
+    Add ``totals`` to the counters of the row of ``table`` whose primary key
+    is ``keys``, creating the row if there is none, in the caller's
+    transaction. A single atomic statement (an upsert) where supported, so
+    concurrent writers never lose an update.
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        statement = dialect_insert(table).values(**keys, **totals)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c[name] for name in keys],
+            set_={name: table.c[name] + statement.excluded[name] for name in totals},
+        )
+        session.execute(statement)
+        return
+
+    increase = update(table).where(*(table.c[name] == value for name, value in keys.items())).values(
+        {name: table.c[name] + value for name, value in totals.items()}
+    )
+    if session.execute(increase).rowcount == 0:
+        session.execute(insert(table).values(**keys, **totals))
@@ -0,0 +1,88 @@
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from sqlalchemy import insert
+from sqlalchemy.exc import DBAPIError
+from sqlmodel import Session
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+def _insert_chunk(session: Session, model: Type, rows: List[Dict[str, Any]]) -> List[Any]:
+    # executemany with RETURNING: SQLAlchemy batches it into multi-row
+    # INSERT ... VALUES (...), (...) RETURNING statements.
+    statement = insert(model).returning(model, sort_by_parameter_order=True)
+    return list(session.scalars(statement, rows).all())
+
+
+def _load_chunk(session: Session, model: Type, rows: List[Dict[str, Any]]) -> int:
+    # Plain executemany on the table, no ORM objects and nothing returned.
+    session.execute(insert(model.__table__), rows)
+    return len(rows)
+
+
+def _run_chunks(
+    session: Session,
+    rows: List[Dict[str, Any]],
+    insert_chunk: Callable[[List[Dict[str, Any]]], Any],
+    best_effort: bool,
+    chunk_size: int,
+) -> Tuple[List[Any], List[Tuple[int, str]]]:
+    results: List[Any] = []
+    failures: List[Tuple[int, str]] = []
+
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        if not best_effort:
+            results.append(insert_chunk(chunk))
+            continue
+
+        try:
+            with session.begin_nested():
+                results.append(insert_chunk(chunk))
+        except DBAPIError:
+            for offset, row in enumerate(chunk):
+                try:
+                    with session.begin_nested():
+                        results.append(insert_chunk([row]))
+                except DBAPIError as e:
+                    failures.append((start + offset, str(e.orig).strip()))
+
+    return results, failures
+
+
+def bulk_insert(
+    session: Session,
+    model: Type,
+    rows: List[Dict[str, Any]],
+    best_effort: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Tuple[List[Any], List[Tuple[int, str]]]:
+    """Insert the rows in chunks inside the session's transaction.
+
+    Returns the created objects and a list of ``(index, message)`` for the rows
+    the database rejected. Without ``best_effort`` the first database error is
+    raised and the caller's transaction must be rolled back. With it, every
+    chunk runs in a savepoint; a failing chunk is retried row by row so only
+    the offending rows are skipped.
+    """
+    results, failures = _run_chunks(
+        session, rows, lambda chunk: _insert_chunk(session, model, chunk), best_effort, chunk_size
+    )
+    return [obj for chunk in results for obj in chunk], failures
+
+
+def bulk_load(
+    session: Session,
+    model: Type,
+    rows: List[Dict[str, Any]],
+    best_effort: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Tuple[int, List[Tuple[int, str]]]:
+    """Like ``bulk_insert`` but without RETURNING: returns how many rows were inserted.
+
+    Meant for imports, where building an ORM object per row is wasted work.
+    """
+    results, failures = _run_chunks(
+        session, rows, lambda chunk: _load_chunk(session, model, chunk), best_effort, chunk_size
+    )
+    return sum(results), failures
@@ -1,29 +1,20 @@
 from typing import List, Optional
-from sqlmodel import Session, create_engine, select
-import os
-from dotenv import load_dotenv
+from sqlalchemy.engine import Row
+from sqlmodel import select
 
+from app.repositories.base import BaseRepository, rows_of
+from app.repositories.countrySummaryRepository import count_change
+from app.repositories.pagination import keyset
 from app.schemas.championship import Championship
 
 
-class ChampionshipRepository:
-    def __init__(self):
-        load_dotenv()
-
-        db_uri = os.getenv("DATABASE_URL")
-        if not db_uri:
-            raise ValueError("DATABASE_URL not found.")
-
-        self.engine = create_engine(db_uri, echo=True)
-
-    def _get_session(self) -> Session:
-        return Session(self.engine)
-
+class ChampionshipRepository(BaseRepository):
     def create(self, name: str, country_id: Optional[int] = None, type: Optional[str] = None, season: Optional[str] = None) -> Championship:
         """Create a new championship in the database."""
         with self._get_session() as session:
             championship = Championship(name=name, country_id=country_id, type=type, season=season)
             session.add(championship)
+            count_change(session, "championships", None, country_id)
             session.commit()
             session.refresh(championship)
             return championship
@@ -41,11 +32,11 @@ class ChampionshipRepository:
             championship = session.exec(statement).first()
             return championship
 
-    def get_all(self) -> List[Championship]:
-        """Returns all championships in the database."""
+    def get_all(self, after: Optional[int] = None, limit: Optional[int] = None) -> List[Row]:
+        """Returns all championships in the database, ordered by ID (optionally the page after the given ID)."""
         with self._get_session() as session:
-            statement = select(Championship)
-            championships = session.exec(statement).all()
+            statement = keyset(rows_of(Championship), Championship.id, after, limit)
+            championships = session.execute(statement).all()
             return championships
 
     def update(self, championship_id: int, name: Optional[str] = None, country_id: Optional[int] = None, type: Optional[str] = None, season: Optional[str] = None) -> Optional[Championship]:
@@ -53,6 +44,7 @@ class ChampionshipRepository:
         with self._get_session() as session:
             championship = session.get(Championship, championship_id)
             if championship:
+                old_country_id = championship.country_id
                 if name:
                     championship.name = name
                 if country_id:
@@ -62,6 +54,7 @@ class ChampionshipRepository:
                 if season:
                     championship.season = season
                 session.add(championship)
+                count_change(session, "championships", old_country_id, championship.country_id)
                 session.commit()
                 session.refresh(championship)
                 return championship
@@ -72,6 +65,7 @@ class ChampionshipRepository:
         with self._get_session() as session:
             championship = session.get(Championship, championship_id)
             if championship:
+                count_change(session, "championships", championship.country_id, None)
                 session.delete(championship)
                 session.commit()
                 return True
@@ -1,27 +1,18 @@
-from typing import List, Optional
-from sqlmodel import Session, create_engine, select
-import os
-from dotenv import load_dotenv
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import delete
+from sqlalchemy.engine import Row
+from sqlmodel import select
 
-from app.schemas.country import Country
+from app.repositories.base import BaseRepository, rows_of
+from app.repositories.bulk import DEFAULT_CHUNK_SIZE, bulk_insert
+from app.repositories.pagination import keyset
+from app.schemas.country import Country, CountrySummary
 from app.schemas.stadium import Stadium
 from app.schemas.player import Player
 from app.schemas.team import Team
 
 
-class CountryRepository:
-    def __init__(self):
-        load_dotenv()
-
-        db_uri = os.getenv("DATABASE_URL")
-        if not db_uri:
-            raise ValueError("DATABASE_URL not found.")
-
-        self.engine = create_engine(db_uri, echo=True)
-
-    def _get_session(self) -> Session:
-        return Session(self.engine)
-
+class CountryRepository(BaseRepository):
     def create(self, name: str) -> Country:
         """Create a new country in database."""
         with self._get_session() as session:
@@ -31,6 +22,18 @@ class CountryRepository:
             session.refresh(country)
             return country
 
+    def bulk_create(
+        self,
+        rows: List[Dict[str, Any]],
+        best_effort: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Tuple[List[Country], List[Tuple[int, str]]]:
+        """Create many countries in a single transaction with multi-row INSERTs."""
+        with self._get_session(expire_on_commit=False) as session:
+            created, failures = bulk_insert(session, Country, rows, best_effort, chunk_size)
+            session.commit()
+            return created, failures
+
     def get_by_id(self, country_id: int) -> Optional[Country]:
         """Search for a country by its ID."""
         with self._get_session() as session:
@@ -44,11 +47,11 @@ class CountryRepository:
             country = session.exec(statement).first()
             return country
 
-    def get_all(self) -> List[Country]:
-        """Returns all countries in database."""
+    def get_all(self, after: Optional[int] = None, limit: Optional[int] = None) -> List[Row]:
+        """Returns all countries in database, ordered by ID (optionally the page after the given ID)."""
         with self._get_session() as session:
-            statement = select(Country)
-            countries = session.exec(statement).all()
+            statement = keyset(rows_of(Country), Country.id, after, limit)
+            countries = session.execute(statement).all()
             return countries
 
     def update(self, country_id: int, name: str) -> Optional[Country]:
@@ -68,27 +71,46 @@ class CountryRepository:
         with self._get_session() as session:
             country = session.get(Country, country_id)
             if country:
+                session.execute(delete(CountrySummary).where(CountrySummary.country_id == country_id))
                 session.delete(country)
                 session.commit()
                 return True
             return False
-    def get_teams(self, country_id: int) -> List[Team]:
-        """Retorna todos os times de um país."""
+    def get_teams(
+        self,
+        country_id: int,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Row]:
+        """Retorna os times de um país, ordenados por ID."""
         with self._get_session() as session:
-            statement = select(Team).where(Team.country_id == country_id)
-            teams = session.exec(statement).all()
+            statement = keyset(rows_of(Team, fields).where(Team.country_id == country_id), Team.id, after, limit)
+            teams = session.execute(statement).all()
             return teams
 
-    def get_players(self, country_id: int) -> List[Player]:
-        """Retorna todos os jogadores de um país."""
+    def get_players(
+        self,
+        country_id: int,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Row]:
+        """Retorna os jogadores de um país, ordenados por ID."""
         with self._get_session() as session:
-            statement = select(Player).where(Player.country_id == country_id)
-            players = session.exec(statement).all()
+            statement = keyset(rows_of(Player, fields).where(Player.country_id == country_id), Player.id, after, limit)
+            players = session.execute(statement).all()
             return players
 
-    def get_stadiums(self, country_id: int) -> List[Stadium]:
-        """Retorna todos os estádios de um país."""
+    def get_stadiums(
+        self,
+        country_id: int,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Row]:
+        """Retorna os estádios de um país, ordenados por ID."""
         with self._get_session() as session:
-            statement = select(Stadium).where(Stadium.country_id == country_id)
-            stadiums = session.exec(statement).all()
+            statement = keyset(rows_of(Stadium, fields).where(Stadium.country_id == country_id), Stadium.id, after, limit)
+            stadiums = session.execute(statement).all()
             return stadiums
\ No newline at end of file
@@ -0,0 +1,84 @@
+from collections import Counter
+from typing import Iterable, List, Optional
+
+from sqlalchemy import delete, func, insert
+from sqlmodel import Session, select
+
+from app.repositories.base import BaseRepository, increment
+from app.schemas.championship import Championship
+from app.schemas.country import Country, CountrySummary, CountrySummaryRow
+from app.schemas.player import Player
+from app.schemas.stadium import Stadium
+from app.schemas.team import Team
+
+# Each counter of the summary and the model whose rows it counts.
+COUNTED = {"teams": Team, "players": Player, "stadiums": Stadium, "championships": Championship}
+COUNTERS = tuple(COUNTED)
+
+
+def count_rows(session: Session, counter: str, country_ids: Iterable[Optional[int]], sign: int = 1) -> None:
+    """Add (sign=1) or remove (sign=-1) one row of ``counter`` per entry of ``country_ids``, in the caller's transaction.
+
+    Rows without a country (None) do not count.
+    """
+    for country_id, amount in Counter(key for key in country_ids if key is not None).items():
+        totals = dict.fromkeys(COUNTERS, 0)
+        totals[counter] = sign * amount
+        increment(session, CountrySummary.__table__, {"country_id": country_id}, totals)
+
+
+def count_change(session: Session, counter: str, old_country_id: Optional[int], new_country_id: Optional[int]) -> None:
+    """Move a row of ``counter`` between countries: (None, id) when it is created, (id, None) when it is deleted."""
+    if old_country_id == new_country_id:
+        return
+    count_rows(session, counter, [old_country_id], -1)
+    count_rows(session, counter, [new_country_id])
+
+
+def rebuild_summaries(session: Session, country_ids: Optional[Iterable[int]] = None) -> int:
+    """Recompute the summaries of the given countries (all if None) from the tables. Returns the row count."""
+    ids = None if country_ids is None else list({key for key in country_ids if key is not None})
+    clear = delete(CountrySummary)
+    if ids is not None:
+        clear = clear.where(CountrySummary.country_id.in_(ids))
+    session.execute(clear)
+
+    # One correlated COUNT per table, each served by the table's country_id index.
+    counts = [
+        select(func.count()).select_from(model).where(model.country_id == Country.id).scalar_subquery()
+        for model in COUNTED.values()
+    ]
+    totals = select(Country.id, *counts)
+    if ids is not None:
+        totals = totals.where(Country.id.in_(ids))
+    result = session.execute(insert(CountrySummary).from_select(["country_id", *COUNTERS], totals))
+    return result.rowcount
+
+
+class CountrySummaryRepository(BaseRepository):
+    def _statement(self):
+        # Countries that never had a team, player, stadium or championship have no row: zeros.
+        return select(
+            Country.id.label("country_id"),
+            Country.name.label("country"),
+            *(func.coalesce(getattr(CountrySummary, name), 0).label(name) for name in COUNTERS),
+        ).outerjoin(CountrySummary, CountrySummary.country_id == Country.id)
+
+    def get(self, country_id: int) -> Optional[CountrySummaryRow]:
+        """Summary of a country, or None if the country does not exist."""
+        with self._get_session() as session:
+            row = session.exec(self._statement().where(Country.id == country_id)).first()
+            return CountrySummaryRow(**row._mapping) if row else None
+
+    def get_all(self) -> List[CountrySummaryRow]:
+        """Summaries of every country, ordered by ID."""
+        with self._get_session() as session:
+            rows = session.exec(self._statement().order_by(Country.id)).all()
+            return [CountrySummaryRow(**row._mapping) for row in rows]
+
+    def rebuild(self, country_ids: Optional[Iterable[int]] = None) -> int:
+        """Full recomputation of the summaries (backfills, writes made outside the API). Returns the rows written."""
+        with self._get_session() as session:
+            count = rebuild_summaries(session, country_ids)
+            session.commit()
+            return count
@@ -0,0 +1,24 @@
+from typing import Any, Iterator, Mapping, Type
+
+from sqlalchemy import select
+
+from app.repositories.base import BaseRepository
+
+DEFAULT_YIELD_PER = 1000
+
+
+class ExportRepository(BaseRepository):
+    def stream_rows(self, model: Type, yield_per: int = DEFAULT_YIELD_PER) -> Iterator[Mapping[str, Any]]:
+        """Yield every row of the model's table as a mapping, ordered by ID.
+
+        Uses a server-side cursor (``stream_results``) fetched ``yield_per``
+        rows at a time, so only one batch is in memory. The connection stays
+        checked out until the iteration ends or the generator is closed.
+        """
+        table = model.__table__
+        with self.engine.connect() as connection:
+            result = connection.execution_options(
+                stream_results=True, yield_per=yield_per
+            ).execute(select(table).order_by(table.c.id))
+            for row in result.mappings():
+                yield row
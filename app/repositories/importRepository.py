@@ -0,0 +1,43 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from sqlmodel import select
+
+from app.repositories.base import BaseRepository
+from app.repositories.bulk import DEFAULT_CHUNK_SIZE, bulk_load
+from app.repositories.countrySummaryRepository import COUNTED, rebuild_summaries
+from app.repositories.standingRepository import rebuild_standings
+from app.schemas.match import Match
+
+
+class ImportRepository(BaseRepository):
+    def resolve(self, model: Type, key: str, values: Iterable[str]) -> Dict[str, Optional[int]]:
+        """Map natural key values (e.g. country names) to IDs in one query.
+
+        Values that match more than one row map to None (ambiguous); values
+        that match nothing are left out.
+        """
+        values = list(values)
+        if not values:
+            return {}
+        column = getattr(model, key)
+        with self._get_session() as session:
+            rows = session.exec(select(model.id, column).where(column.in_(values))).all()
+        resolved: Dict[str, Optional[int]] = {}
+        for id_, value in rows:
+            resolved[value] = None if value in resolved else id_
+        return resolved
+
+    def load(
+        self, model: Type, rows: List[Dict[str, Any]], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Tuple[int, List[Tuple[int, str]]]:
+        """Insert the rows in one transaction, skipping (and reporting) the ones the database rejects."""
+        with self._get_session() as session:
+            inserted, failures = bulk_load(session, model, rows, True, chunk_size)
+            if model is Match and inserted:
+                # Bulk loads bypass MatchRepository: refresh the affected league tables.
+                rebuild_standings(session, {row["championship_id"] for row in rows})
+            if model in COUNTED.values() and inserted:
+                # Same for the country summaries of the imported teams, players, stadiums or championships.
+                rebuild_summaries(session, {row.get("country_id") for row in rows})
+            session.commit()
+            return inserted, failures
@@ -0,0 +1,48 @@
+from typing import List, Tuple, TypeVar, Union
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Row
+
+from app.repositories.base import BaseRepository, rows_of
+from app.schemas.match import Match, MatchEvent, Substitution
+
+T = TypeVar("T", bound=Union[MatchEvent, Substitution])
+
+
+class LiveRepository(BaseRepository):
+    def add(self, row: T) -> T:
+        """Insert a match event or substitution and return it with its ID."""
+        with self._get_session() as session:
+            session.add(row)
+            session.commit()
+            session.refresh(row)
+            return row
+
+    def match_exists(self, match_id: int) -> bool:
+        with self._get_session() as session:
+            return session.execute(select(Match.id).where(Match.id == match_id)).first() is not None
+
+    def feed_position(self, match_id: int) -> Tuple[int, int]:
+        """Highest event ID and highest substitution ID of a match (0 when there is none)."""
+        with self._get_session() as session:
+            return session.execute(select(
+                select(func.coalesce(func.max(MatchEvent.id), 0))
+                .where(MatchEvent.match_id == match_id).scalar_subquery(),
+                select(func.coalesce(func.max(Substitution.id), 0))
+                .where(Substitution.match_id == match_id).scalar_subquery(),
+            )).one()
+
+    def get_feed(self, match_id: int, after_event: int, after_substitution: int) -> Tuple[List[Row], List[Row]]:
+        """Events and substitutions of a match with IDs above the given ones, in ID order."""
+        with self._get_session() as session:
+            events = session.execute(
+                rows_of(MatchEvent)
+                .where(MatchEvent.match_id == match_id, MatchEvent.id > after_event)
+                .order_by(MatchEvent.id)
+            ).all()
+            substitutions = session.execute(
+                rows_of(Substitution)
+                .where(Substitution.match_id == match_id, Substitution.id > after_substitution)
+                .order_by(Substitution.id)
+            ).all()
+            return events, substitutions
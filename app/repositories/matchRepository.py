@@ -1,25 +1,20 @@
-from typing import List, Optional
-from sqlmodel import Session, create_engine, select
-import os
-from dotenv import load_dotenv
+from typing import List, Optional, Tuple
+from sqlalchemy import or_
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import aliased
+from sqlmodel import select
 from datetime import datetime
 
-from app.schemas.match import Match
+from app.repositories.base import BaseRepository, rows_of
+from app.repositories.pagination import keyset_by
+from app.repositories.standingRepository import apply_result, replace_result, result_of
+from app.schemas.championship import Championship
+from app.schemas.match import Match, MatchFixture
+from app.schemas.stadium import Stadium
+from app.schemas.team import Team
 
 
-class MatchRepository:
-    def __init__(self):
-        load_dotenv()
-
-        db_uri = os.getenv("DATABASE_URL")
-        if not db_uri:
-            raise ValueError("DATABASE_URL not found.")
-
-        self.engine = create_engine(db_uri, echo=True)
-
-    def _get_session(self) -> Session:
-        return Session(self.engine)
-
+class MatchRepository(BaseRepository):
     def create(self, home_team_id: int, away_team_id: int, championship_id: int, date: datetime, stadium_id: int, home_score: Optional[int] = None, away_score: Optional[int] = None) -> Match:
         """Create a new match in the database."""
         with self._get_session() as session:
@@ -33,6 +28,8 @@ class MatchRepository:
                 away_score=away_score
             )
             session.add(match)
+            session.flush()
+            apply_result(session, result_of(match))
             session.commit()
             session.refresh(match)
             return match
@@ -43,25 +40,97 @@ class MatchRepository:
             match = session.get(Match, match_id)
             return match
 
-    def get_by_teams(self, home_team_id: int, away_team_id: int) -> Optional[Match]:
-        """Search for a match by home and away team IDs."""
+    def get_by_teams(self, home_team_id: int, away_team_id: int) -> List[Match]:
+        """Returns every match between the home and away teams, ordered by date."""
         with self._get_session() as session:
-            statement = select(Match).where(Match.home_team_id == home_team_id, Match.away_team_id == away_team_id)
-            match = session.exec(statement).first()
-            return match
+            statement = (
+                select(Match)
+                .where(Match.home_team_id == home_team_id, Match.away_team_id == away_team_id)
+                .order_by(Match.date, Match.id)
+            )
+            matches = session.exec(statement).all()
+            return matches
 
-    def get_all(self) -> List[Match]:
-        """Returns all matches in the database."""
+    def get_all(self, after: Optional[Tuple[datetime, int]] = None, limit: Optional[int] = None) -> List[Row]:
+        """Returns all matches, ordered by date and ID (optionally the page after the given (date, ID))."""
+        return self.search(after=after, limit=limit)
+
+    def search(
+        self,
+        championship_id: Optional[int] = None,
+        team_id: Optional[int] = None,
+        stadium_id: Optional[int] = None,
+        season: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Row]:
+        """
+        Returns the matches that satisfy every given filter, ordered by date and ID.
+        ``team_id`` matches both the home and the away team; ``date_to`` is exclusive.
+        """
+        statement = rows_of(Match)
+        if championship_id is not None:
+            statement = statement.where(Match.championship_id == championship_id)
+        if team_id is not None:
+            statement = statement.where(or_(Match.home_team_id == team_id, Match.away_team_id == team_id))
+        if stadium_id is not None:
+            statement = statement.where(Match.stadium_id == stadium_id)
+        if season is not None:
+            seasons = select(Championship.id).where(Championship.season == season)
+            statement = statement.where(Match.championship_id.in_(seasons))
+        if date_from is not None:
+            statement = statement.where(Match.date >= date_from)
+        if date_to is not None:
+            statement = statement.where(Match.date < date_to)
+
+        statement = keyset_by(statement, (Match.date, Match.id), after, limit)
         with self._get_session() as session:
-            statement = select(Match)
-            matches = session.exec(statement).all()
+            matches = session.execute(statement).all()
             return matches
 
+    def get_fixtures(
+        self, date_from: datetime, date_to: datetime, championship_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> List[MatchFixture]:
+        """Matches in [date_from, date_to) with the team, championship and stadium names, in a single query."""
+        home, away = aliased(Team), aliased(Team)
+        statement = (
+            select(
+                Match.id,
+                Match.date,
+                Match.championship_id,
+                Championship.name.label("championship"),
+                Match.home_team_id,
+                home.name.label("home_team"),
+                Match.away_team_id,
+                away.name.label("away_team"),
+                Match.stadium_id,
+                Stadium.name.label("stadium"),
+                Match.home_score,
+                Match.away_score,
+            )
+            .join(Championship, Championship.id == Match.championship_id)
+            .join(home, home.id == Match.home_team_id)
+            .join(away, away.id == Match.away_team_id)
+            .join(Stadium, Stadium.id == Match.stadium_id)
+            .where(Match.date >= date_from, Match.date < date_to)
+        )
+        if championship_id is not None:
+            statement = statement.where(Match.championship_id == championship_id)
+        statement = statement.order_by(Match.date, Match.id)
+        if limit is not None:
+            statement = statement.limit(limit)
+        with self._get_session() as session:
+            return [MatchFixture(**row._mapping) for row in session.exec(statement)]
+
     def update(self, match_id: int, home_team_id: Optional[int] = None, away_team_id: Optional[int] = None, championship_id: Optional[int] = None, date: Optional[datetime] = None, stadium_id: Optional[int] = None, home_score: Optional[int] = None, away_score: Optional[int] = None) -> Optional[Match]:
         """Update an existing match's information."""
         with self._get_session() as session:
-            match = session.get(Match, match_id)
+            # The row lock keeps concurrent updates from both removing the same old result.
+            match = session.get(Match, match_id, with_for_update=True)
             if match:
+                old_result = result_of(match)
                 if home_team_id:
                     match.home_team_id = home_team_id
                 if away_team_id:
@@ -77,6 +146,7 @@ class MatchRepository:
                 if away_score is not None:
                     match.away_score = away_score
                 session.add(match)
+                replace_result(session, old_result, result_of(match))
                 session.commit()
                 session.refresh(match)
                 return match
@@ -85,8 +155,9 @@ class MatchRepository:
     def delete(self, match_id: int) -> bool:
         """Delete a match by its ID. Returns True if successful, False if not found."""
         with self._get_session() as session:
-            match = session.get(Match, match_id)
+            match = session.get(Match, match_id, with_for_update=True)
             if match:
+                apply_result(session, result_of(match), -1)
                 session.delete(match)
                 session.commit()
                 return True
@@ -0,0 +1,31 @@
+from typing import Optional, Sequence, Tuple
+
+from sqlalchemy import tuple_
+
+
+def keyset(statement, key, after: Optional[int] = None, limit: Optional[int] = None):
+    """Apply keyset pagination to a select: rows whose key is greater than
+    ``after``, ordered by that key. ``key`` must be an indexed, unique column
+    (usually the primary key) so every page is an index range scan.
+    """
+    if after is not None:
+        statement = statement.where(key > after)
+    statement = statement.order_by(key)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
+
+
+def keyset_by(statement, keys: Sequence, after: Optional[Tuple] = None, limit: Optional[int] = None):
+    """Keyset pagination over several columns, e.g. ``(Match.date, Match.id)``.
+
+    ``after`` holds the values of the last row of the previous page; the
+    comparison is a row value, so an index on the leading columns serves
+    both the filter and the order. The last key must be unique.
+    """
+    if after is not None:
+        statement = statement.where(tuple_(*keys) > tuple_(*after))
+    statement = statement.order_by(*keys)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
@@ -1,27 +1,24 @@
-from typing import List, Optional
-from sqlmodel import Session, create_engine, select
-import os
-from dotenv import load_dotenv
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import case, func, literal, union_all
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import aliased, joinedload
+from sqlmodel import select
 from datetime import datetime
 
+from app.repositories.base import BaseRepository, rows_of
+from app.repositories.bulk import DEFAULT_CHUNK_SIZE, bulk_insert
+from app.repositories.countrySummaryRepository import count_change, count_rows
+from app.repositories.pagination import keyset
+from app.schemas.championship import Championship
 from app.schemas.country import Country
+from app.schemas.match import Lineup, Match, MatchEvent, Substitution
 from app.schemas.player import Player
 from app.schemas.player import Position
+from app.schemas.player import CareerRow, PlayerOutput
+from app.schemas.team import Team
 
 
-class PlayerRepository:
-    def __init__(self):
-        load_dotenv()
-
-        db_uri = os.getenv("DATABASE_URL")
-        if not db_uri:
-            raise ValueError("DATABASE_URL not found.")
-
-        self.engine = create_engine(db_uri, echo=True)
-
-    def _get_session(self) -> Session:
-        return Session(self.engine)
-
+class PlayerRepository(BaseRepository):
     def create(
         self,
         name: str,
@@ -40,10 +37,24 @@ class PlayerRepository:
                 team_id=team_id,
             )
             session.add(player)
+            count_change(session, "players", None, country_id)
             session.commit()
             session.refresh(player)
             return player
 
+    def bulk_create(
+        self,
+        rows: List[Dict[str, Any]],
+        best_effort: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Tuple[List[Player], List[Tuple[int, str]]]:
+        """Insere vários jogadores em uma única transação, com INSERT de múltiplas linhas."""
+        with self._get_session(expire_on_commit=False) as session:
+            created, failures = bulk_insert(session, Player, rows, best_effort, chunk_size)
+            count_rows(session, "players", (player.country_id for player in created))
+            session.commit()
+            return created, failures
+
     def get_by_id(self, player_id: int) -> Optional[Player]:
         """Search for a player by their ID."""
         with self._get_session() as session:
@@ -57,11 +68,16 @@ class PlayerRepository:
             player = session.exec(statement).first()
             return player
 
-    def get_all(self) -> List[Player]:
-        """Returns all players in the database."""
+    def get_all(
+        self,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Row]:
+        """Returns all players in the database, ordered by ID (optionally the page after the given ID)."""
         with self._get_session() as session:
-            statement = select(Player)
-            players = session.exec(statement).all()
+            statement = keyset(rows_of(Player, fields), Player.id, after, limit)
+            players = session.execute(statement).all()
             return players
 
     def update(
@@ -77,6 +93,7 @@ class PlayerRepository:
         with self._get_session() as session:
             player = session.get(Player, player_id)
             if player:
+                old_country_id = player.country_id
                 if name:
                     player.name = name
                 if birth_date:
@@ -88,6 +105,7 @@ class PlayerRepository:
                 if team_id:
                     player.team_id = team_id
                 session.add(player)
+                count_change(session, "players", old_country_id, player.country_id)
                 session.commit()
                 session.refresh(player)
                 return player
@@ -98,6 +116,7 @@ class PlayerRepository:
         with self._get_session() as session:
             player = session.get(Player, player_id)
             if player:
+                count_change(session, "players", player.country_id, None)
                 session.delete(player)
                 session.commit()
                 return True
@@ -114,6 +133,12 @@ class PlayerRepository:
                 session.refresh(position)
             return positions
 
+    def get_positions(self) -> List[Position]:
+        """Lista todas as posições, ordenadas por ID."""
+        with self._get_session() as session:
+            positions = session.exec(select(Position).order_by(Position.id)).all()
+            return positions
+
     def get_position_by_player_id(self, player_id: int) -> Optional[Position]:
         """Obtém a posição de um jogador pelo ID do jogador."""
         with self._get_session() as session:
@@ -124,7 +149,7 @@ class PlayerRepository:
     def get_team_by_player_id(self, player_id: int) -> Optional[Player]:
         """Obtém o time de um jogador pelo ID do jogador."""
         with self._get_session() as session:
-            statement = select(Player).where(Player.id == player_id)
+            statement = select(Player).where(Player.id == player_id).options(joinedload(Player.team))
             player = session.exec(statement).first()
             return player.team if player else None
 
@@ -134,3 +159,145 @@ class PlayerRepository:
             statement = select(Country).join(Player).where(Player.id == player_id)
             country = session.exec(statement).first()
             return country
+
+    def _output_statement(self):
+        """Jogador com os nomes de país, posição e time, em uma única consulta."""
+        return (
+            select(
+                Player.id,
+                Player.name,
+                Player.birth_date,
+                Country.name.label("country"),
+                Position.name.label("position"),
+                Team.name.label("team"),
+            )
+            .outerjoin(Country, Country.id == Player.country_id)
+            .outerjoin(Position, Position.id == Player.position_id)
+            .outerjoin(Team, Team.id == Player.team_id)
+        )
+
+    def get_output_by_id(self, player_id: int) -> Optional[PlayerOutput]:
+        """Obtém o jogador com posição, time e país em uma única consulta."""
+        with self._get_session() as session:
+            statement = self._output_statement().where(Player.id == player_id)
+            row = session.exec(statement).first()
+            return PlayerOutput(**row._mapping) if row else None
+
+    def get_outputs_by_ids(self, player_ids: List[int]) -> List[PlayerOutput]:
+        """Obtém vários jogadores com posição, time e país em uma única consulta."""
+        if not player_ids:
+            return []
+        with self._get_session() as session:
+            statement = self._output_statement().where(Player.id.in_(player_ids))
+            rows = session.exec(statement).all()
+            return [PlayerOutput(**row._mapping) for row in rows]
+
+    def get_career_rows(
+        self,
+        categories: Dict[str, List[int]],
+        player_ids: Optional[List[int]] = None,
+        team_id: Optional[int] = None,
+    ) -> List[Tuple[int, CareerRow]]:
+        """
+        Totais de carreira por jogador, temporada e time, agregados no banco
+        (GROUP BY sobre escalações, substituições e eventos; nada é carregado
+        linha a linha). ``categories`` traz os IDs dos tipos de evento de cada
+        contador (goals, assists, yellow_cards, red_cards).
+        O time de cada partida vem da escalação do jogador; quando ele entrou
+        no decorrer do jogo, da escalação do jogador que ele substituiu. Sem
+        nenhuma das duas, vale o time atual do jogador se ele for um dos lados
+        da partida (senão o time fica em branco).
+        """
+        if team_id is not None:
+            scope = select(Player.id).where(Player.team_id == team_id).scalar_subquery()
+        else:
+            scope = player_ids or []
+
+        def facts(player, match, starts=0, subbed_on=0, subbed_off=0, event_type=None):
+            def counts(category):
+                ids = categories.get(category) or []
+                if event_type is None or not ids:
+                    return literal(0)
+                return case((event_type.in_(ids), 1), else_=0)
+
+            return select(
+                player.label("player_id"),
+                match.label("match_id"),
+                literal(starts).label("starts"),
+                literal(subbed_on).label("subbed_on"),
+                literal(subbed_off).label("subbed_off"),
+                counts("goals").label("goals"),
+                counts("assists").label("assists"),
+                counts("yellow_cards").label("yellow_cards"),
+                counts("red_cards").label("red_cards"),
+            ).where(player.in_(scope))
+
+        rows = union_all(
+            facts(Lineup.player_id, Lineup.match_id, starts=1),
+            facts(Substitution.player_in_id, Substitution.match_id, subbed_on=1),
+            facts(Substitution.player_out_id, Substitution.match_id, subbed_off=1),
+            facts(MatchEvent.player_id, MatchEvent.match_id, event_type=MatchEvent.event_type_id),
+        ).subquery()
+
+        own_lineup, replaced_lineup, came_on = aliased(Lineup), aliased(Lineup), aliased(Substitution)
+        replaced_team = (
+            select(func.min(replaced_lineup.team_id))
+            .join(
+                came_on,
+                (came_on.match_id == replaced_lineup.match_id) & (came_on.player_out_id == replaced_lineup.player_id),
+            )
+            .where(came_on.match_id == rows.c.match_id, came_on.player_in_id == rows.c.player_id)
+            .scalar_subquery()
+        )
+        playing_side = case(
+            (Player.team_id.in_([Match.home_team_id, Match.away_team_id]), Player.team_id),
+        )
+        # Each fact with the team the player defended in that match.
+        placed = (
+            select(
+                rows,
+                Championship.season,
+                func.coalesce(own_lineup.team_id, replaced_team, playing_side).label("team_id"),
+            )
+            .join(Match, Match.id == rows.c.match_id)
+            .join(Championship, Championship.id == Match.championship_id)
+            .join(Player, Player.id == rows.c.player_id)
+            .outerjoin(
+                own_lineup,
+                (own_lineup.match_id == rows.c.match_id) & (own_lineup.player_id == rows.c.player_id),
+            )
+        ).subquery()
+
+        played = case(((placed.c.starts == 1) | (placed.c.subbed_on == 1), placed.c.match_id))
+        statement = (
+            select(
+                placed.c.player_id,
+                placed.c.season,
+                placed.c.team_id,
+                Team.name.label("team"),
+                func.count(func.distinct(played)).label("appearances"),
+                func.sum(placed.c.starts).label("starts"),
+                func.sum(placed.c.subbed_on).label("subbed_on"),
+                func.sum(placed.c.subbed_off).label("subbed_off"),
+                func.sum(placed.c.goals).label("goals"),
+                func.sum(placed.c.assists).label("assists"),
+                func.sum(placed.c.yellow_cards).label("yellow_cards"),
+                func.sum(placed.c.red_cards).label("red_cards"),
+            )
+            .outerjoin(Team, Team.id == placed.c.team_id)
+            .group_by(placed.c.player_id, placed.c.season, placed.c.team_id, Team.name)
+            .order_by(placed.c.player_id, placed.c.season, Team.name)
+        )
+        with self._get_session() as session:
+            result = session.exec(statement).all()
+        return [(row.player_id, CareerRow(**row._mapping)) for row in result]
+
+    def get_names(self, player_ids: Optional[List[int]] = None, team_id: Optional[int] = None) -> List[Tuple[int, str]]:
+        """(ID, nome) dos jogadores informados ou do elenco de um time, ordenados por ID."""
+        statement = select(Player.id, Player.name).order_by(Player.id)
+        if team_id is not None:
+            statement = statement.where(Player.team_id == team_id)
+        else:
+            statement = statement.where(Player.id.in_(player_ids or []))
+        with self._get_session() as session:
+            return [tuple(row) for row in session.exec(statement)]
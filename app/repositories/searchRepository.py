@@ -0,0 +1,88 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, case, func, literal, or_, union_all
+from sqlmodel import select
+
+from app.repositories.base import BaseRepository
+from app.schemas.championship import Championship
+from app.schemas.country import Country
+from app.schemas.player import Player
+from app.schemas.stadium import Stadium
+from app.schemas.team import Team
+
+# Score of a match: exact name > name prefix > every query word starts a word of
+# the name > trigram similarity alone. NgramIndex ranks with the same values.
+EXACT, PREFIX, WORD_PREFIX, FUZZY = 1.0, 0.8, 0.7, 0.6
+SIMILARITY_WEIGHT = 0.1
+# pg_trgm's default similarity threshold (pg_trgm.similarity_threshold), used by "%".
+SIMILARITY_THRESHOLD = 0.3
+
+# Searchable entities (the "entity" of each result) and their tables.
+SEARCHABLE = {
+    "team": Team,
+    "player": Player,
+    "championship": Championship,
+    "stadium": Stadium,
+    "country": Country,
+}
+
+
+class SearchRepository(BaseRepository):
+    def search(self, key: str, entities: Sequence[str], limit: int) -> List[Tuple[str, int, str, float]]:
+        """
+        PostgreSQL only: best (entity, id, name, score) matches of a normalized
+        query, ranked like NgramIndex. Uses footballhub_search_key() and the
+        pg_trgm GIN indexes of migration V005: the "%" operator finds similar
+        names and the same indexes serve the LIKE prefix filters.
+        """
+        tokens = key.split()
+        ranked = []
+        for entity in entities:
+            model = SEARCHABLE[entity]
+            name_key = func.footballhub_search_key(model.name)
+            similarity = func.similarity(name_key, key)
+            # Every token starts a word: "%token%" uses the index, " " || key narrows it to word starts.
+            word_prefix = and_(*(
+                and_(name_key.like(f"%{token}%"), (literal(" ") + name_key).like(f"% {token}%"))
+                for token in tokens
+            ))
+            score = case(
+                (name_key == key, literal(EXACT)),
+                (name_key.like(f"{key}%"), PREFIX + SIMILARITY_WEIGHT * similarity),
+                (word_prefix, WORD_PREFIX + SIMILARITY_WEIGHT * similarity),
+                else_=FUZZY * similarity,
+            ).label("score")
+            ranked.append(
+                select(literal(entity).label("entity"), model.id.label("id"), model.name.label("name"),
+                       score, name_key.label("key"))
+                .where(or_(name_key.op("%")(key), name_key.like(f"{key}%"), word_prefix))
+                .order_by(score.desc(), name_key)
+                .limit(limit)
+                .subquery()
+            )
+        matches = union_all(*(select(subquery) for subquery in ranked)).subquery()
+        statement = (
+            select(matches.c.entity, matches.c.id, matches.c.name, matches.c.score)
+            .order_by(matches.c.score.desc(), matches.c.key, matches.c.entity)
+            .limit(limit)
+        )
+        with self._get_session() as session:
+            return [(entity, id, name, float(score)) for entity, id, name, score in session.execute(statement)]
+
+    def load_names(self, entity: str, after: Optional[int] = None) -> Tuple[List[int], List[str]]:
+        """IDs and names of the rows of the entity (only those with ID > ``after`` if given), for the in-process index."""
+        model = SEARCHABLE[entity]
+        statement = select(model.id, model.name)
+        if after is not None:
+            statement = statement.where(model.id > after)
+        with self._get_session() as session:
+            rows = session.execute(statement).all()
+        return [row[0] for row in rows], [row[1] for row in rows]
+
+    def last_ids(self) -> Dict[str, Optional[int]]:
+        """Highest ID of each entity, in a single statement (primary key lookups)."""
+        statement = select(*(
+            select(func.max(model.id)).scalar_subquery().label(entity) for entity, model in SEARCHABLE.items()
+        ))
+        with self._get_session() as session:
+            return dict(session.execute(statement).one()._mapping)
@@ -1,29 +1,20 @@
-from typing import List, Optional
-from sqlmodel import Session, create_engine, select
-import os
-from dotenv import load_dotenv
+from typing import List, Optional, Sequence
+from sqlalchemy.engine import Row
+from sqlmodel import select
 
+from app.repositories.base import BaseRepository, rows_of
+from app.repositories.countrySummaryRepository import count_change
+from app.repositories.pagination import keyset
 from app.schemas.stadium import Stadium
 
 
-class StadiumRepository:
-    def __init__(self):
-        load_dotenv()
-
-        db_uri = os.getenv("DATABASE_URL")
-        if not db_uri:
-            raise ValueError("DATABASE_URL not found.")
-
-        self.engine = create_engine(db_uri, echo=True)
-
-    def _get_session(self) -> Session:
-        return Session(self.engine)
-
+class StadiumRepository(BaseRepository):
     def create(self, name: str, city: str, country_id: int) -> Stadium:
         """Create a new stadium in the database."""
         with self._get_session() as session:
             stadium = Stadium(name=name, city=city, country_id=country_id)
             session.add(stadium)
+            count_change(session, "stadiums", None, country_id)
             session.commit()
             session.refresh(stadium)
             return stadium
@@ -34,11 +25,23 @@ class StadiumRepository:
             stadium = session.get(Stadium, stadium_id)
             return stadium
 
-    def get_all(self) -> List[Stadium]:
-        """Returns all stadiums in the database."""
+    def get_by_ids(self, stadium_ids: List[int]) -> List[Stadium]:
+        """Stadiums with the given IDs, in one query (missing IDs are left out)."""
+        if not stadium_ids:
+            return []
+        with self._get_session() as session:
+            return session.exec(select(Stadium).where(Stadium.id.in_(stadium_ids))).all()
+
+    def get_all(
+        self,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Row]:
+        """Returns all stadiums in the database, ordered by ID (optionally the page after the given ID)."""
         with self._get_session() as session:
-            statement = select(Stadium)
-            stadiums = session.exec(statement).all()
+            statement = keyset(rows_of(Stadium, fields), Stadium.id, after, limit)
+            stadiums = session.execute(statement).all()
             return stadiums
 
     def update(self, stadium_id: int, name: Optional[str] = None, city: Optional[str] = None, country_id: Optional[int] = None) -> Optional[Stadium]:
@@ -46,6 +49,7 @@ class StadiumRepository:
         with self._get_session() as session:
             stadium = session.get(Stadium, stadium_id)
             if stadium:
+                old_country_id = stadium.country_id
                 if name:
                     stadium.name = name
                 if city:
@@ -53,6 +57,7 @@ class StadiumRepository:
                 if country_id:
                     stadium.country_id = country_id
                 session.add(stadium)
+                count_change(session, "stadiums", old_country_id, stadium.country_id)
                 session.commit()
                 session.refresh(stadium)
                 return stadium
@@ -63,6 +68,7 @@ class StadiumRepository:
         with self._get_session() as session:
             stadium = session.get(Stadium, stadium_id)
             if stadium:
+                count_change(session, "stadiums", stadium.country_id, None)
                 session.delete(stadium)
                 session.commit()
                 return True
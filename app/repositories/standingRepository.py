@@ -0,0 +1,143 @@
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import case, delete, func, insert, literal, union_all
+from sqlmodel import Session, select
+
+from app.repositories.base import BaseRepository, increment
+from app.schemas.championship import Championship
+from app.schemas.match import Match
+from app.schemas.standing import POINTS_PER_DRAW, POINTS_PER_WIN, Standing, StandingRow
+from app.schemas.team import Team
+
+COUNTERS = ("played", "wins", "draws", "losses", "goals_for", "goals_against", "points")
+
+# (championship_id, home_team_id, away_team_id, home_score, away_score)
+MatchResult = Tuple[int, int, int, Optional[int], Optional[int]]
+
+
+def result_of(match: Match) -> MatchResult:
+    return match.championship_id, match.home_team_id, match.away_team_id, match.home_score, match.away_score
+
+
+def _team_totals(goals_for: int, goals_against: int, sign: int) -> dict:
+    win, draw, loss = goals_for > goals_against, goals_for == goals_against, goals_for < goals_against
+    return {
+        "played": sign,
+        "wins": sign * win,
+        "draws": sign * draw,
+        "losses": sign * loss,
+        "goals_for": sign * goals_for,
+        "goals_against": sign * goals_against,
+        "points": sign * (POINTS_PER_WIN * win + POINTS_PER_DRAW * draw),
+    }
+
+
+def _add(session: Session, championship_id: int, team_id: int, totals: dict) -> None:
+    """Add the totals to the team's row with a single atomic statement (an upsert where supported)."""
+    increment(session, Standing.__table__, {"championship_id": championship_id, "team_id": team_id}, totals)
+
+
+def apply_result(session: Session, result: MatchResult, sign: int = 1) -> None:
+    """Add (sign=1) or remove (sign=-1) a match result from the standings, in the caller's transaction.
+
+    Matches without a score do not count.
+    """
+    championship_id, home_team_id, away_team_id, home_score, away_score = result
+    if home_score is None or away_score is None:
+        return
+    _add(session, championship_id, home_team_id, _team_totals(home_score, away_score, sign))
+    _add(session, championship_id, away_team_id, _team_totals(away_score, home_score, sign))
+    if sign < 0:
+        session.execute(delete(Standing).where(
+            Standing.championship_id == championship_id,
+            Standing.team_id.in_([home_team_id, away_team_id]),
+            Standing.played <= 0,
+        ))
+
+
+def replace_result(session: Session, old: Optional[MatchResult], new: Optional[MatchResult]) -> None:
+    """Swap a match's previous result for its new one (either may be None)."""
+    if old == new:
+        return
+    if old is not None:
+        apply_result(session, old, -1)
+    if new is not None:
+        apply_result(session, new, 1)
+
+
+def rebuild_standings(session: Session, championship_ids: Optional[Iterable[int]] = None) -> int:
+    """Recompute the standings of the given championships (all if None) from the matches. Returns the row count."""
+    ids = None if championship_ids is None else list(set(championship_ids))
+    clear = delete(Standing)
+    if ids is not None:
+        clear = clear.where(Standing.championship_id.in_(ids))
+    session.execute(clear)
+
+    played = [Match.home_score.is_not(None), Match.away_score.is_not(None)]
+    if ids is not None:
+        played.append(Match.championship_id.in_(ids))
+    sides = union_all(
+        select(Match.championship_id, Match.home_team_id.label("team_id"),
+               Match.home_score.label("gf"), Match.away_score.label("ga")).where(*played),
+        select(Match.championship_id, Match.away_team_id.label("team_id"),
+               Match.away_score.label("gf"), Match.home_score.label("ga")).where(*played),
+    ).subquery()
+    wins = func.sum(case((sides.c.gf > sides.c.ga, 1), else_=0))
+    draws = func.sum(case((sides.c.gf == sides.c.ga, 1), else_=0))
+    totals = select(
+        sides.c.championship_id,
+        sides.c.team_id,
+        func.count(),
+        wins,
+        draws,
+        func.sum(case((sides.c.gf < sides.c.ga, 1), else_=0)),
+        func.sum(sides.c.gf),
+        func.sum(sides.c.ga),
+        wins * literal(POINTS_PER_WIN) + draws * literal(POINTS_PER_DRAW),
+    ).group_by(sides.c.championship_id, sides.c.team_id)
+
+    columns = ["championship_id", "team_id", *COUNTERS]
+    result = session.execute(insert(Standing).from_select(columns, totals))
+    return result.rowcount
+
+
+class StandingRepository(BaseRepository):
+    def get_table(self, championship_id: int) -> Optional[List[StandingRow]]:
+        """Standings rows of a championship (not ranked), or None if the championship does not exist."""
+        with self._get_session() as session:
+            exists = session.exec(select(Championship.id).where(Championship.id == championship_id)).first()
+            if exists is None:
+                return None
+            statement = (
+                select(
+                    Standing.team_id,
+                    Team.name.label("team"),
+                    *(getattr(Standing, name) for name in COUNTERS),
+                    (Standing.goals_for - Standing.goals_against).label("goal_difference"),
+                )
+                .join(Team, Team.id == Standing.team_id)
+                .where(Standing.championship_id == championship_id)
+                .order_by(Standing.points.desc())
+            )
+            return [StandingRow(**row._mapping) for row in session.exec(statement)]
+
+    def get_results_between(self, championship_id: int, team_ids: List[int]) -> List[MatchResult]:
+        """Scored matches of the championship played between the given teams (head-to-head)."""
+        with self._get_session() as session:
+            statement = select(
+                Match.championship_id, Match.home_team_id, Match.away_team_id, Match.home_score, Match.away_score
+            ).where(
+                Match.championship_id == championship_id,
+                Match.home_team_id.in_(team_ids),
+                Match.away_team_id.in_(team_ids),
+                Match.home_score.is_not(None),
+                Match.away_score.is_not(None),
+            )
+            return [tuple(row) for row in session.exec(statement)]
+
+    def rebuild(self, championship_ids: Optional[Iterable[int]] = None) -> int:
+        """Full recomputation of the standings (backfills, imports). Returns the number of rows written."""
+        with self._get_session() as session:
+            count = rebuild_standings(session, championship_ids)
+            session.commit()
+            return count
@@ -0,0 +1,62 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func, literal, union_all
+from sqlmodel import select
+
+from app.repositories.base import BaseRepository
+from app.schemas.championship import Championship
+from app.schemas.match import EventType, Lineup, Match, MatchEvent, Substitution
+from app.schemas.player import Player
+
+# Values of the "kind" column of the rows returned by load_rows.
+EVENT, LINEUP, SUBSTITUTION = 0, 1, 2
+
+
+class StatsRepository(BaseRepository):
+    def championship_exists(self, championship_id: int) -> bool:
+        with self._get_session() as session:
+            return session.exec(select(Championship.id).where(Championship.id == championship_id)).first() is not None
+
+    def championship_ids(self, season: str) -> List[int]:
+        """IDs of the championships of a season."""
+        with self._get_session() as session:
+            return list(session.exec(select(Championship.id).where(Championship.season == season)))
+
+    def load_rows(self, championship_ids: List[int]) -> np.ndarray:
+        """
+        Events, lineups and substitutions of the championships' matches, in a
+        single query, as an int64 array with the columns
+        (kind, match_id, player_id, detail, minute), where detail is the event
+        type for events and the incoming player for substitutions.
+        """
+        in_scope = select(Match.id).where(Match.championship_id.in_(championship_ids))
+        statement = union_all(
+            select(literal(EVENT), MatchEvent.match_id, MatchEvent.player_id, MatchEvent.event_type_id,
+                   MatchEvent.minute).where(MatchEvent.match_id.in_(in_scope)),
+            select(literal(LINEUP), Lineup.match_id, Lineup.player_id, literal(0),
+                   literal(0)).where(Lineup.match_id.in_(in_scope)),
+            select(literal(SUBSTITUTION), Substitution.match_id, Substitution.player_out_id,
+                   Substitution.player_in_id, Substitution.minute).where(Substitution.match_id.in_(in_scope)),
+        )
+        with self._get_session() as session:
+            rows = session.execute(statement).all()
+        return np.array(rows, dtype=np.int64).reshape(-1, 5)
+
+    def event_type_names(self) -> Dict[int, str]:
+        with self._get_session() as session:
+            return dict(session.exec(select(EventType.id, EventType.name)).all())
+
+    def last_ids(self) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+        """Highest event, lineup and substitution IDs (primary key lookups)."""
+        with self._get_session() as session:
+            return tuple(
+                session.exec(select(func.max(model.id))).one()
+                for model in (MatchEvent, Lineup, Substitution)
+            )
+
+    def player_names(self, player_ids: List[int]) -> Dict[int, str]:
+        if not player_ids:
+            return {}
+        with self._get_session() as session:
+            return dict(session.exec(select(Player.id, Player.name).where(Player.id.in_(player_ids))).all())
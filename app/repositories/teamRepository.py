@@ -1,32 +1,25 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from datetime import datetime
-from sqlmodel import Session, create_engine, select
-import os
-from dotenv import load_dotenv
+from sqlalchemy.engine import Row
+from sqlmodel import select
 
+from app.repositories.base import BaseRepository, rows_of
+from app.repositories.countrySummaryRepository import count_change
+from app.repositories.pagination import keyset
+from app.schemas.championship import Championship
+from app.schemas.country import Country
 from app.schemas.team import Team
 from app.schemas.team import ChampionshipParticipation
-from app.schemas.player import Player
+from app.schemas.player import Player, Position
 
 
-class TeamRepository:
-    def __init__(self):
-        load_dotenv()
-
-        db_uri = os.getenv("DATABASE_URL")
-        if not db_uri:
-            raise ValueError("DATABASE_URL not found.")
-
-        self.engine = create_engine(db_uri, echo=True)
-
-    def _get_session(self) -> Session:
-        return Session(self.engine)
-
+class TeamRepository(BaseRepository):
     def create(self, name: str, country_id: int, nickname: Optional[str] = None, city: Optional[str] = None, founding_date: Optional[datetime] = None) -> Team:
         """Create a new team in database."""
         with self._get_session() as session:
             team = Team(name=name, country_id=country_id, nickname=nickname, city=city, founding_date=founding_date)
             session.add(team)
+            count_change(session, "teams", None, country_id)
             session.commit()
             session.refresh(team)
             return team
@@ -37,6 +30,18 @@ class TeamRepository:
             team = session.get(Team, team_id)
             return team
 
+    def get_by_ids(self, team_ids: List[int]) -> List[Team]:
+        """Teams with the given IDs, in one query (missing IDs are left out)."""
+        if not team_ids:
+            return []
+        with self._get_session() as session:
+            return session.exec(select(Team).where(Team.id.in_(team_ids))).all()
+
+    def exists(self, team_id: int) -> bool:
+        """Check a team exists without loading its relationships."""
+        with self._get_session() as session:
+            return session.exec(select(Team.id).where(Team.id == team_id)).first() is not None
+
     def get_by_name(self, name: str) -> Optional[Team]:
         """Search for a team by its name."""
         with self._get_session() as session:
@@ -44,11 +49,16 @@ class TeamRepository:
             team = session.exec(statement).first()
             return team
 
-    def get_all(self) -> List[Team]:
-        """Returns all teams in database."""
+    def get_all(
+        self,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Row]:
+        """Returns all teams in database, ordered by ID (optionally the page after the given ID)."""
         with self._get_session() as session:
-            statement = select(Team)
-            teams = session.exec(statement).all()
+            statement = keyset(rows_of(Team, fields), Team.id, after, limit)
+            teams = session.execute(statement).all()
             return teams
 
     def update(self, team_id: int, name: Optional[str] = None, country_id: Optional[int] = None, nickname: Optional[str] = None, city: Optional[str] = None, founding_date: Optional[datetime] = None) -> Optional[Team]:
@@ -56,6 +66,7 @@ class TeamRepository:
         with self._get_session() as session:
             team = session.get(Team, team_id)
             if team:
+                old_country_id = team.country_id
                 if name:
                     team.name = name
                 if country_id:
@@ -67,6 +78,7 @@ class TeamRepository:
                 if founding_date:
                     team.founding_date = founding_date
                 session.add(team)
+                count_change(session, "teams", old_country_id, team.country_id)
                 session.commit()
                 session.refresh(team)
                 return team
@@ -77,18 +89,72 @@ class TeamRepository:
         with self._get_session() as session:
             team = session.get(Team, team_id)
             if team:
+                count_change(session, "teams", team.country_id, None)
                 session.delete(team)
                 session.commit()
                 return True
             return False
         
-    def get_players(self, team_id: int) -> List[Player]:
-        """Retorna todos os jogadores de um time."""
+    def get_players(
+        self,
+        team_id: int,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Row]:
+        """Retorna os jogadores de um time, ordenados por ID."""
         with self._get_session() as session:
-            statement = select(Player).where(Player.team_id == team_id)
-            players = session.exec(statement).all()
+            statement = keyset(rows_of(Player, fields).where(Player.team_id == team_id), Player.id, after, limit)
+            players = session.execute(statement).all()
             return players
    
+    def get_squad_header(self, team_id: int, participations: bool = True) -> List[Row]:
+        """
+        The team's columns with its country's name (``country_name``) and, when
+        ``participations``, one row per championship participation
+        (``participation_id``, ``championship_id``, ``championship_name``,
+        ``season``; null when there is none). Empty if the team does not exist.
+        """
+        statement = (
+            select(*Team.__table__.columns, Country.name.label("country_name"))
+            .join(Country, Country.id == Team.country_id)
+            .where(Team.id == team_id)
+        )
+        if participations:
+            statement = (
+                statement.add_columns(
+                    ChampionshipParticipation.id.label("participation_id"),
+                    Championship.id.label("championship_id"),
+                    Championship.name.label("championship_name"),
+                    ChampionshipParticipation.season,
+                )
+                .outerjoin(ChampionshipParticipation, ChampionshipParticipation.team_id == Team.id)
+                .outerjoin(Championship, Championship.id == ChampionshipParticipation.championship_id)
+                .order_by(ChampionshipParticipation.id)
+            )
+        with self._get_session() as session:
+            return session.execute(statement).all()
+
+    def get_squad_players(self, team_id: int) -> List[Row]:
+        """Players of the team with the names of their position and country, ordered by ID."""
+        statement = (
+            select(
+                Player.id,
+                Player.name,
+                Player.birth_date,
+                Player.position_id,
+                Position.name.label("position"),
+                Player.country_id,
+                Country.name.label("country"),
+            )
+            .outerjoin(Position, Position.id == Player.position_id)
+            .outerjoin(Country, Country.id == Player.country_id)
+            .where(Player.team_id == team_id)
+            .order_by(Player.id)
+        )
+        with self._get_session() as session:
+            return session.execute(statement).all()
+
     def create_championshipParticipation(self, championship_id: int = None, team_id: int = None, season: Optional[str] = None) -> ChampionshipParticipation:
         """Create a new team in database."""
         with self._get_session() as session:
@@ -0,0 +1,107 @@
+import asyncio
+import os
+import weakref
+from typing import Any, Callable, Dict, Generic, List, Optional, Set, TypeVar
+
+from fastapi import HTTPException, Query, Request, status
+
+from app.config.concurrency import run_db
+from app.routes.params import MAX_IDS, id_list
+
+T = TypeVar("T")
+
+
+def batch_window() -> float:
+    """Seconds a lookup waits for others to join its batch (BATCH_WINDOW_MS, default 0: the same loop iteration)."""
+    value = os.getenv("BATCH_WINDOW_MS")
+    return float(value) / 1000 if value is not None and value.strip() != "" else 0.0
+
+
+class _Batch:
+    def __init__(self):
+        self.futures: Dict[int, List[asyncio.Future]] = {}
+        self.handle: Optional[asyncio.Handle] = None
+
+
+class BatchLoader(Generic[T]):
+    """
+    DataLoader-style batcher: the single-ID lookups made concurrently (by
+    different requests) within one window are merged into one
+    ``load_many(ids)`` call, run with ``run_db``; it returns {id: entity} and
+    the IDs it leaves out resolve to None. A batch is sent as soon as it has
+    ``max_batch`` IDs.
+    """
+
+    def __init__(self, load_many: Callable[[List[int]], Dict[int, T]], window: Optional[float] = None,
+                 max_batch: int = MAX_IDS):
+        self.load_many = load_many
+        self.window = window
+        self.max_batch = max_batch
+        # One pending batch per event loop (tests run several loops in one process).
+        self._pending: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Batch]" = weakref.WeakKeyDictionary()
+        self._running: Set[asyncio.Task] = set()
+        self.batches = 0
+        self.lookups = 0
+
+    async def load(self, key: int) -> Optional[T]:
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(loop)
+        if batch is None:
+            batch = self._pending[loop] = _Batch()
+        if batch.handle is None:
+            window = self.window if self.window is not None else batch_window()
+            if window > 0:
+                batch.handle = loop.call_later(window, self._dispatch, loop, batch)
+            else:
+                batch.handle = loop.call_soon(self._dispatch, loop, batch)
+        future = loop.create_future()
+        batch.futures.setdefault(key, []).append(future)
+        self.lookups += 1
+        if len(batch.futures) >= self.max_batch:
+            batch.handle.cancel()
+            self._dispatch(loop, batch)
+        return await future
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop, batch: _Batch) -> None:
+        if self._pending.get(loop) is batch:
+            del self._pending[loop]
+        if batch.futures:
+            self.batches += 1
+            # The loop only keeps a weak reference to its tasks.
+            task = loop.create_task(self._run(batch.futures))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, futures: Dict[int, List[asyncio.Future]]) -> None:
+        try:
+            found = await run_db(self.load_many, list(futures))
+        except Exception as e:
+            for waiting in futures.values():
+                for future in waiting:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for key, waiting in futures.items():
+            for future in waiting:
+                if not future.done():
+                    future.set_result(found.get(key))
+
+
+def batch_ids(
+    request: Request,
+    ids: Optional[str] = Query(None, description="IDs separados por vírgula, ex.: 1,2,3"),
+) -> List[int]:
+    """``ids`` of a batch endpoint (``/teams?ids=1,2,3``)."""
+    if ids is None:
+        # Without ids, /teams used to be redirected to the list endpoint (/teams/): keep doing so.
+        location = str(request.url.replace(path=request.url.path + "/"))
+        raise HTTPException(status.HTTP_307_TEMPORARY_REDIRECT, headers={"Location": location})
+    return id_list(ids)
+
+
+def batch_result(ids: List[int], found: Dict[int, Any]) -> Dict[str, list]:
+    """Body of a Batch: the entities in the order of ``ids`` (None where missing) and the missing IDs."""
+    return {
+        "items": [found.get(key) for key in ids],
+        "missing": list(dict.fromkeys(key for key in ids if key not in found)),
+    }
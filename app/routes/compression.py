@@ -0,0 +1,69 @@
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config.settings import CompressionSettings, get_compression_settings
+from app.routes.params import header_qualities
+
+try:
+    import brotli
+except ImportError:  # only gzip is offered
+    brotli = None
+
+
+class BrotliResponder(IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int = 4) -> None:
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if more_body:
+            # Streamed bodies: send what has been compressed so far with each chunk.
+            return self.compressor.process(body) + self.compressor.flush()
+        return self.compressor.process(body) + self.compressor.finish()
+
+
+def choose_encoding(header: str) -> Optional[str]:
+    """The coding to compress with: br (when installed) or gzip, the one with the highest q (br on ties)."""
+    accepted = dict(header_qualities(header))
+    offered = ("br", "gzip") if brotli is not None else ("gzip",)
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding in offered:
+        q = accepted.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses of at least ``minimum_size`` bytes with brotli or gzip,
+    as negotiated with ``Accept-Encoding`` (brotli only when the package is
+    installed). Small bodies, event streams and responses that already have a
+    Content-Encoding are sent as they are.
+    """
+
+    def __init__(self, app: ASGIApp, settings: Optional[CompressionSettings] = None):
+        self.app = app
+        self.settings = settings or get_compression_settings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.settings.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        coding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        minimum_size = self.settings.minimum_size
+        responder: ASGIApp
+        if coding == "br":
+            responder = BrotliResponder(self.app, minimum_size, quality=self.settings.brotli_quality)
+        elif coding == "gzip":
+            responder = GZipResponder(self.app, minimum_size, compresslevel=self.settings.gzip_level)
+        else:
+            responder = IdentityResponder(self.app, minimum_size)
+        await responder(scope, receive, send)
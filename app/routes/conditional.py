@@ -0,0 +1,65 @@
+import hashlib
+from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import HTTPException, Request, Response, status
+
+from app.config.cache import LocalVersions, get_cache
+from app.config.concurrency import run_db
+from app.config.versions import table_versions
+from app.routes.responses import negotiate
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison: W/"x" matches "x".
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates
+
+
+def _not_modified_since(if_modified_since: str, modified: int) -> bool:
+    try:
+        since: Optional[datetime] = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return since is not None and modified <= since.timestamp()
+
+
+def conditional(*tables: str):
+    """Dependency for read endpoints whose response only depends on ``tables``.
+
+    The ETag is derived from the request URL and the versions of the tables
+    (bumped on every committed write), so a client whose copy is still current
+    gets a 304 before the query runs and before anything is serialized.
+    """
+
+    async def check(request: Request, response: Response) -> None:
+        if isinstance(get_cache().versions, LocalVersions):
+            token, versions, modified = table_versions(tables)
+        else:
+            token, versions, modified = await run_db(table_versions, tables)
+
+        # The list endpoints encode the same page differently for each Accept (see negotiate).
+        encoding = negotiate(request).media_type
+        key = f"{token}|{request.url.path}?{request.url.query}|{encoding}|{versions}"
+        etag = '"' + hashlib.sha1(key.encode()).hexdigest()[:32] + '"'
+        headers = {
+            "ETag": etag,
+            "Last-Modified": formatdate(int(modified), usegmt=True),
+            "Cache-Control": "no-cache",
+        }
+
+        if_none_match = request.headers.get("if-none-match")
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_none_match is not None:
+            fresh = _matches(if_none_match, etag)
+        else:
+            fresh = if_modified_since is not None and _not_modified_since(if_modified_since, int(modified))
+        if fresh:
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        response.headers.update(headers)
+
+    return check
@@ -0,0 +1,95 @@
+import asyncio
+import functools
+import time
+from typing import Callable
+
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.metrics import current_stats, end_request, record_request, start_request
+
+
+def _timed(call: Callable) -> Callable:
+    """Wrap an endpoint so the request knows when it returned (the rest is serialization)."""
+    def done() -> None:
+        stats = current_stats()
+        if stats is not None:
+            stats.endpoint_done = time.perf_counter()
+
+    if asyncio.iscoroutinefunction(call):
+        @functools.wraps(call)
+        async def timed_async(*args, **kwargs):
+            result = await call(*args, **kwargs)
+            done()
+            return result
+        return timed_async
+
+    @functools.wraps(call)
+    def timed(*args, **kwargs):
+        result = call(*args, **kwargs)
+        done()
+        return result
+    return timed
+
+
+class TimedRoute(APIRoute):
+    """Route that measures how long validating and encoding its response takes."""
+
+    def get_route_handler(self) -> Callable:
+        self.dependant.call = _timed(self.dependant.call)
+        handler = super().get_route_handler()
+
+        async def timed_handler(request):
+            response = await handler(request)
+            stats = current_stats()
+            if stats is not None and stats.endpoint_done is not None:
+                stats.serialization_seconds += time.perf_counter() - stats.endpoint_done
+                stats.endpoint_done = None
+            return response
+
+        return timed_handler
+
+
+def _server_timing(stats) -> str:
+    now = time.perf_counter()
+    entries = [
+        f'db;dur={stats.db_seconds * 1000:.2f};desc="{stats.queries} queries"',
+        f"db-slowest;dur={stats.slowest[0] * 1000:.2f}",
+        f"serialize;dur={stats.serialization_seconds * 1000:.2f}",
+        f"app;dur={(now - stats.started) * 1000:.2f}",
+    ]
+    return ", ".join(entries)
+
+
+class MetricsMiddleware:
+    """
+    Records the queries, database time and serialization time of each request.
+    They are sent in the Server-Timing header and added to the /metrics counters
+    once the response is complete (streamed bodies included).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_request()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", _server_timing(stats))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            route = scope.get("route")
+            record_request(scope["method"], getattr(route, "path", "unmatched"), status, stats)
+            end_request(token)
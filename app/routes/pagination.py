@@ -0,0 +1,91 @@
+import base64
+import binascii
+import json
+from operator import attrgetter
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from fastapi import HTTPException, Query, Request, Response, status
+
+from app.routes.responses import checked, negotiate
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(key: int, **fields: Any) -> str:
+    raw = json.dumps({"id": key, **fields}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor_fields(cursor: str) -> Dict[str, Any]:
+    """Decode a cursor into its fields; ``id`` is always present."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        fields = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        key = fields["id"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor inválido")
+    if not isinstance(key, int):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor inválido")
+    return fields
+
+
+def decode_cursor(cursor: str) -> int:
+    return decode_cursor_fields(cursor)["id"]
+
+
+class PageParams:
+    """Query parameters of the paginated list endpoints (``after`` cursor and ``limit``)."""
+
+    def __init__(
+        self,
+        response: Response,
+        after: Optional[str] = Query(None, description="Cursor returned in the `next` link of the previous page"),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    ):
+        self.cursor = decode_cursor_fields(after) if after else None
+        self.after = self.cursor["id"] if self.cursor else None
+        self.limit = limit
+        # The response the dependencies (e.g. conditional) add their headers to.
+        self.response = response
+
+    @property
+    def fetch_limit(self) -> int:
+        # One extra row tells whether there is a next page.
+        return self.limit + 1
+
+    def page(
+        self,
+        request: Request,
+        rows: Sequence[Any],
+        key: Callable[[Any], int] = attrgetter("id"),
+        fields: Optional[Callable[[Any], Dict[str, Any]]] = None,
+    ) -> dict:
+        """Build the page envelope; ``fields`` adds the other sort keys of the last row to the cursor."""
+        items = list(rows[: self.limit])
+        next_url = None
+        if len(rows) > self.limit:
+            last = items[-1]
+            cursor = encode_cursor(key(last), **(fields(last) if fields else {}))
+            next_url = str(request.url.include_query_params(after=cursor, limit=self.limit))
+        return {"items": items, "next": next_url}
+
+    def trusted_page(
+        self,
+        request: Request,
+        rows: Sequence[Any],
+        model: Any,
+        key: Callable[[Any], int] = attrgetter("id"),
+        fields: Optional[Callable[[Any], Dict[str, Any]]] = None,
+    ) -> Response:
+        """
+        Like ``page``, but returned as an already encoded response, so FastAPI
+        skips the response_model for it (see ``checked``); ``model`` is the
+        schema of one item. The encoding (JSON, columnar JSON or MessagePack)
+        follows the ``Accept`` header, see ``negotiate``.
+        """
+        page = self.page(request, checked(rows, model), key, fields)
+        response = negotiate(request).for_page(page)
+        response.headers.update(self.response.headers)
+        response.headers.append("Vary", "Accept")
+        return response
@@ -0,0 +1,97 @@
+from typing import List, Optional, Set, Tuple
+
+from fastapi import HTTPException, Query, status
+
+MAX_IDS = 500
+
+
+def id_list(ids: str = Query(..., description="IDs separados por vírgula, ex.: 1,2,3")) -> List[int]:
+    """Parse the ``ids`` query parameter of the batch endpoints."""
+    try:
+        parsed = [int(value) for value in ids.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="IDs devem ser números inteiros")
+    if not parsed:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Informe pelo menos um ID")
+    if len(parsed) > MAX_IDS:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=f"Máximo de {MAX_IDS} IDs por requisição")
+    return parsed
+
+
+def header_qualities(header: str) -> List[Tuple[str, float]]:
+    """Values of an ``Accept``-style header with their q, in the order listed (lower-cased)."""
+    values = []
+    for part in header.split(","):
+        value, *params = (item.strip() for item in part.split(";"))
+        if not value:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, number = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(number)
+                except ValueError:
+                    q = 0.0
+        values.append((value.lower(), q))
+    return values
+
+
+def _names(value: str) -> Set[str]:
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+class Fields:
+    """
+    The ``fields`` query parameter of a list endpoint (``?fields=id,name``):
+    which columns of ``model``'s table to read and return. The result is in
+    table order and always has the primary key, which the page cursor needs;
+    None (no parameter) means every column.
+    """
+
+    def __init__(self, model, key: str = "id"):
+        self.names = list(model.__table__.columns.keys())
+        self.key = key
+
+    def __call__(
+        self,
+        fields: Optional[str] = Query(None, description="Campos separados por vírgula, ex.: id,name (padrão: todos)"),
+    ) -> Optional[Tuple[str, ...]]:
+        if not fields:
+            return None
+        wanted = _names(fields)
+        unknown = wanted.difference(self.names)
+        if unknown:
+            raise HTTPException(
+                status.HTTP_400_BAD_REQUEST,
+                detail=f"Campos desconhecidos: {', '.join(sorted(unknown))}. Disponíveis: {', '.join(self.names)}",
+            )
+        wanted.add(self.key)
+        return tuple(name for name in self.names if name in wanted)
+
+
+class Include:
+    """
+    The ``include`` query parameter of an endpoint that embeds related
+    records (``?include=players,country``): which of ``relations`` to embed,
+    in the order declared. All of them when the parameter is absent, none
+    when it is empty.
+    """
+
+    def __init__(self, *relations: str):
+        self.relations = relations
+
+    def __call__(
+        self,
+        include: Optional[str] = Query(None, description="Relações incluídas, separadas por vírgula (padrão: todas)"),
+    ) -> Tuple[str, ...]:
+        if include is None:
+            return self.relations
+        wanted = _names(include)
+        unknown = wanted.difference(self.relations)
+        if unknown:
+            raise HTTPException(
+                status.HTTP_400_BAD_REQUEST,
+                detail=f"Relações desconhecidas: {', '.join(sorted(unknown))}. Disponíveis: {', '.join(self.relations)}",
+            )
+        return tuple(name for name in self.relations if name in wanted)
@@ -0,0 +1,148 @@
+import json
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, create_model
+from sqlalchemy.engine import Row
+
+from app.config.settings import _env_bool
+from app.routes.params import header_qualities
+
+try:
+    import orjson
+except ImportError:  # the standard library encoder is used instead
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # MessagePack is not offered
+    msgpack = None
+
+MSGPACK = "application/msgpack"
+COLUMNAR_JSON = "application/vnd.footballhub.columnar+json"
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Row):
+        return value._asdict()
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def as_dicts(rows: Sequence[Any]) -> List[Any]:
+    """Rows as plain dicts, which orjson encodes natively (much faster than one ``default`` call per row)."""
+    if not rows or not isinstance(rows[0], Row):
+        return list(rows)
+    keys = rows[0]._fields
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def dumps(content: Any) -> bytes:
+    """Encode with orjson when it is installed, with the standard library otherwise."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def as_columns(items: Sequence[Any]) -> Dict[str, List[Any]]:
+    """Items as {"columns": [...], "rows": [[...], ...]}: the field names are sent once, not once per item."""
+    if not items:
+        return {"columns": [], "rows": []}
+    if isinstance(items[0], Row):
+        return {"columns": list(items[0]._fields), "rows": [tuple(item) for item in items]}
+    if isinstance(items[0], BaseModel):
+        items = [item.model_dump() for item in items]
+    columns = list(items[0])
+    return {"columns": columns, "rows": [[item[column] for column in columns] for item in items]}
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with orjson; database rows (``Row``) are written as objects."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+    @classmethod
+    def for_page(cls, page: Dict[str, Any]) -> Response:
+        return cls({**page, "items": as_dicts(page["items"])})
+
+
+class ColumnarJSONResponse(FastJSONResponse):
+    """Page with its items as columns and rows (see ``as_columns``), for the columnar JSON media type."""
+
+    media_type = COLUMNAR_JSON
+
+    @classmethod
+    def for_page(cls, page: Dict[str, Any]) -> Response:
+        return cls({**as_columns(page["items"]), "next": page["next"]})
+
+
+class MsgPackResponse(Response):
+    """MessagePack response (dates as ISO strings, like in JSON); needs the optional 'msgpack' package."""
+
+    media_type = MSGPACK
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, default=_default, datetime=False)
+
+    @classmethod
+    def for_page(cls, page: Dict[str, Any]) -> Response:
+        return cls({**page, "items": as_dicts(page["items"])})
+
+
+def _offered() -> Dict[str, Type[Response]]:
+    offered = {"application/json": FastJSONResponse, COLUMNAR_JSON: ColumnarJSONResponse}
+    if msgpack is not None:
+        offered[MSGPACK] = MsgPackResponse
+    return offered
+
+
+def negotiate(request: Request) -> Type[Response]:
+    """
+    Response class for the ``Accept`` header of a list request. The compact
+    encodings are opt-in: only a media type named explicitly selects one (the
+    highest q wins, then the first listed); anything else gets JSON, also when
+    MessagePack is asked for but not installed.
+    """
+    offered = _offered()
+    best: Optional[Type[Response]] = None
+    best_rank = (0.0, 0)
+    for position, (media_type, q) in enumerate(header_qualities(request.headers.get("accept", ""))):
+        response_class = offered.get(media_type)
+        if response_class is not None and (q, -position) > best_rank:
+            best, best_rank = response_class, (q, -position)
+    return best or FastJSONResponse
+
+
+def validate_responses() -> bool:
+    """Whether trusted rows are validated against their schema anyway (VALIDATE_RESPONSES, off by default)."""
+    return _env_bool("VALIDATE_RESPONSES", False)
+
+
+def checked(rows: Sequence[Any], model: Type[BaseModel]) -> Sequence[Any]:
+    """
+    Rows read straight from a repository are trusted: they are encoded as they
+    are, without building and serializing a model per row (which costs more
+    than the query on large pages). With VALIDATE_RESPONSES=1 every row is
+    validated against ``model`` first, e.g. while developing a new query.
+    """
+    if not validate_responses():
+        return rows
+    return [model.model_validate(row, from_attributes=True) for row in rows]
+
+
+@lru_cache(maxsize=None)
+def _projection(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    definitions = {name: (model.model_fields[name].annotation, model.model_fields[name]) for name in fields}
+    return create_model(f"{model.__name__}Fields", **definitions)
+
+
+def projection(model: Type[BaseModel], fields: Optional[Tuple[str, ...]]) -> Type[BaseModel]:
+    """The schema of ``model`` rows read with only ``fields`` (see ``Fields``), for ``checked``."""
+    return model if fields is None else _projection(model, fields)
@@ -1,19 +1,34 @@
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query, Path, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body, Request
+from app.config.concurrency import run_db
+from app.routes.conditional import conditional
+from app.routes.pagination import PageParams
 from app.services.ChampionshipService import ChampionshipService
+from app.services.StandingService import DEFAULT_TIEBREAKERS, StandingService
+from app.services.StatsService import StatMetric, StatsService
 from app.schemas.championship import Championship
+from app.schemas.pagination import Page
+from app.schemas.standing import StandingRow
+from app.schemas.stats import PlayerStat
+from app.routes.instrumentation import TimedRoute
 
 router = APIRouter(
     prefix="/championship",
     tags=["championship"],
+    route_class=TimedRoute,
 )
 
 championship_service = ChampionshipService()
+standing_service = StandingService()
+stats_service = StatsService()
+
+STATS_TABLES = ("match_events", "lineups", "substitutions", "matches", "event_types", "championships", "players")
 
 
 @router.post("/", status_code=201)
 async def add_championship(championship_input: Championship):
-    championship = championship_service.create_championship(
+    championship = await run_db(
+        championship_service.create_championship,
         championship_input.name,
         championship_input.country_id,
         championship_input.type,
@@ -21,27 +36,89 @@ async def add_championship(championship_input: Championship):
     )
     return championship
 
-@router.get("/", response_model=List[Championship])
-async def get_all_championships():
-    return championship_service.get_all_championships()
+@router.get(
+    "/",
+    response_model=Page[Championship],
+    dependencies=[Depends(conditional("championships"))],
+)
+async def get_all_championships(request: Request, page: PageParams = Depends()):
+    championships = await run_db(championship_service.get_all_championships, page.after, page.fetch_limit)
+    return page.trusted_page(request, championships, Championship)
 
-@router.get("/id/{championship_id}")
+@router.get("/id/{championship_id}", dependencies=[Depends(conditional("championships"))])
 async def get_country(championship_id: int):
-    championship = championship_service.find_championship_by_id(championship_id)
+    championship = await run_db(championship_service.find_championship_by_id, championship_id)
     if not championship:
         raise HTTPException(status_code=404, detail="Country not found")
     return championship
 
-@router.get("/name/{championship_name}")
+@router.get("/name/{championship_name}", dependencies=[Depends(conditional("championships"))])
 async def get_country(championship_name: str):
-    championship = championship_service.find_championship_by_name(championship_name)
+    championship = await run_db(championship_service.find_championship_by_name, championship_name)
     if not championship:
         raise HTTPException(status_code=404, detail="Country not found")
     return championship
 
+@router.get(
+    "/{championship_id}/standings",
+    response_model=List[StandingRow],
+    dependencies=[Depends(conditional("standings", "teams"))],
+)
+async def get_standings(
+    championship_id: int,
+    tiebreakers: str = Query(
+        ",".join(DEFAULT_TIEBREAKERS),
+        description="Critérios de desempate após os pontos, em ordem, separados por vírgula",
+    ),
+):
+    """Tabela de classificação do campeonato"""
+    criteria = [name.strip() for name in tiebreakers.split(",") if name.strip()]
+    try:
+        standings = await run_db(standing_service.get_standings, championship_id, criteria)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if standings is None:
+        raise HTTPException(status_code=404, detail="Championship not found")
+    return standings
+
+@router.get(
+    "/seasons/{season}/stats/{metric}",
+    response_model=List[PlayerStat],
+    dependencies=[Depends(conditional(*STATS_TABLES))],
+)
+async def get_season_stats(
+    season: str,
+    metric: StatMetric,
+    limit: int = Query(20, ge=1, le=100),
+    min_minutes: int = Query(0, ge=0, description="Minutos mínimos jogados para entrar no ranking"),
+):
+    """Ranking de jogadores de todos os campeonatos da temporada"""
+    stats = await run_db(stats_service.get_season_leaderboard, season, metric, limit, min_minutes)
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Season not found")
+    return stats
+
+@router.get(
+    "/{championship_id}/stats/{metric}",
+    response_model=List[PlayerStat],
+    dependencies=[Depends(conditional(*STATS_TABLES))],
+)
+async def get_championship_stats(
+    championship_id: int,
+    metric: StatMetric,
+    limit: int = Query(20, ge=1, le=100),
+    min_minutes: int = Query(0, ge=0, description="Minutos mínimos jogados para entrar no ranking"),
+):
+    """Ranking de jogadores do campeonato: artilharia, assistências, cartões, minutos, gols por 90"""
+    stats = await run_db(stats_service.get_championship_leaderboard, championship_id, metric, limit, min_minutes)
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Championship not found")
+    return stats
+
 @router.put("/{championship_id}")
 async def update_championship(championship_id: int, championship: Championship):
-    updated_championship = championship_service.update_championship(
+    updated_championship = await run_db(
+        championship_service.update_championship,
         championship_id,
         championship.name,
         championship.country_id,
@@ -55,7 +132,7 @@ async def update_championship(championship_id: int, championship: Championship):
 
 @router.delete("/{championship_id}")
 async def delete_championship(championship_id: int):
-    championship = championship_service.delete_championship(championship_id)
+    championship = await run_db(championship_service.delete_championship, championship_id)
     if not championship:
         raise HTTPException(status_code=404, detail="Championship not found")
     return championship
@@ -1,27 +1,61 @@
-from typing import List
-from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from app.config.concurrency import run_db
+from app.routes.conditional import conditional
+from app.routes.pagination import PageParams
+from app.routes.params import Fields
+from app.routes.responses import projection
 from app.services.CountryService import CountryService
-from app.schemas.country import Country
+from app.services.bulk import BulkMode, BulkValidationError
+from app.schemas.bulk import BulkCreateResult
+from app.schemas.country import Country, CountrySummaryRow
+from app.schemas.pagination import Page
 from app.schemas.stadium import Stadium
 from app.schemas.player import Player
 from app.schemas.team import Team
+from app.routes.instrumentation import TimedRoute
 
 router = APIRouter(
     prefix="/country",
     tags=["country"],
+    route_class=TimedRoute,
 )
 
 country_service = CountryService()
 
 
-@router.get("/", response_model=List[Country])
-async def get_all_countries():
-    return country_service.get_all_countries()
+@router.get("/", response_model=Page[Country], dependencies=[Depends(conditional("countries"))])
+async def get_all_countries(request: Request, page: PageParams = Depends()):
+    countries = await run_db(country_service.get_all_countries, page.after, page.fetch_limit)
+    return page.trusted_page(request, countries, Country)
 
 
-@router.get("/{country_id}")
+@router.get(
+    "/summary",
+    response_model=List[CountrySummaryRow],
+    dependencies=[Depends(conditional("countries", "country_summaries"))],
+)
+async def get_country_summaries():
+    """Teams, players, stadiums and championships of every country, from the precomputed summaries"""
+    return await run_db(country_service.get_summaries)
+
+
+@router.get(
+    "/{country_id}/summary",
+    response_model=CountrySummaryRow,
+    dependencies=[Depends(conditional("countries", "country_summaries"))],
+)
+async def get_country_summary(country_id: int):
+    """Teams, players, stadiums and championships of a country, from the precomputed summary"""
+    summary = await run_db(country_service.get_summary, country_id)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="Country not found")
+    return summary
+
+
+@router.get("/{country_id}", dependencies=[Depends(conditional("countries"))])
 async def get_country(country_id: int):
-    country = country_service.find_country_by_id(country_id)
+    country = await run_db(country_service.find_country_by_id, country_id)
     if not country:
         raise HTTPException(status_code=404, detail="Country not found")
     return country
@@ -29,20 +63,21 @@ async def get_country(country_id: int):
 
 @router.post("/", status_code=201)
 async def add_country(country_input: Country):
-    country = country_service.create_country(country_input.name)
+    country = await run_db(country_service.create_country, country_input.name)
     return country
 
-@router.post("/list/", status_code=201, response_model=List[Country])
-async def add_countries(countries: List[Country]):
+@router.post("/list/", status_code=201, response_model=BulkCreateResult[Country])
+async def add_countries(countries: List[Country], mode: BulkMode = BulkMode.atomic):
     try:
-        created_countries = [country_service.create_country(c.name) for c in countries]
-        return created_countries
+        return await run_db(country_service.create_countries, [c.name for c in countries], mode)
+    except BulkValidationError as e:
+        raise HTTPException(status_code=400, detail=[error.model_dump() for error in e.errors])
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.put("/{country_id}")
 async def update_country(country_id: int, country: Country):
-    country = country_service.update_country(country_id, country.name)
+    country = await run_db(country_service.update_country, country_id, country.name)
     if not country:
         raise HTTPException(status_code=404, detail="Country not found")
     return country
@@ -50,28 +85,55 @@ async def update_country(country_id: int, country: Country):
 
 @router.delete("/{country_id}")
 async def delete_country(country_id: int):
-    country = country_service.delete_country(country_id)
+    country = await run_db(country_service.delete_country, country_id)
     if not country:
         raise HTTPException(status_code=404, detail="Country not found")
     return country
 
-@router.get("/{country_id}/teams", response_model=List[Team])
-async def get_teams_by_country(country_id: int):
-    teams = country_service.get_teams_by_country(country_id)
+@router.get(
+    "/{country_id}/teams",
+    response_model=Page[Team],
+    dependencies=[Depends(conditional("teams"))],
+)
+async def get_teams_by_country(
+    country_id: int,
+    request: Request,
+    page: PageParams = Depends(),
+    fields: Optional[Tuple[str, ...]] = Depends(Fields(Team)),
+):
+    teams = await run_db(country_service.get_teams_by_country, country_id, page.after, page.fetch_limit, fields)
     if teams is None:
         raise HTTPException(status_code=404, detail="Country not found or no teams")
-    return teams
+    return page.trusted_page(request, teams, projection(Team, fields))
 
-@router.get("/{country_id}/players", response_model=List[Player])
-async def get_players_by_country(country_id: int):
-    players = country_service.get_players_by_country(country_id)
+@router.get(
+    "/{country_id}/players",
+    response_model=Page[Player],
+    dependencies=[Depends(conditional("players"))],
+)
+async def get_players_by_country(
+    country_id: int,
+    request: Request,
+    page: PageParams = Depends(),
+    fields: Optional[Tuple[str, ...]] = Depends(Fields(Player)),
+):
+    players = await run_db(country_service.get_players_by_country, country_id, page.after, page.fetch_limit, fields)
     if players is None:
         raise HTTPException(status_code=404, detail="Country not found or no players")
-    return players
+    return page.trusted_page(request, players, projection(Player, fields))
 
-@router.get("/{country_id}/stadiums", response_model=List[Stadium])
-async def get_stadiums_by_country(country_id: int):
-    stadiums = country_service.get_stadiums_by_country(country_id)
+@router.get(
+    "/{country_id}/stadiums",
+    response_model=Page[Stadium],
+    dependencies=[Depends(conditional("stadiums"))],
+)
+async def get_stadiums_by_country(
+    country_id: int,
+    request: Request,
+    page: PageParams = Depends(),
+    fields: Optional[Tuple[str, ...]] = Depends(Fields(Stadium)),
+):
+    stadiums = await run_db(country_service.get_stadiums_by_country, country_id, page.after, page.fetch_limit, fields)
     if stadiums is None:
         raise HTTPException(status_code=404, detail="Country not found or no stadiums")
-    return stadiums
\ No newline at end of file
+    return page.trusted_page(request, stadiums, projection(Stadium, fields))
\ No newline at end of file
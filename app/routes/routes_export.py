@@ -0,0 +1,33 @@
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from app.services.ExportService import ExportService
+from app.routes.instrumentation import TimedRoute
+
+router = APIRouter(
+    prefix="/export",
+    tags=["export"],
+    route_class=TimedRoute,
+)
+
+export_service = ExportService()
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+
+@router.get("/{entity}.{format}")
+async def export_entity(entity: str, format: str):
+    """
+    Exporta a tabela inteira de uma entidade (ex.: /export/player.csv).
+    As linhas são lidas de um cursor no servidor e enviadas à medida que
+    chegam, sem montar a lista em memória.
+    """
+    try:
+        body = export_service.export(entity, format)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{entity}.{format}"'},
+    )
@@ -0,0 +1,48 @@
+import time
+
+from fastapi import APIRouter, HTTPException, status
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config.cache import get_cache
+from app.config.concurrency import run_db
+from app.config.database import get_engine, pool_status
+from app.routes.instrumentation import TimedRoute
+
+router = APIRouter(
+    prefix="/health",
+    tags=["health"],
+    route_class=TimedRoute,
+)
+
+
+def _ping(engine) -> float:
+    start = time.perf_counter()
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    return (time.perf_counter() - start) * 1000
+
+
+@router.get("/db")
+async def database_health():
+    """Check the database connection and report the connection pool usage"""
+    engine = get_engine()
+    try:
+        latency_ms = await run_db(_ping, engine)
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Banco de dados indisponível: {str(e)}",
+        )
+
+    return {
+        "status": "ok",
+        "latency_ms": round(latency_ms, 2),
+        "pool": pool_status(engine),
+    }
+
+
+@router.get("/cache")
+async def cache_health():
+    """Report the reference data cache usage (hits, misses, evictions)"""
+    return get_cache().stats()
@@ -0,0 +1,64 @@
+from typing import AsyncIterator, Iterator, Optional
+
+from anyio import from_thread
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config.concurrency import run_db
+from app.schemas.bulk import ImportReport
+from app.services.ImportService import DEFAULT_IMPORT_CHUNK_SIZE, ImportService, decode_lines
+from app.routes.instrumentation import TimedRoute
+
+router = APIRouter(
+    prefix="/import",
+    tags=["import"],
+    route_class=TimedRoute,
+)
+
+import_service = ImportService()
+
+
+def _iter_body(stream: AsyncIterator[bytes]) -> Iterator[bytes]:
+    """Pull the request body chunk by chunk from the event loop (called from a worker thread)."""
+    while True:
+        try:
+            yield from_thread.run(stream.__anext__)
+        except StopAsyncIteration:
+            return
+
+
+def _format_from_request(request: Request, format: Optional[str]) -> str:
+    if format:
+        return format
+    content_type = request.headers.get("content-type", "")
+    return "csv" if "csv" in content_type else "ndjson"
+
+
+@router.post("/{entity}", response_model=ImportReport)
+async def import_entity(
+    entity: str,
+    request: Request,
+    format: Optional[str] = Query(None, description="ndjson ou csv (padrão: pelo Content-Type)"),
+    chunk_size: int = Query(DEFAULT_IMPORT_CHUNK_SIZE, ge=1, le=10000),
+):
+    """
+    Importa registros de uma entidade (country, team, player, championship,
+    participation, match, ...) a partir de um corpo NDJSON ou CSV enviado em fluxo.
+    Chaves estrangeiras podem ser informadas pelo nome (ex.: "country": "Brasil").
+    """
+    lines = decode_lines(_iter_body(request.stream()))
+    try:
+        return await run_db(
+            import_service.import_lines,
+            entity,
+            lines,
+            _format_from_request(request, format),
+            chunk_size,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao importar: {str(e)}",
+        )
@@ -0,0 +1,208 @@
+import asyncio
+from typing import AsyncIterator, Callable, List, NamedTuple, Optional
+from weakref import WeakValueDictionary
+
+import anyio
+from fastapi import APIRouter, Header, HTTPException, Query, WebSocket, WebSocketException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from starlette.websockets import WebSocketDisconnect
+
+from app.config.concurrency import run_db
+from app.config.live import SlowConsumer, get_hub
+from app.routes.instrumentation import TimedRoute
+from app.routes.responses import dumps
+from app.schemas.live import LiveEvent, MatchEventCreate, SubstitutionCreate
+from app.schemas.match import MatchEvent, Substitution
+from app.services.LiveService import START, Cursor, FeedItem, LiveService, advance, format_cursor, parse_cursor
+
+router = APIRouter(prefix="/matches", tags=["live"], route_class=TimedRoute)
+
+service = LiveService()
+
+# One lock per match being written to: its writes (and their publications) happen one at a time.
+_write_locks: "WeakValueDictionary[int, asyncio.Lock]" = WeakValueDictionary()
+
+# Close code of a WebSocket subscriber dropped for falling behind: reconnect with ?after=<last id>.
+WS_SLOW_CONSUMER = status.WS_1013_TRY_AGAIN_LATER
+
+
+class Message(NamedTuple):
+    """A feed item as published to the hub: its row is encoded once, not once per subscriber."""
+
+    item: FeedItem
+    data: str
+
+
+def _message(item: FeedItem) -> Message:
+    return Message(item, dumps(item.data).decode())
+
+
+def _cursor(after: Optional[str]) -> Cursor:
+    try:
+        return parse_cursor(after) if after else START
+    except ValueError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+async def _require_match(match_id: int) -> None:
+    if not await run_db(service.match_exists, match_id):
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Partida não encontrada")
+
+
+async def _write_and_publish(match_id: int, write: Callable, payload):
+    """
+    Run ``write`` (LiveService.add_event/add_substitution) and publish what it
+    returns. Writes to the same match wait for each other, so messages reach
+    the hub in ID order: a subscriber's cursor never passes an entry it has not
+    received yet (which it would lose when reconnecting from that cursor).
+    """
+    lock = _write_locks.get(match_id)
+    if lock is None:
+        lock = _write_locks[match_id] = asyncio.Lock()
+    async with lock:
+        row, items = await run_db(write, match_id, payload)
+        hub = get_hub()
+        for item in items:
+            hub.publish(match_id, _message(item))
+    return row
+
+
+def sse_frame(cursor: str, message: Message) -> str:
+    return f"id: {cursor}\nevent: {message.item.type}\ndata: {message.data}\n\n"
+
+
+def ws_frame(cursor: str, message: Message) -> str:
+    return f'{{"id":"{cursor}","type":"{message.item.type}","data":{message.data}}}'
+
+
+async def feed(
+    match_id: int,
+    after: Cursor,
+    render: Callable[[str, Message], str],
+    keep_alive: Optional[str] = None,
+    prelude: Optional[str] = None,
+) -> AsyncIterator[str]:
+    """
+    ``render(cursor, message)`` for every entry after ``after``: first the ones
+    already stored, then the live ones as they are published, plus
+    ``keep_alive`` on the hub's heartbeat. It only ends when the subscriber
+    falls behind and is dropped (it should reconnect from its last cursor).
+
+    The subscription starts before the stored entries are read, so an entry
+    written in between is not lost (and is sent once). A single generator,
+    not a chain of them: each level costs as much as the fan-out itself.
+    """
+    hub = get_hub()
+    subscription = hub.subscribe(match_id)
+    try:
+        if prelude is not None:
+            yield prelude
+        replay = await run_db(service.get_feed, match_id, after)
+        sent = {(item.type, item.id) for item in replay}
+        for item in replay:
+            after = advance(after, item)
+            yield render(format_cursor(after), _message(item))
+        while True:
+            message = await subscription.get()
+            if message is None:
+                if keep_alive is not None:
+                    yield keep_alive
+            elif (message.item.type, message.item.id) not in sent:
+                after = advance(after, message.item)
+                yield render(format_cursor(after), message)
+    except SlowConsumer:
+        return
+    finally:
+        hub.unsubscribe(subscription)
+
+
+def sse_stream(match_id: int, after: Cursor) -> AsyncIterator[str]:
+    # EventSource reconnects after `retry` ms with Last-Event-ID, e.g. once a slow consumer is dropped.
+    return feed(match_id, after, sse_frame, keep_alive=": keep-alive\n\n", prelude="retry: 1000\n\n")
+
+
+@router.post("/{match_id}/events", response_model=MatchEvent, status_code=status.HTTP_201_CREATED)
+async def add_event(match_id: int, event: MatchEventCreate):
+    """Registra um evento (gol, cartão...) e o envia aos clientes que acompanham a partida"""
+    try:
+        return await _write_and_publish(match_id, service.add_event, event)
+    except IntegrityError:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Erro de dados: Partida, jogador ou tipo de evento inválido")
+    except SQLAlchemyError as e:
+        raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Erro ao registrar evento: {str(e)}")
+
+
+@router.post("/{match_id}/substitutions", response_model=Substitution, status_code=status.HTTP_201_CREATED)
+async def add_substitution(match_id: int, substitution: SubstitutionCreate):
+    """Registra uma substituição e a envia aos clientes que acompanham a partida"""
+    try:
+        return await _write_and_publish(match_id, service.add_substitution, substitution)
+    except ValueError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except IntegrityError:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Erro de dados: Partida ou jogador inválido")
+    except SQLAlchemyError as e:
+        raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Erro ao registrar substituição: {str(e)}")
+
+
+@router.get("/{match_id}/events", response_model=List[LiveEvent])
+async def get_events(match_id: int, after: Optional[str] = Query(None, description="`id` do último evento recebido")):
+    """Eventos e substituições da partida (a partir de `after`), para quem não usa o stream"""
+    cursor = _cursor(after)
+    await _require_match(match_id)
+    events = []
+    for item in await run_db(service.get_feed, match_id, cursor):
+        cursor = advance(cursor, item)
+        events.append({"id": format_cursor(cursor), "type": item.type, "data": item.data})
+    return events
+
+
+@router.get("/{match_id}/events/stream", response_class=StreamingResponse)
+async def stream_events(
+    match_id: int,
+    after: Optional[str] = Query(None, description="`id` do último evento recebido"),
+    last_event_id: Optional[str] = Header(None),
+):
+    """Server-Sent Events: os eventos já registrados (a partir de `after`/Last-Event-ID) e os novos, ao vivo"""
+    cursor = _cursor(last_event_id or after)
+    await _require_match(match_id)
+    return StreamingResponse(
+        sse_stream(match_id, cursor),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/{match_id}/events/ws")
+async def events_websocket(websocket: WebSocket, match_id: int, after: Optional[str] = None):
+    """The same feed as the SSE stream, one JSON message ({"id", "type", "data"}) per entry."""
+    try:
+        cursor = parse_cursor(after) if after else START
+    except ValueError as e:
+        raise WebSocketException(status.WS_1008_POLICY_VIOLATION, reason=str(e))
+    if not await run_db(service.match_exists, match_id):
+        raise WebSocketException(status.WS_1008_POLICY_VIOLATION, reason="Partida não encontrada")
+    await websocket.accept()
+
+    async def send_feed() -> None:
+        async for frame in feed(match_id, cursor, ws_frame):
+            await websocket.send_text(frame)
+        # The feed only ends when this client fell behind.
+        await websocket.close(WS_SLOW_CONSUMER, reason="Cliente lento: reconecte com after")
+
+    async def wait_disconnect() -> None:
+        # Clients only listen; this notices when they leave while the feed is idle.
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    async with anyio.create_task_group() as tasks:
+        async def run(call) -> None:
+            try:
+                await call()
+            except WebSocketDisconnect:
+                pass
+            tasks.cancel_scope.cancel()
+
+        tasks.start_soon(run, send_feed)
+        tasks.start_soon(run, wait_disconnect)
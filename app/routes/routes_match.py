@@ -0,0 +1,197 @@
+from datetime import date as Date, datetime
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+
+from app.config.concurrency import run_db
+from app.routes.conditional import conditional
+from app.routes.pagination import PageParams
+from app.schemas.match import Match, MatchFixture
+from app.schemas.pagination import Page
+from app.services.MatchService import MAX_FIXTURE_DAYS, MatchService
+from app.routes.instrumentation import TimedRoute
+
+router = APIRouter(prefix="/matches", tags=["matches"], route_class=TimedRoute)
+
+service = MatchService()
+
+
+def _after(page: PageParams) -> Optional[Tuple[datetime, int]]:
+    """(date, id) of the last match of the previous page, taken from the cursor."""
+    if page.cursor is None:
+        return None
+    try:
+        return datetime.fromisoformat(page.cursor["date"]), page.after
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Cursor inválido")
+
+
+def _integrity_detail(e: IntegrityError) -> str:
+    if "foreign key" in str(e.orig).lower():
+        return "Erro de dados: Time, campeonato ou estádio inválido"
+    return "Erro de dados: Dados inválidos"
+
+
+@router.post("/", response_model=Match, status_code=status.HTTP_201_CREATED)
+async def create_match(match_input: Match):
+    try:
+        return await run_db(
+            service.create_match,
+            match_input.home_team_id,
+            match_input.away_team_id,
+            match_input.championship_id,
+            match_input.date,
+            match_input.stadium_id,
+            match_input.home_score,
+            match_input.away_score,
+        )
+    except ValueError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except IntegrityError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=_integrity_detail(e))
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao criar partida: {str(e)}",
+        )
+
+
+@router.get(
+    "/",
+    response_model=Page[Match],
+    dependencies=[Depends(conditional("matches", "championships"))],
+)
+async def get_matches(
+    request: Request,
+    championship_id: Optional[int] = None,
+    team_id: Optional[int] = Query(None, description="Mandante ou visitante"),
+    stadium_id: Optional[int] = None,
+    season: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = Query(None, description="Exclusivo"),
+    page: PageParams = Depends(),
+):
+    """Partidas filtradas, ordenadas por data, uma página por vez"""
+    try:
+        matches = await run_db(
+            service.search_matches,
+            championship_id,
+            team_id,
+            stadium_id,
+            season,
+            date_from,
+            date_to,
+            _after(page),
+            page.fetch_limit,
+        )
+        return page.trusted_page(
+            request, matches, Match, fields=lambda match: {"date": match.date.isoformat()}
+        )
+    except ValueError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao buscar partidas: {str(e)}",
+        )
+
+
+@router.get(
+    "/fixtures",
+    response_model=List[MatchFixture],
+    dependencies=[Depends(conditional("matches", "teams", "championships", "stadiums"))],
+)
+async def get_fixtures(
+    date: Date,
+    days: int = Query(1, ge=1, le=MAX_FIXTURE_DAYS),
+    championship_id: Optional[int] = None,
+):
+    """Jogos de uma rodada (a partir de `date`, por `days` dias) com os nomes dos times e do estádio"""
+    try:
+        return await run_db(service.get_fixtures, date, days, championship_id)
+    except ValueError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao buscar jogos: {str(e)}",
+        )
+
+
+@router.get(
+    "/head-to-head",
+    response_model=List[Match],
+    dependencies=[Depends(conditional("matches"))],
+)
+async def get_head_to_head(home_team_id: int, away_team_id: int):
+    """Partidas entre um mandante e um visitante, ordenadas por data"""
+    try:
+        return await run_db(service.get_head_to_head, home_team_id, away_team_id)
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao buscar partidas: {str(e)}",
+        )
+
+
+@router.get(
+    "/{match_id}",
+    response_model=Match,
+    dependencies=[Depends(conditional("matches"))],
+)
+async def get_match(match_id: int):
+    try:
+        match = await run_db(service.get_match, match_id)
+        if not match:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Partida não encontrada")
+        return match
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao buscar partida: {str(e)}",
+        )
+
+
+@router.put("/{match_id}", response_model=Match)
+async def update_match(match_id: int, match_data: Match):
+    try:
+        match = await run_db(
+            service.update_match,
+            match_id,
+            home_team_id=match_data.home_team_id,
+            away_team_id=match_data.away_team_id,
+            championship_id=match_data.championship_id,
+            date=match_data.date,
+            stadium_id=match_data.stadium_id,
+            home_score=match_data.home_score,
+            away_score=match_data.away_score,
+        )
+        if not match:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Partida não encontrada")
+        return match
+    except ValueError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except IntegrityError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=_integrity_detail(e))
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao atualizar partida: {str(e)}",
+        )
+
+
+@router.delete("/{match_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_match(match_id: int):
+    try:
+        deleted = await run_db(service.delete_match, match_id)
+        if not deleted:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Partida não encontrada")
+    except IntegrityError:
+        raise HTTPException(
+            status.HTTP_409_CONFLICT, detail="Partida possui eventos, substituições ou escalações"
+        )
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao excluir partida: {str(e)}",
+        )
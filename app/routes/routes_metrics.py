@@ -0,0 +1,16 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.config.metrics import get_metrics
+from app.routes.instrumentation import TimedRoute
+
+router = APIRouter(
+    tags=["health"],
+    route_class=TimedRoute,
+)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Request, query and serialization metrics of this worker in the Prometheus text format"""
+    return PlainTextResponse(get_metrics().render(), media_type="text/plain; version=0.0.4")
@@ -1,19 +1,33 @@
-from typing import List
-from fastapi import APIRouter, HTTPException, status
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
-from app.schemas.player import Player, Position, PlayerOutput
-from app.services.PlayerService import PlayerService
-
-router = APIRouter(prefix="/players", tags=["players"])
+from app.schemas.player import Player, PlayerCareer, Position, PlayerOutput
+from app.config.concurrency import run_db
+from app.routes.conditional import conditional
+from app.routes.pagination import PageParams
+from app.routes.batch import BatchLoader, batch_ids, batch_result
+from app.routes.params import Fields, id_list
+from app.routes.responses import projection
+from app.schemas.batch import Batch
+from app.schemas.bulk import BulkCreateResult
+from app.schemas.pagination import Page
+from app.services.PlayerService import CAREER_TABLES, PlayerService
+from app.services.bulk import BulkMode, BulkValidationError
+from app.routes.instrumentation import TimedRoute
+
+router = APIRouter(prefix="/players", tags=["players"], route_class=TimedRoute)
 
 service = PlayerService()
+# Concurrent GET /players/{player_id} calls are answered by one query.
+player_loader = BatchLoader(service.get_players_by_ids)
 
 
 @router.post("/", response_model=Player, status_code=status.HTTP_201_CREATED)
 async def create_player(player_input: Player):
     try:
-        return service.create_player(
+        return await run_db(
+            service.create_player,
             player_input.name,
             player_input.birth_date,
             player_input.country_id,
@@ -38,10 +52,17 @@ async def create_player(player_input: Player):
         )
 
 
-@router.post("/list/", response_model=List[Player], status_code=status.HTTP_201_CREATED)
-async def create_list(players: List[Player]):
+@router.post(
+    "/list/", response_model=BulkCreateResult[Player], status_code=status.HTTP_201_CREATED
+)
+async def create_list(players: List[Player], mode: BulkMode = BulkMode.atomic):
     try:
-        return service.create_players(players)
+        return await run_db(service.create_players, players, mode)
+    except BulkValidationError as e:
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST,
+            detail=[error.model_dump() for error in e.errors],
+        )
     except ValueError as e:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e))
     except IntegrityError as e:
@@ -56,10 +77,31 @@ async def create_list(players: List[Player]):
         )
 
 
-@router.get("/", response_model=List[Player])
-async def get_all_players():
+@router.get(
+    "",
+    response_model=Batch[PlayerOutput],
+    dependencies=[Depends(conditional("players", "countries", "positions", "teams"))],
+)
+async def get_players_by_ids(ids: List[int] = Depends(batch_ids)):
+    """Jogadores (com posição, time e país) pedidos em `?ids=1,2,3`, em uma consulta, na ordem pedida"""
+    try:
+        return batch_result(ids, await run_db(service.get_players_by_ids, ids))
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao buscar jogadores: {str(e)}",
+        )
+
+
+@router.get("/", response_model=Page[Player], dependencies=[Depends(conditional("players"))])
+async def get_all_players(
+    request: Request,
+    page: PageParams = Depends(),
+    fields: Optional[Tuple[str, ...]] = Depends(Fields(Player)),
+):
     try:
-        return service.get_all_players()
+        players = await run_db(service.get_all_players, page.after, page.fetch_limit, fields)
+        return page.trusted_page(request, players, projection(Player, fields))
     except SQLAlchemyError as e:
         raise HTTPException(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -67,13 +109,67 @@ async def get_all_players():
         )
 
 
+@router.get(
+    "/positions",
+    response_model=List[Position],
+    dependencies=[Depends(conditional("positions"))],
+)
+async def get_positions():
+    try:
+        return await run_db(service.get_positions)
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao buscar posições: {str(e)}",
+        )
+
+
+@router.get(
+    "/details",
+    response_model=List[PlayerOutput],
+    dependencies=[Depends(conditional("players", "countries", "positions", "teams"))],
+    deprecated=True,
+)
+async def get_players_details(ids: List[int] = Depends(id_list)):
+    """Obsoleto: use `GET /players?ids=1,2,3`, que também informa os IDs não encontrados"""
+    try:
+        return await run_db(service.get_players_details, ids)
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao buscar jogadores: {str(e)}",
+        )
+
+
+@router.get(
+    "/{player_id}/career",
+    response_model=PlayerCareer,
+    dependencies=[Depends(conditional(*CAREER_TABLES))],
+)
+async def get_player_career(player_id: int):
+    """Jogos, gols, assistências e cartões do jogador por temporada e time, com os totais"""
+    try:
+        career = await run_db(service.get_player_career, player_id)
+        if not career:
+            raise HTTPException(
+                status.HTTP_404_NOT_FOUND, detail="Jogador não encontrado"
+            )
+        return career
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao buscar carreira: {str(e)}",
+        )
+
+
 @router.get(
     "/{player_id}",
     response_model=PlayerOutput,
+    dependencies=[Depends(conditional("players", "countries", "positions", "teams"))],
 )
 async def get_player(player_id: int):
     try:
-        player = service.get_player(player_id)
+        player = await player_loader.load(player_id)
         if not player:
             raise HTTPException(
                 status.HTTP_404_NOT_FOUND, detail="Jogador não encontrado"
@@ -89,7 +185,8 @@ async def get_player(player_id: int):
 @router.put("/{player_id}", response_model=Player)
 async def update_player(player_id: int, player_data: Player):
     try:
-        updated_player = service.update_player(
+        updated_player = await run_db(
+            service.update_player,
             player_id=player_id,
             name=player_data.name,
             birth_date=player_data.birth_date,
@@ -119,7 +216,7 @@ async def update_player(player_id: int, player_data: Player):
 @router.delete("/{player_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_player(player_id: int):
     try:
-        deleted = service.delete_player(player_id)
+        deleted = await run_db(service.delete_player, player_id)
         if not deleted:
             raise HTTPException(
                 status.HTTP_404_NOT_FOUND, detail="Jogador não encontrado"
@@ -137,7 +234,7 @@ async def delete_player(player_id: int):
 async def create_positions(positions: List[Position]):
     try:
         names = [p.name for p in positions]
-        return service.create_positions(names)
+        return await run_db(service.create_positions, names)
     except ValueError as e:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e))
     except IntegrityError as e:
@@ -0,0 +1,28 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
+from app.config.concurrency import run_db
+from app.routes.conditional import conditional
+from app.repositories.searchRepository import SEARCHABLE
+from app.services.SearchService import SearchEntity, SearchService
+from app.schemas.search import SearchResult
+from app.routes.instrumentation import TimedRoute
+
+router = APIRouter(
+    prefix="/search",
+    tags=["search"],
+    route_class=TimedRoute,
+)
+
+search_service = SearchService()
+
+SEARCH_TABLES = tuple(model.__tablename__ for model in SEARCHABLE.values())
+
+
+@router.get("", response_model=List[SearchResult], dependencies=[Depends(conditional(*SEARCH_TABLES))])
+async def search(
+    q: str = Query(..., min_length=1, max_length=100, description="Nome ou parte do nome"),
+    type: Optional[List[SearchEntity]] = Query(None, description="Restringe a busca a estes tipos"),
+    limit: int = Query(20, ge=1, le=100),
+):
+    """Search teams, players, championships, stadiums and countries by name (accent and typo tolerant, prefix autocomplete)"""
+    return await run_db(search_service.search, q, type, limit)
@@ -1,33 +1,60 @@
-from typing import List
-from fastapi import APIRouter, HTTPException
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Request
+from app.config.concurrency import run_db
+from app.routes.conditional import conditional
+from app.routes.batch import BatchLoader, batch_ids, batch_result
+from app.routes.pagination import PageParams
+from app.routes.params import Fields
+from app.routes.responses import projection
+from app.schemas.batch import Batch
 from app.services.stadiumService import StadiumService
+from app.schemas.pagination import Page
 from app.schemas.stadium import Stadium
+from app.routes.instrumentation import TimedRoute
 
 router = APIRouter(
     prefix="/stadiums",  # Changed from "/stadium" to "/stadiums" for RESTful convention
     tags=["stadiums"],   # Changed to plural for consistency
+    route_class=TimedRoute,
 )
 
 stadium_service = StadiumService()
+# Concurrent GET /stadiums/{stadium_id} calls are answered by one query (none for the cached ones).
+stadium_loader = BatchLoader(stadium_service.find_stadiums_by_ids)
 
 @router.post("/", response_model=Stadium, status_code=201)
 async def add_stadium(stadium_input: Stadium):
     """Create a new stadium"""
-    stadium = stadium_service.create_stadium(
+    stadium = await run_db(
+        stadium_service.create_stadium,
         stadium_input.name,
         stadium_input.city,
         stadium_input.country_id)
     return stadium
 
-@router.get("/", response_model=List[Stadium])
-async def get_all_stadiums():
-    """Get all stadiums"""
-    return stadium_service.get_all_stadiums()
+@router.get("", response_model=Batch[Stadium], dependencies=[Depends(conditional("stadiums"))])
+async def get_stadiums_by_ids(ids: List[int] = Depends(batch_ids)):
+    """Get several stadiums by ID (`?ids=1,2,3`), in the order asked"""
+    return batch_result(ids, await run_db(stadium_service.find_stadiums_by_ids, ids))
 
-@router.get("/{stadium_id}", response_model=Stadium)
+@router.get("/", response_model=Page[Stadium], dependencies=[Depends(conditional("stadiums"))])
+async def get_all_stadiums(
+    request: Request,
+    page: PageParams = Depends(),
+    fields: Optional[Tuple[str, ...]] = Depends(Fields(Stadium)),
+):
+    """Get all stadiums, one page at a time"""
+    stadiums = await run_db(stadium_service.get_all_stadiums, page.after, page.fetch_limit, fields)
+    return page.trusted_page(request, stadiums, projection(Stadium, fields))
+
+@router.get(
+    "/{stadium_id}",
+    response_model=Stadium,
+    dependencies=[Depends(conditional("stadiums"))],
+)
 async def get_stadium(stadium_id: int):
     """Get a specific stadium by ID"""
-    stadium = stadium_service.find_stadium_by_id(stadium_id)
+    stadium = await stadium_loader.load(stadium_id)
     if not stadium:
         raise HTTPException(status_code=404, detail="Stadium not found")
     return stadium
@@ -35,7 +62,8 @@ async def get_stadium(stadium_id: int):
 @router.put("/{stadium_id}", response_model=Stadium)
 async def update_stadium(stadium_id: int, stadium: Stadium):
     """Update stadium information"""
-    updated_stadium = stadium_service.update_stadium(
+    updated_stadium = await run_db(
+        stadium_service.update_stadium,
         stadium_id=stadium_id,
         name=stadium.name,
         city=stadium.city,
@@ -48,6 +76,6 @@ async def update_stadium(stadium_id: int, stadium: Stadium):
 @router.delete("/{stadium_id}")
 async def delete_stadium(stadium_id: int):
     """Delete a stadium"""
-    if not stadium_service.delete_stadium(stadium_id):
+    if not await run_db(stadium_service.delete_stadium, stadium_id):
         raise HTTPException(status_code=404, detail="Stadium not found")
     return {"message": "Stadium deleted successfully"}
\ No newline at end of file
@@ -1,24 +1,39 @@
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, status
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
-from app.services.teamService import TeamService
+from app.config.concurrency import run_db
+from app.routes.conditional import conditional
+from app.routes.batch import BatchLoader, batch_ids, batch_result
+from app.routes.pagination import PageParams
+from app.routes.params import Fields, Include
+from app.routes.responses import projection
+from app.schemas.batch import Batch
+from app.schemas.pagination import Page
+from app.schemas.squad import Squad
+from app.services.teamService import SQUAD_RELATIONS, SQUAD_TABLES, TeamService
 from app.schemas.team import Team
 from app.schemas.team import ChampionshipParticipation
-from app.schemas.player import Player
+from app.schemas.player import Player, PlayerCareer
+from app.services.PlayerService import CAREER_TABLES
+from app.routes.instrumentation import TimedRoute
 
 router = APIRouter(
     prefix="/teams",
     tags=["teams"],
+    route_class=TimedRoute,
 )
 
 team_service = TeamService()
+# Concurrent GET /teams/{team_id} calls are answered by one query.
+team_loader = BatchLoader(team_service.get_teams_by_ids)
 
 @router.post("/", response_model=Team, status_code=201)
 async def add_team(team_input: Team):
     """Create a new team"""
     try:
-        team = team_service.create_team(
+        team = await run_db(
+            team_service.create_team,
             name=team_input.name,
             country_id=team_input.country_id,
             nickname=team_input.nickname,
@@ -46,22 +61,38 @@ async def add_team(team_input: Team):
             detail=f"Erro ao criar time: {str(e)}"
         )
 
-@router.get("/", response_model=List[Team])
-async def get_all_teams():
-    """Get all teams"""
+@router.get("", response_model=Batch[Team], dependencies=[Depends(conditional("teams"))])
+async def get_teams_by_ids(ids: List[int] = Depends(batch_ids)):
+    """Get several teams by ID (`?ids=1,2,3`) in one query, in the order asked"""
     try:
-        return team_service.get_all_teams()
+        return batch_result(ids, await run_db(team_service.get_teams_by_ids, ids))
     except SQLAlchemyError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Erro ao buscar times: {str(e)}"
         )
 
-@router.get("/{team_id}", response_model=Team)
+@router.get("/", response_model=Page[Team], dependencies=[Depends(conditional("teams"))])
+async def get_all_teams(
+    request: Request,
+    page: PageParams = Depends(),
+    fields: Optional[Tuple[str, ...]] = Depends(Fields(Team)),
+):
+    """Get all teams, one page at a time"""
+    try:
+        teams = await run_db(team_service.get_all_teams, page.after, page.fetch_limit, fields)
+        return page.trusted_page(request, teams, projection(Team, fields))
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao buscar times: {str(e)}"
+        )
+
+@router.get("/{team_id}", response_model=Team, dependencies=[Depends(conditional("teams"))])
 async def get_team(team_id: int):
     """Get a specific team by ID"""
     try:
-        team = team_service.get_team(team_id)
+        team = await team_loader.load(team_id)
         if not team:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -79,7 +110,8 @@ async def get_team(team_id: int):
 async def update_team(team_id: int, team: Team):
     """Update team information"""
     try:
-        updated_team = team_service.update_team(
+        updated_team = await run_db(
+            team_service.update_team,
             team_id=team_id,
             name=team.name,
             country_id=team.country_id,
@@ -113,7 +145,7 @@ async def update_team(team_id: int, team: Team):
 async def delete_team(team_id: int):
     """Delete a team"""
     try:
-        deleted = team_service.delete_team(team_id)
+        deleted = await run_db(team_service.delete_team, team_id)
         if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -127,23 +159,76 @@ async def delete_team(team_id: int):
             detail=f"Erro ao excluir time: {str(e)}"
         )
 
-@router.get("/{team_id}/players", response_model=List[Player])
-async def get_players_by_team(team_id: int):
-    """Get all players from a team"""
+@router.get(
+    "/{team_id}/players",
+    response_model=Page[Player],
+    dependencies=[Depends(conditional("players", "teams"))],
+)
+async def get_players_by_team(
+    team_id: int,
+    request: Request,
+    page: PageParams = Depends(),
+    fields: Optional[Tuple[str, ...]] = Depends(Fields(Player)),
+):
+    """Get the players from a team, one page at a time"""
     try:
-        players = team_service.get_players_by_team(team_id)
-        if not players:  # Se quiser retornar 404 quando não houver jogadores
+        players = await run_db(team_service.get_players_by_team, team_id, page.after, page.fetch_limit, fields)
+        if not players and page.after is None:  # Se quiser retornar 404 quando não houver jogadores
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No players found for this team"
             )
-        return players
+        return page.trusted_page(request, players, projection(Player, fields))
         
     except SQLAlchemyError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Erro ao buscar jogadores: {str(e)}"
         )
+
+@router.get(
+    "/{team_id}/squad",
+    response_model=Squad,
+    response_model_exclude_unset=True,
+    dependencies=[Depends(conditional(*SQUAD_TABLES))],
+)
+async def get_team_squad(team_id: int, include: Tuple[str, ...] = Depends(Include(*SQUAD_RELATIONS))):
+    """Team with its country, championship participations and players (with position and nationality names)"""
+    try:
+        squad = await run_db(team_service.get_squad, team_id, include)
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao buscar elenco: {str(e)}"
+        )
+    if squad is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Time não encontrado"
+        )
+    return squad
+
+@router.get(
+    "/{team_id}/players/career",
+    response_model=List[PlayerCareer],
+    dependencies=[Depends(conditional(*CAREER_TABLES))],
+)
+async def get_players_career(team_id: int):
+    """Career totals of every player in the team's squad, in one aggregated query"""
+    try:
+        careers = await run_db(team_service.get_players_career, team_id)
+        if careers is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Time não encontrado"
+            )
+        return careers
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao buscar carreiras: {str(e)}"
+        )
+
 @router.post(
     "/{team_id}/participations", 
     response_model=ChampionshipParticipation,
@@ -163,7 +248,8 @@ async def create_participation(
     Adiciona um time a um campeonato (cria participação)
     """
     try:
-        return team_service.create_championship_participation(
+        return await run_db(
+            team_service.create_championship_participation,
             championship_id=participation.championship_id,
             team_id=team_id,
             season=participation.season
@@ -199,7 +285,7 @@ async def delete_participation(participation_id: int):
     Remove uma participação de time em campeonato
     """
     try:
-        success = team_service.delete_championship_participation(participation_id)
+        success = await run_db(team_service.delete_championship_participation, participation_id)
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -219,13 +305,16 @@ async def delete_participation(participation_id: int):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Erro ao remover participação: {str(e)}"
         )
-@router.get("/{team_id}/participations")
+@router.get(
+    "/{team_id}/participations",
+    dependencies=[Depends(conditional("championship_participations", "championships"))],
+)
 async def get_participations_by_team(team_id: int):
     """
     Lista todas as participações de campeonato de um time, incluindo nome e ano do campeonato.
     """
     try:
-        participations = team_service.get_participations_by_team(team_id)
+        participations = await run_db(team_service.get_participations_by_team, team_id)
         if not participations:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
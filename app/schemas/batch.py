@@ -0,0 +1,15 @@
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Batch(BaseModel, Generic[T]):
+    """
+    Result of a batch lookup (``?ids=``): ``items[i]`` is the entity of the
+    i-th requested ID, or null if it does not exist; ``missing`` lists those IDs.
+    """
+
+    items: List[Optional[T]]
+    missing: List[int] = []
@@ -0,0 +1,29 @@
+from typing import Generic, List, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class RowError(BaseModel):
+    """Error for one item of a bulk request; ``index`` is its position in the payload."""
+
+    index: int
+    detail: str
+
+
+class BulkCreateResult(BaseModel, Generic[T]):
+    """Outcome of a bulk create: the rows created and the items rejected."""
+
+    created: List[T]
+    errors: List[RowError] = []
+
+
+class ImportReport(BaseModel):
+    """Outcome of a streaming import. Only the first errors are kept; ``error_count`` has the total."""
+
+    entity: str
+    processed: int = 0
+    inserted: int = 0
+    error_count: int = 0
+    errors: List[RowError] = []
@@ -1,5 +1,6 @@
 from typing import Optional, List
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 
 
 
@@ -7,6 +8,10 @@ from sqlmodel import SQLModel, Field, Relationship
 class Championship(SQLModel, table=True):
     """Championship object."""
     __tablename__ = "championships"
+    __table_args__ = (
+        Index("ix_championships_name", "name"),
+        Index("ix_championships_season", "season"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=100, nullable=False)
@@ -17,4 +22,4 @@ class Championship(SQLModel, table=True):
     country: Optional["Country"] = Relationship(back_populates="championships")
     participations: List["ChampionshipParticipation"] = Relationship(
         back_populates="championship",
-        sa_relationship_kwargs={"lazy": "selectin"})
\ No newline at end of file
+        sa_relationship_kwargs={"lazy": "raise"})
\ No newline at end of file
@@ -1,4 +1,5 @@
 from typing import List, Optional
+from pydantic import BaseModel
 from sqlmodel import SQLModel, Field, Relationship
 
 class Country(SQLModel, table=True):
@@ -8,4 +9,30 @@ class Country(SQLModel, table=True):
     championships: List["Championship"] = Relationship(back_populates="country")
     stadiums: List["Stadium"] = Relationship(back_populates="country")
     players: List["Player"] = Relationship(back_populates="country")
-    teams: List["Team"] = Relationship(back_populates="country")
\ No newline at end of file
+    teams: List["Team"] = Relationship(back_populates="country")
+
+
+class CountrySummary(SQLModel, table=True):
+    """Materialized counters of a country: how many teams, players, stadiums and championships it has.
+
+    Kept up to date by the repositories that write those tables, in the same
+    transaction (see app/repositories/countrySummaryRepository.py).
+    """
+    __tablename__ = "country_summaries"
+
+    country_id: int = Field(foreign_key="countries.id", primary_key=True)
+    teams: int = Field(default=0, nullable=False)
+    players: int = Field(default=0, nullable=False)
+    stadiums: int = Field(default=0, nullable=False)
+    championships: int = Field(default=0, nullable=False)
+
+
+class CountrySummaryRow(BaseModel):
+    """Country summary output schema."""
+
+    country_id: int
+    country: str
+    teams: int = 0
+    players: int = 0
+    stadiums: int = 0
+    championships: int = 0
@@ -0,0 +1,22 @@
+from app.schemas.championship import Championship
+from app.schemas.country import Country
+from app.schemas.match import EventType, Lineup, Match, MatchEvent, Substitution
+from app.schemas.player import Player, Position
+from app.schemas.stadium import Stadium
+from app.schemas.team import ChampionshipParticipation, Team
+
+# Table models by the entity name used in the import/export endpoints.
+ENTITIES = {
+    "country": Country,
+    "position": Position,
+    "event_type": EventType,
+    "stadium": Stadium,
+    "team": Team,
+    "player": Player,
+    "championship": Championship,
+    "participation": ChampionshipParticipation,
+    "match": Match,
+    "match_event": MatchEvent,
+    "substitution": Substitution,
+    "lineup": Lineup,
+}
@@ -0,0 +1,31 @@
+from typing import Any, Dict, Literal
+
+from pydantic import BaseModel, Field
+
+
+class MatchEventCreate(BaseModel):
+    """Goal, card... appended to a match while it is played."""
+
+    player_id: int
+    event_type_id: int
+    minute: int = Field(ge=0)
+
+
+class SubstitutionCreate(BaseModel):
+    """Substitution appended to a match while it is played."""
+
+    player_out_id: int
+    player_in_id: int
+    minute: int = Field(ge=0)
+
+
+class LiveEvent(BaseModel):
+    """
+    Entry of a match feed: a MatchEvent (``type`` "event") or a Substitution,
+    with the row in ``data``. ``id`` is the cursor to resume the feed after
+    this entry (``after`` / ``Last-Event-ID``).
+    """
+
+    id: str
+    type: Literal["event", "substitution"]
+    data: Dict[str, Any]
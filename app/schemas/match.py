@@ -1,7 +1,9 @@
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List
+from pydantic import BaseModel
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
+from sqlalchemy.orm import backref
 
 from app.schemas.championship import Championship
 from app.schemas.player import Player
@@ -11,20 +13,37 @@ from app.schemas.team import Team
 class Match(SQLModel, table=True):
     """Match object."""
     __tablename__ = "matches"
+    __table_args__ = (
+        Index("ix_matches_championship_id", "championship_id", "date"),
+        Index("ix_matches_home_team_id", "home_team_id", "away_team_id"),
+        Index("ix_matches_away_team_id", "away_team_id"),
+        Index("ix_matches_stadium_id", "stadium_id"),
+        Index("ix_matches_date", "date"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    home_team_id: int = Field(foreign_key="team.id", nullable=False)
-    away_team_id: int = Field(foreign_key="team.id", nullable=False)
-    championship_id: int = Field(foreign_key="championship.id", nullable=False)
+    home_team_id: int = Field(foreign_key="teams.id", nullable=False)
+    away_team_id: int = Field(foreign_key="teams.id", nullable=False)
+    championship_id: int = Field(foreign_key="championships.id", nullable=False)
     date: datetime = Field(nullable=False)
-    stadium_id: int = Field(foreign_key="stadium.id", nullable=False)
+    stadium_id: int = Field(foreign_key="stadiums.id", nullable=False)
     home_score: Optional[int] = Field(default=None)
     away_score: Optional[int] = Field(default=None)
 
+    # Collections are never loaded implicitly (lazy="raise"): each repository
+    # query opts into selectinload/joinedload for the relations it returns.
     home_team: Optional["Team"] = Relationship(sa_relationship_kwargs={"foreign_keys": "Match.home_team_id"})
     away_team: Optional["Team"] = Relationship(sa_relationship_kwargs={"foreign_keys": "Match.away_team_id"})
-    championship: Optional["Championship"] = Relationship(back_populates="matches")
-    stadium: Optional["Stadium"] = Relationship(back_populates="matches")
+    # Championship.matches and Stadium.matches are created as backrefs so the
+    # parent schemas do not need to import this module.
+    championship: Optional["Championship"] = Relationship(
+        sa_relationship_kwargs={"backref": backref("matches", lazy="raise")})
+    stadium: Optional["Stadium"] = Relationship(
+        sa_relationship_kwargs={"backref": backref("matches", lazy="raise")})
+
+    events: List["MatchEvent"] = Relationship(back_populates="match", sa_relationship_kwargs={"lazy": "raise"})
+    substitutions: List["Substitution"] = Relationship(back_populates="match", sa_relationship_kwargs={"lazy": "raise"})
+    lineups: List["Lineup"] = Relationship(back_populates="match", sa_relationship_kwargs={"lazy": "raise"})
 
     # Constraint: home_team_id != away_team_id (Pydantic validation)
     class Config:
@@ -34,8 +53,21 @@ class Match(SQLModel, table=True):
                 raise ValueError("home_team_id and away_team_id must be different")
             return True
 
-Championship.matches = Relationship(back_populates="championship", sa_relationship_kwargs={"lazy": "selectin"})
-Stadium.matches = Relationship(back_populates="stadium", sa_relationship_kwargs={"lazy": "selectin"})
+class MatchFixture(BaseModel):
+    """Match with the names of the teams, championship and stadium."""
+
+    id: int
+    date: datetime
+    championship_id: int
+    championship: str
+    home_team_id: int
+    home_team: str
+    away_team_id: int
+    away_team: str
+    stadium_id: int
+    stadium: str
+    home_score: Optional[int] = None
+    away_score: Optional[int] = None
 
 class EventType(SQLModel, table=True):
     """Event Type object."""
@@ -44,33 +76,42 @@ class EventType(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=50, unique=True, nullable=False)
 
+    events: List["MatchEvent"] = Relationship(back_populates="event_type", sa_relationship_kwargs={"lazy": "raise"})
+
 class MatchEvent(SQLModel, table=True):
     """Match Event object."""
     __tablename__ = "match_events"
+    __table_args__ = (
+        Index("ix_match_events_match_id", "match_id"),
+        Index("ix_match_events_player_id", "player_id"),
+        Index("ix_match_events_event_type_id", "event_type_id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    match_id: int = Field(foreign_key="match.id", nullable=False)
-    player_id: int = Field(foreign_key="player.id", nullable=False)
-    event_type_id: int = Field(foreign_key="event_type.id", nullable=False)
+    match_id: int = Field(foreign_key="matches.id", nullable=False)
+    player_id: int = Field(foreign_key="players.id", nullable=False)
+    event_type_id: int = Field(foreign_key="event_types.id", nullable=False)
     minute: int = Field(nullable=False)
 
     match: Optional["Match"] = Relationship(back_populates="events")
-    player: Optional["Player"] = Relationship(back_populates="events")
+    player: Optional["Player"] = Relationship(
+        sa_relationship_kwargs={"backref": backref("events", lazy="raise")})
     event_type: Optional["EventType"] = Relationship(back_populates="events")
 
-Match.events = Relationship(back_populates="match", sa_relationship_kwargs={"lazy": "selectin"})
-Player.events = Relationship(back_populates="player", sa_relationship_kwargs={"lazy": "selectin"})
-EventType.events = Relationship(back_populates="event_type", sa_relationship_kwargs={"lazy": "selectin"})
-
 
 class Substitution(SQLModel, table=True):
     """Substitution object."""
     __tablename__ = "substitutions"
+    __table_args__ = (
+        Index("ix_substitutions_match_id", "match_id"),
+        Index("ix_substitutions_player_in_id", "player_in_id"),
+        Index("ix_substitutions_player_out_id", "player_out_id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    match_id: int = Field(foreign_key="match.id", nullable=False)
-    player_out_id: int = Field(foreign_key="player.id", nullable=False)
-    player_in_id: int = Field(foreign_key="player.id", nullable=False)
+    match_id: int = Field(foreign_key="matches.id", nullable=False)
+    player_out_id: int = Field(foreign_key="players.id", nullable=False)
+    player_in_id: int = Field(foreign_key="players.id", nullable=False)
     minute: int = Field(nullable=False)
 
     match: Optional["Match"] = Relationship(back_populates="substitutions")
@@ -85,25 +126,25 @@ class Substitution(SQLModel, table=True):
                 raise ValueError("player_out_id and player_in_id must be different")
             return True
 
-Match.substitutions = Relationship(back_populates="match", sa_relationship_kwargs={"lazy": "selectin"})
-
 class Lineup(SQLModel, table=True):
     """Lineup object."""
     __tablename__ = "lineups"
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    match_id: int = Field(foreign_key="match.id", nullable=False)
-    team_id: int = Field(foreign_key="team.id", nullable=False)
-    player_id: int = Field(foreign_key="player.id", nullable=False)
+    match_id: int = Field(foreign_key="matches.id", nullable=False)
+    team_id: int = Field(foreign_key="teams.id", nullable=False)
+    player_id: int = Field(foreign_key="players.id", nullable=False)
     position: Optional[str] = Field(max_length=50, default=None)
 
     match: Optional["Match"] = Relationship(back_populates="lineups")
-    team: Optional["Team"] = Relationship(back_populates="lineups")
-    player: Optional["Player"] = Relationship(back_populates="lineups")
+    team: Optional["Team"] = Relationship(
+        sa_relationship_kwargs={"backref": backref("lineups", lazy="raise")})
+    player: Optional["Player"] = Relationship(
+        sa_relationship_kwargs={"backref": backref("lineups", lazy="raise")})
 
     # Constraint: unique(match_id, team_id, player_id)
-    __table_args__ = (UniqueConstraint("match_id", "team_id", "player_id"),)
-
-Match.lineups = Relationship(back_populates="match", sa_relationship_kwargs={"lazy": "selectin"})
-Team.lineups = Relationship(back_populates="team", sa_relationship_kwargs={"lazy": "selectin"})
-Player.lineups = Relationship(back_populates="player", sa_relationship_kwargs={"lazy": "selectin"})
\ No newline at end of file
+    __table_args__ = (
+        UniqueConstraint("match_id", "team_id", "player_id"),
+        Index("ix_lineups_team_id", "team_id"),
+        Index("ix_lineups_player_id", "player_id"),
+    )
@@ -0,0 +1,12 @@
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """Page of a list endpoint. ``next`` is the URL of the following page, if any."""
+
+    items: List[T]
+    next: Optional[str] = None
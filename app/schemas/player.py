@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 
 from app.schemas.country import Country
 from app.schemas.team import Team
@@ -11,6 +12,12 @@ class Player(SQLModel, table=True):
     """Player object."""
 
     __tablename__ = "players"
+    # Same indexes as database/migrations/V001__access_path_indexes.sql
+    __table_args__ = (
+        Index("ix_players_team_id", "team_id", "id"),
+        Index("ix_players_country_id", "country_id", "id"),
+        Index("ix_players_name", "name"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=100, nullable=False)
@@ -44,3 +51,33 @@ class PlayerOutput(BaseModel):
     country: Optional[str] = None
     position: Optional[str] = None
     team: Optional[str] = None
+
+
+class CareerTotals(BaseModel):
+    """Career counters of a player."""
+
+    appearances: int = 0
+    starts: int = 0
+    subbed_on: int = 0
+    subbed_off: int = 0
+    goals: int = 0
+    assists: int = 0
+    yellow_cards: int = 0
+    red_cards: int = 0
+
+
+class CareerRow(CareerTotals):
+    """Career counters of a player in one season for one team."""
+
+    season: Optional[str] = None
+    team_id: Optional[int] = None
+    team: Optional[str] = None
+
+
+class PlayerCareer(BaseModel):
+    """Player career output schema: per season and team, plus the overall totals."""
+
+    player_id: int
+    player: str
+    seasons: List[CareerRow] = []
+    totals: CareerTotals = CareerTotals()
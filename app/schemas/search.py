@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class SearchResult(BaseModel):
+    """Search result output schema: a team, player, championship, stadium or country."""
+
+    entity: str
+    id: int
+    name: str
+    score: float
@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from app.schemas.country import Country
+from app.schemas.team import Team
+
+
+class SquadParticipation(BaseModel):
+    """Participation of the team in a championship, with the championship's name."""
+
+    id: int
+    championship_id: int
+    championship_name: str
+    season: Optional[str] = None
+
+
+class SquadPlayer(BaseModel):
+    """Player of the squad with the names of their position and nationality."""
+
+    id: int
+    name: str
+    birth_date: Optional[datetime] = None
+    position_id: int
+    position: Optional[str] = None
+    country_id: int
+    country: Optional[str] = None
+
+
+class Squad(BaseModel):
+    """
+    Team with its relations embedded. The relations left out of ``include``
+    are omitted from the response (not sent as null).
+    """
+
+    team: Team
+    country: Optional[Country] = None
+    participations: Optional[List[SquadParticipation]] = None
+    players: Optional[List[SquadPlayer]] = None
@@ -1,11 +1,13 @@
 from typing import Optional
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 
 from app.schemas.country import Country
 
 
 class Stadium(SQLModel, table=True):
     __tablename__ = "stadiums"
+    __table_args__ = (Index("ix_stadiums_country_id", "country_id", "id"),)
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=100, nullable=False)
     city: str = Field(max_length=100, nullable=False)
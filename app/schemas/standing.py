@@ -0,0 +1,41 @@
+from typing import Optional
+from pydantic import BaseModel
+from sqlmodel import SQLModel, Field
+
+POINTS_PER_WIN = 3
+POINTS_PER_DRAW = 1
+
+
+class Standing(SQLModel, table=True):
+    """Materialized league table row: a team's totals in a championship.
+
+    Kept up to date by MatchRepository whenever a score is recorded, changed
+    or removed (see app/repositories/standingRepository.py).
+    """
+    __tablename__ = "standings"
+
+    championship_id: int = Field(foreign_key="championships.id", primary_key=True)
+    team_id: int = Field(foreign_key="teams.id", primary_key=True)
+    played: int = Field(default=0, nullable=False)
+    wins: int = Field(default=0, nullable=False)
+    draws: int = Field(default=0, nullable=False)
+    losses: int = Field(default=0, nullable=False)
+    goals_for: int = Field(default=0, nullable=False)
+    goals_against: int = Field(default=0, nullable=False)
+    points: int = Field(default=0, nullable=False)
+
+
+class StandingRow(BaseModel):
+    """League table row output schema."""
+
+    position: int = 0
+    team_id: int
+    team: Optional[str] = None
+    played: int
+    wins: int
+    draws: int
+    losses: int
+    goals_for: int
+    goals_against: int
+    goal_difference: int
+    points: int
@@ -0,0 +1,13 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class PlayerStat(BaseModel):
+    """Leaderboard row output schema."""
+
+    rank: int
+    player_id: int
+    player: Optional[str] = None
+    value: float
+    appearances: int
+    minutes: int
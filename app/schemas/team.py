@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 
 from app.schemas.championship import Championship
 from app.schemas.country import Country
@@ -12,6 +12,10 @@ if TYPE_CHECKING:
 class Team(SQLModel, table=True):
     """Team object."""
     __tablename__ = "teams"
+    __table_args__ = (
+        Index("ix_teams_country_id", "country_id", "id"),
+        Index("ix_teams_name", "name"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=100, nullable=False)
@@ -23,11 +27,15 @@ class Team(SQLModel, table=True):
     players: List["Player"] = Relationship(back_populates="team")
     participations: List["ChampionshipParticipation"] = Relationship(
         back_populates="team",
-        sa_relationship_kwargs={"lazy": "selectin"}
+        sa_relationship_kwargs={"lazy": "raise"}
     )
 
 class ChampionshipParticipation(SQLModel, table=True):
     __tablename__ = "championship_participations"
+    __table_args__ = (
+        UniqueConstraint("championship_id", "team_id", "season", name="unique_participation"),
+        Index("ix_championship_participations_team_id", "team_id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     championship_id: int = Field(foreign_key="championships.id", nullable=False) 
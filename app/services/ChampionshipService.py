@@ -1,8 +1,13 @@
 from typing import List, Optional
+from sqlalchemy.engine import Row
+from app.config.cache import get_cache
 from app.schemas.championship import Championship
 from app.repositories.championshipRepository import ChampionshipRepository
 
 
+CACHE_NAMESPACE = "championship"
+
+
 class ChampionshipService:
     def __init__(self):
         self.repository = ChampionshipRepository()
@@ -10,7 +15,9 @@ class ChampionshipService:
     def find_championship_by_id(self, championship_id: int) -> Championship:
         """Find a championship by its ID."""
         try:
-            championship = self.repository.get_by_id(championship_id)
+            championship = get_cache().get_or_load(
+                CACHE_NAMESPACE, ("id", championship_id), lambda: self.repository.get_by_id(championship_id)
+            )
         except Exception as e:
             raise e
         return championship
@@ -18,7 +25,9 @@ class ChampionshipService:
     def find_championship_by_name(self, name: str) -> Championship:
         """Find a championship by its ID."""
         try:
-            championship = self.repository.get_by_name(name)
+            championship = get_cache().get_or_load(
+                CACHE_NAMESPACE, ("name", name), lambda: self.repository.get_by_name(name)
+            )
         except Exception as e:
             raise e
         return championship
@@ -26,16 +35,20 @@ class ChampionshipService:
     def create_championship(self, name: str, country_id: Optional[int], type: Optional[str], season: Optional[str]) -> Championship:
         """Create a new championship."""
         championship = self.repository.create(name, country_id, type, season)
+        get_cache().invalidate(CACHE_NAMESPACE)
         return championship
 
-    def get_all_championships(self) -> List[Championship]:
-        """Retrieve all championships."""
-        return self.repository.get_all()
+    def get_all_championships(self, after: Optional[int] = None, limit: Optional[int] = None) -> List[Row]:
+        """Retrieve all championships (or one page of them)."""
+        return get_cache().get_or_load(
+            CACHE_NAMESPACE, ("all", after, limit), lambda: self.repository.get_all(after, limit)
+        )
 
     def update_championship(self, championship_id: int, name: Optional[str] = None, country_id: Optional[int] = None,
                             type: Optional[str] = None, season: Optional[str] = None) -> Championship:
         """Update a championship by its ID."""
         championship = self.repository.update(championship_id, name, country_id, type, season)
+        get_cache().invalidate(CACHE_NAMESPACE)
         if not championship:
             raise Exception("Campeonato não encontrado.")
         return championship
@@ -45,4 +58,6 @@ class ChampionshipService:
         championship = self.repository.get_by_id(championship_id)
         if not championship:
             raise Exception("Campeonato não encontrado.")
-        return self.repository.delete(championship_id)
+        deleted = self.repository.delete(championship_id)
+        get_cache().invalidate(CACHE_NAMESPACE)
+        return deleted
@@ -1,19 +1,27 @@
-from typing import List
-from app.schemas.country import Country
-from app.schemas.stadium import Stadium
-from app.schemas.player import Player
-from app.schemas.team import Team
+from typing import Iterable, List, Optional, Sequence
+from sqlalchemy.engine import Row
+from app.config.cache import get_cache
+from app.schemas.bulk import BulkCreateResult
+from app.schemas.country import Country, CountrySummaryRow
 from app.repositories.countryRepository import CountryRepository
+from app.repositories.countrySummaryRepository import CountrySummaryRepository
+from app.services.bulk import BulkMode, bulk_create
+
+
+CACHE_NAMESPACE = "country"
 
 
 class CountryService:
     def __init__(self):
         self.repository = CountryRepository()
+        self.summaries = CountrySummaryRepository()
 
     def find_country_by_id(self, country_id: int) -> Country:
         """Find a country by its ID."""
         try:
-            country = self.repository.get_by_id(country_id)
+            country = get_cache().get_or_load(
+                CACHE_NAMESPACE, ("id", country_id), lambda: self.repository.get_by_id(country_id)
+            )
         except Exception as e:
             raise e
         return country
@@ -21,15 +29,36 @@ class CountryService:
     def create_country(self, name: str) -> Country:
         """Create a new country."""
         country = self.repository.create(name)
+        get_cache().invalidate(CACHE_NAMESPACE)
         return country
 
-    def get_all_countries(self) -> List[Country]:
-        """Retrieve all countries from the database."""
-        return self.repository.get_all()
+    def create_countries(self, names: List[str], mode: BulkMode = BulkMode.atomic) -> BulkCreateResult:
+        """Create many countries in one transaction, validating the whole batch first."""
+        seen = set()
+
+        def validate(name: str) -> dict:
+            name = (name or "").strip()
+            if not name or len(name) > 100:
+                raise ValueError("Nome do país deve ter entre 1 e 100 caracteres")
+            if name in seen:
+                raise ValueError(f"País repetido no lote: '{name}'")
+            seen.add(name)
+            return {"name": name}
+
+        result = bulk_create(names, validate, self.repository.bulk_create, mode)
+        get_cache().invalidate(CACHE_NAMESPACE)
+        return result
+
+    def get_all_countries(self, after: Optional[int] = None, limit: Optional[int] = None) -> List[Row]:
+        """Retrieve all countries (or one page of them) from the database."""
+        return get_cache().get_or_load(
+            CACHE_NAMESPACE, ("all", after, limit), lambda: self.repository.get_all(after, limit)
+        )
 
     def update_country(self, country_id: int, name: str) -> Country:
         """Update a country's name."""
         country = self.repository.update(country_id, name)
+        get_cache().invalidate(CACHE_NAMESPACE)
         if not country:
             raise Exception("País não encontrado.")
         country.name = name
@@ -40,16 +69,52 @@ class CountryService:
         country = self.repository.get_by_id(country_id)
         if not country:
             raise Exception("País não encontrado.")
-        return self.repository.delete(country_id)
+        deleted = self.repository.delete(country_id)
+        get_cache().invalidate(CACHE_NAMESPACE)
+        return deleted
     
-    def get_teams_by_country(self, country_id: int) -> List[Team]:
-        """Retorna todos os times de um país."""
-        return self.repository.get_teams(country_id)
+    def get_teams_by_country(
+        self,
+        country_id: int,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Row]:
+        """Retorna os times de um país (ou uma página deles)."""
+        return self.repository.get_teams(country_id, after, limit, fields)
+
+    def get_players_by_country(
+        self,
+        country_id: int,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Row]:
+        """Retorna os jogadores de um país (ou uma página deles)."""
+        return self.repository.get_players(country_id, after, limit, fields)
+
+    def get_stadiums_by_country(
+        self,
+        country_id: int,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Row]:
+        """Retorna os estádios de um país (ou uma página deles)."""
+        return self.repository.get_stadiums(country_id, after, limit, fields)
+
+    def get_summary(self, country_id: int) -> Optional[CountrySummaryRow]:
+        """
+        Quantos times, jogadores, estádios e campeonatos o país tem, lidos da
+        tabela de resumos (mantida a cada escrita), sem contar as linhas.
+        Retorna None se o país não existe.
+        """
+        return self.summaries.get(country_id)
 
-    def get_players_by_country(self, country_id: int) -> List[Player]:
-        """Retorna todos os jogadores de um país."""
-        return self.repository.get_players(country_id)
+    def get_summaries(self) -> List[CountrySummaryRow]:
+        """Resumo de todos os países, ordenados por ID, em uma única leitura."""
+        return self.summaries.get_all()
 
-    def get_stadiums_by_country(self, country_id: int) -> List[Stadium]:
-        """Retorna todos os estádios de um país."""
-        return self.repository.get_stadiums(country_id)
\ No newline at end of file
+    def rebuild_summaries(self, country_ids: Optional[Iterable[int]] = None) -> int:
+        """Recalcula os resumos a partir das tabelas (carga inicial ou escritas feitas fora da API)."""
+        return self.summaries.rebuild(country_ids)
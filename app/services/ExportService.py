@@ -0,0 +1,74 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Any, Iterable, Iterator, Mapping
+
+from app.repositories.exportRepository import ExportRepository
+from app.schemas.entities import ENTITIES
+
+FORMATS = ("ndjson", "csv")
+# Rows are encoded into buffers of about this size before being sent.
+CHUNK_BYTES = 64 * 1024
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _buffered(pieces: Iterable[str]) -> Iterator[bytes]:
+    buffer = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= CHUNK_BYTES:
+            yield "".join(buffer).encode()
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode()
+
+
+def _ndjson_lines(rows: Iterable[Mapping[str, Any]]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(dict(row), default=_default, ensure_ascii=False) + "\n"
+
+
+def _csv_lines(columns, rows: Iterable[Mapping[str, Any]]) -> Iterator[str]:
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow(
+            value.isoformat() if isinstance(value, (datetime, date)) else value
+            for value in (row[column] for column in columns)
+        )
+        yield output.getvalue()
+        output.seek(0)
+        output.truncate()
+    yield output.getvalue()
+
+
+class ExportService:
+    def __init__(self):
+        self.repository = ExportRepository()
+
+    def export(self, entity: str, format: str) -> Iterator[bytes]:
+        """
+        Exporta todas as linhas de uma entidade em NDJSON ou CSV, em fluxo.
+        Lança ValueError para entidade ou formato desconhecidos (antes de
+        abrir a consulta, para o router poder responder 4xx).
+        """
+        if entity not in ENTITIES:
+            raise ValueError(f"Entidade desconhecida: '{entity}'")
+        if format not in FORMATS:
+            raise ValueError(f"Formato desconhecido: '{format}' (use ndjson ou csv)")
+
+        model = ENTITIES[entity]
+        rows = self.repository.stream_rows(model)
+        if format == "ndjson":
+            return _buffered(_ndjson_lines(rows))
+        columns = [column.name for column in model.__table__.columns]
+        return _buffered(_csv_lines(columns, rows))
@@ -0,0 +1,279 @@
+import codecs
+import csv
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from sqlalchemy import Date, DateTime, Integer, String
+
+from app.config.cache import get_cache
+from app.repositories.importRepository import ImportRepository
+from app.schemas.bulk import ImportReport, RowError
+from app.schemas.championship import Championship
+from app.schemas.country import Country
+from app.schemas.entities import ENTITIES
+from app.schemas.match import EventType
+from app.schemas.player import Player, Position
+from app.schemas.stadium import Stadium
+from app.schemas.team import Team
+
+DEFAULT_IMPORT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+# Natural keys cached per reference during one import; the cache is cleared
+# when it grows past this size so memory stays bounded on huge files.
+MAX_CACHED_KEYS = 50000
+FORMATS = ("ndjson", "csv")
+# Natural keys are names or codes: anything else (lists, objects) is a row error.
+NATURAL_KEY_TYPES = (str, int)
+
+
+@dataclass(frozen=True)
+class Reference:
+    """Foreign key that can be given by natural key: ``field`` (e.g. "country")
+    is looked up in ``model.key`` and stored in ``column`` (e.g. "country_id")."""
+
+    field: str
+    column: str
+    model: type
+    key: str = "name"
+
+
+REFERENCES: Dict[str, Tuple[Reference, ...]] = {
+    "stadium": (Reference("country", "country_id", Country),),
+    "team": (Reference("country", "country_id", Country),),
+    "player": (
+        Reference("country", "country_id", Country),
+        Reference("position", "position_id", Position),
+        Reference("team", "team_id", Team),
+    ),
+    "championship": (Reference("country", "country_id", Country),),
+    "participation": (
+        Reference("championship", "championship_id", Championship),
+        Reference("team", "team_id", Team),
+    ),
+    "match": (
+        Reference("home_team", "home_team_id", Team),
+        Reference("away_team", "away_team_id", Team),
+        Reference("championship", "championship_id", Championship),
+        Reference("stadium", "stadium_id", Stadium),
+    ),
+    "match_event": (
+        Reference("player", "player_id", Player),
+        Reference("event_type", "event_type_id", EventType),
+    ),
+    "substitution": (
+        Reference("player_out", "player_out_id", Player),
+        Reference("player_in", "player_in_id", Player),
+    ),
+    "lineup": (
+        Reference("team", "team_id", Team),
+        Reference("player", "player_id", Player),
+    ),
+}
+
+
+class InvalidRecord(NamedTuple):
+    """A line of the file that is not a record: reported as an error of its row, the import goes on."""
+
+    detail: str
+
+
+def read_ndjson(lines: Iterable[str]) -> Iterator[Union[Dict[str, Any], InvalidRecord]]:
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield InvalidRecord(f"JSON inválido: {e}")
+            continue
+        if not isinstance(record, dict):
+            yield InvalidRecord("Cada linha deve ser um objeto JSON")
+            continue
+        yield record
+
+
+def read_csv(lines: Iterable[str]) -> Iterator[Union[Dict[str, Any], InvalidRecord]]:
+    reader = csv.DictReader(lines)
+    while True:
+        try:
+            record = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            # E.g. a cell over csv.field_size_limit(); the reader goes on with the next line.
+            yield InvalidRecord(f"CSV inválido: {e}")
+            continue
+        # Empty CSV cells mean "no value".
+        yield {key: (value if value != "" else None) for key, value in record.items()}
+
+
+def decode_lines(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[str]:
+    """Turn a stream of byte chunks into text lines (with their line endings)."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ""
+    for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        lines = buffer.splitlines(keepends=True)
+        # The last piece may be an incomplete line; keep it for the next chunk.
+        buffer = lines.pop() if lines and not lines[-1].endswith(("\n", "\r")) else ""
+        yield from lines
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer
+
+
+def chunked(records: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _convert(column, value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(column.type, (DateTime, Date)):
+        return datetime.fromisoformat(value) if isinstance(value, str) else value
+    if isinstance(column.type, Integer):
+        return int(value)
+    if isinstance(column.type, String):
+        value = str(value)
+        length = column.type.length
+        if length and len(value) > length:
+            raise ValueError(f"'{column.name}' excede {length} caracteres")
+    return value
+
+
+class ImportService:
+    def __init__(self):
+        self.repository = ImportRepository()
+
+    def import_lines(
+        self,
+        entity: str,
+        lines: Iterable[str],
+        format: str = "ndjson",
+        chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE,
+    ) -> ImportReport:
+        """
+        Importa um arquivo NDJSON ou CSV de uma entidade, em fluxo.
+        Os registros passam por um pipeline de geradores e são gravados em
+        lotes (INSERT de múltiplas linhas, uma transação por lote), então a
+        memória usada não depende do tamanho do arquivo. Linhas inválidas
+        (JSON malformado, por exemplo) entram no relatório como erro da sua
+        linha, sem interromper a importação.
+        Lança ValueError para entidade ou formato desconhecidos.
+        """
+        if entity not in ENTITIES:
+            raise ValueError(f"Entidade desconhecida: '{entity}'")
+        if format not in FORMATS:
+            raise ValueError(f"Formato desconhecido: '{format}' (use ndjson ou csv)")
+
+        records = read_ndjson(lines) if format == "ndjson" else read_csv(lines)
+        report = ImportReport(entity=entity)
+        cache: Dict[str, Dict[str, Optional[int]]] = {}
+        try:
+            for chunk in chunked(records, chunk_size):
+                self._load_chunk(entity, chunk, report, cache)
+        finally:
+            # Cached reference data (countries, stadiums, ...) must see the new rows.
+            get_cache().invalidate(entity)
+        return report
+
+    def _load_chunk(
+        self,
+        entity: str,
+        records: List[Union[Dict[str, Any], InvalidRecord]],
+        report: ImportReport,
+        cache: Dict[str, Dict[str, Optional[int]]],
+    ) -> None:
+        model = ENTITIES[entity]
+        references = REFERENCES.get(entity, ())
+        offset = report.processed
+        report.processed += len(records)
+
+        valid = [record for record in records if not isinstance(record, InvalidRecord)]
+        for reference in references:
+            self._resolve(reference, valid, cache)
+
+        rows: List[Dict[str, Any]] = []
+        positions: List[int] = []
+        for index, record in enumerate(records, start=offset):
+            if isinstance(record, InvalidRecord):
+                self._add_error(report, index, record.detail)
+                continue
+            try:
+                rows.append(self._build_row(model, references, record, cache))
+                positions.append(index)
+            except (ValueError, TypeError) as e:
+                self._add_error(report, index, str(e))
+
+        if not rows:
+            return
+        inserted, failures = self.repository.load(model, rows)
+        report.inserted += inserted
+        for position, detail in failures:
+            self._add_error(report, positions[position], detail)
+
+    def _resolve(
+        self,
+        reference: Reference,
+        records: List[Dict[str, Any]],
+        cache: Dict[str, Dict[str, Optional[int]]],
+    ) -> None:
+        known = cache.setdefault(reference.field, {})
+        wanted = {
+            record[reference.field]
+            for record in records
+            if record.get(reference.column) is None and isinstance(record.get(reference.field), NATURAL_KEY_TYPES)
+        }
+        missing = wanted - known.keys()
+        if not missing:
+            return
+        if len(known) + len(missing) > MAX_CACHED_KEYS:
+            known.clear()
+            missing = wanted
+        known.update(self.repository.resolve(reference.model, reference.key, missing))
+
+    def _build_row(
+        self,
+        model: type,
+        references: Tuple[Reference, ...],
+        record: Dict[str, Any],
+        cache: Dict[str, Dict[str, Optional[int]]],
+    ) -> Dict[str, Any]:
+        record = dict(record)
+        for reference in references:
+            name = record.pop(reference.field, None)
+            if record.get(reference.column) is not None or name is None:
+                continue
+            if not isinstance(name, NATURAL_KEY_TYPES):
+                raise ValueError(f"{reference.field} deve ser um nome ou código, não {type(name).__name__}")
+            known = cache[reference.field]
+            if name not in known:
+                raise ValueError(f"{reference.field} '{name}' não encontrado")
+            if known[name] is None:
+                raise ValueError(f"{reference.field} '{name}' é ambíguo")
+            record[reference.column] = known[name]
+
+        row = {}
+        for column in model.__table__.columns:
+            if column.primary_key:
+                continue
+            value = _convert(column, record.get(column.name))
+            if value is None and not column.nullable:
+                raise ValueError(f"Campo obrigatório ausente: '{column.name}'")
+            row[column.name] = value
+        return row
+
+    @staticmethod
+    def _add_error(report: ImportReport, index: int, detail: str) -> None:
+        report.error_count += 1
+        if len(report.errors) < MAX_REPORTED_ERRORS:
+            report.errors.append(RowError(index=index, detail=detail))
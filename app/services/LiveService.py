@@ -0,0 +1,103 @@
+from heapq import merge
+from typing import Any, Dict, List, NamedTuple, Tuple, TypeVar, Union
+
+from app.repositories.liveRepository import LiveRepository
+from app.schemas.live import MatchEventCreate, SubstitutionCreate
+from app.schemas.match import MatchEvent, Substitution
+
+# Feed position: the last MatchEvent ID and the last Substitution ID seen.
+Cursor = Tuple[int, int]
+START: Cursor = (0, 0)
+
+T = TypeVar("T", bound=Union[MatchEvent, Substitution])
+
+
+class FeedItem(NamedTuple):
+    """One entry of a match feed: a MatchEvent ("event") or a Substitution row."""
+
+    type: str
+    id: int
+    minute: int
+    data: Dict[str, Any]
+
+
+def parse_cursor(cursor: str) -> Cursor:
+    """Parse a feed cursor ("<event id>.<substitution id>"); lança ValueError se for inválido."""
+    try:
+        event, substitution = (int(part) for part in cursor.split("."))
+    except ValueError:
+        raise ValueError("Cursor inválido")
+    if event < 0 or substitution < 0:
+        raise ValueError("Cursor inválido")
+    return event, substitution
+
+
+def format_cursor(cursor: Cursor) -> str:
+    return f"{cursor[0]}.{cursor[1]}"
+
+
+def advance(cursor: Cursor, item: FeedItem) -> Cursor:
+    """Cursor after ``item``; each ID only moves forward, whatever order the entries come in."""
+    if item.type == "event":
+        return max(cursor[0], item.id), cursor[1]
+    return cursor[0], max(cursor[1], item.id)
+
+
+def _item(type: str, row) -> FeedItem:
+    data = row._asdict() if hasattr(row, "_asdict") else row.model_dump()
+    return FeedItem(type, data["id"], data["minute"], data)
+
+
+class LiveService:
+    def __init__(self):
+        self.repository = LiveRepository()
+
+    def match_exists(self, match_id: int) -> bool:
+        return self.repository.match_exists(match_id)
+
+    def add_event(self, match_id: int, event: MatchEventCreate) -> Tuple[MatchEvent, List[FeedItem]]:
+        """
+        Registra um evento (gol, cartão...) da partida. Devolve a linha e as
+        entradas a publicar (veja ``_write``).
+        Propaga IntegrityError e SQLAlchemyError para o router tratar.
+        """
+        return self._write(match_id, MatchEvent(match_id=match_id, **event.model_dump()))
+
+    def add_substitution(
+        self, match_id: int, substitution: SubstitutionCreate
+    ) -> Tuple[Substitution, List[FeedItem]]:
+        """
+        Registra uma substituição da partida. Devolve a linha e as entradas a publicar.
+        Lança ValueError se o jogador que sai for o mesmo que entra.
+        """
+        if substitution.player_out_id == substitution.player_in_id:
+            raise ValueError("O jogador que sai deve ser diferente do que entra")
+        return self._write(match_id, Substitution(match_id=match_id, **substitution.model_dump()))
+
+    def _write(self, match_id: int, row: T) -> Tuple[T, List[FeedItem]]:
+        """
+        Grava ``row`` e relê do banco, na ordem dos IDs, tudo o que a partida
+        recebeu desde a posição anterior à gravação: é isso que se publica, e
+        não a linha sozinha, para que os assinantes recebam as entradas na
+        ordem em que um cliente que reconecta as reporia (escritas
+        concorrentes da mesma partida são serializadas pelo router).
+        """
+        position = self.repository.feed_position(match_id)
+        row = self.repository.add(row)
+        return row, self.get_feed(match_id, position)
+
+    def get_feed(self, match_id: int, after: Cursor = START) -> List[FeedItem]:
+        """
+        Eventos e substituições da partida posteriores ao cursor. Cada tipo
+        vem na ordem dos IDs (a do registro), e as duas listas são intercaladas
+        pelo minuto: assim as duas partes do cursor só avançam e um cliente que
+        reconecta no meio da reposição, a partir do último cursor recebido,
+        não perde nenhuma entrada, mesmo que um evento tenha sido registrado
+        fora da ordem dos minutos.
+        """
+        events, substitutions = self.repository.get_feed(match_id, *after)
+        return list(merge(
+            (_item("event", row) for row in events),
+            (_item("substitution", row) for row in substitutions),
+            key=lambda item: item.minute,
+        ))
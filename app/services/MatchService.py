@@ -0,0 +1,130 @@
+from typing import List, Optional, Tuple
+from datetime import date as Date, datetime, time, timedelta
+
+from sqlalchemy.engine import Row
+
+from app.schemas.match import Match, MatchFixture
+from app.repositories.matchRepository import MatchRepository
+
+MAX_FIXTURE_DAYS = 31
+MAX_FIXTURES = 1000
+
+
+class MatchService:
+    def __init__(self):
+        self.repository = MatchRepository()
+
+    def create_match(
+        self,
+        home_team_id: int,
+        away_team_id: int,
+        championship_id: int,
+        date: datetime,
+        stadium_id: int,
+        home_score: Optional[int] = None,
+        away_score: Optional[int] = None,
+    ) -> Match:
+        """
+        Cria uma nova partida.
+        Lança ValueError para erros de validação.
+        Propaga IntegrityError e SQLAlchemyError para o router tratar.
+        """
+        if home_team_id == away_team_id:
+            raise ValueError("Mandante e visitante devem ser times diferentes")
+
+        if any(score is not None and score < 0 for score in [home_score, away_score]):
+            raise ValueError("Placar não pode ser negativo")
+
+        return self.repository.create(
+            home_team_id=home_team_id,
+            away_team_id=away_team_id,
+            championship_id=championship_id,
+            date=date,
+            stadium_id=stadium_id,
+            home_score=home_score,
+            away_score=away_score,
+        )
+
+    def get_match(self, match_id: int) -> Optional[Match]:
+        """Obtém uma partida por ID. Retorna None se não encontrada."""
+        return self.repository.get_by_id(match_id)
+
+    def search_matches(
+        self,
+        championship_id: Optional[int] = None,
+        team_id: Optional[int] = None,
+        stadium_id: Optional[int] = None,
+        season: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Row]:
+        """
+        Lista as partidas que atendem aos filtros (ou uma página delas), ordenadas por data e ID.
+        Lança ValueError se o intervalo de datas for inválido.
+        """
+        if date_from is not None and date_to is not None and date_from >= date_to:
+            raise ValueError("date_from deve ser anterior a date_to")
+
+        return self.repository.search(
+            championship_id=championship_id,
+            team_id=team_id,
+            stadium_id=stadium_id,
+            season=season,
+            date_from=date_from,
+            date_to=date_to,
+            after=after,
+            limit=limit,
+        )
+
+    def get_fixtures(self, day: Date, days: int = 1, championship_id: Optional[int] = None) -> List[MatchFixture]:
+        """
+        Jogos de uma rodada: as partidas de ``days`` dias a partir de ``day``,
+        com os nomes dos times, do campeonato e do estádio.
+        Lança ValueError se a janela for maior que MAX_FIXTURE_DAYS.
+        """
+        if days < 1 or days > MAX_FIXTURE_DAYS:
+            raise ValueError(f"A janela deve ter entre 1 e {MAX_FIXTURE_DAYS} dias")
+
+        start = datetime.combine(day, time.min)
+        return self.repository.get_fixtures(
+            start, start + timedelta(days=days), championship_id, MAX_FIXTURES
+        )
+
+    def get_head_to_head(self, home_team_id: int, away_team_id: int) -> List[Match]:
+        """Partidas entre o mandante e o visitante informados, ordenadas por data."""
+        return self.repository.get_by_teams(home_team_id, away_team_id)
+
+    def update_match(
+        self,
+        match_id: int,
+        home_team_id: Optional[int] = None,
+        away_team_id: Optional[int] = None,
+        championship_id: Optional[int] = None,
+        date: Optional[datetime] = None,
+        stadium_id: Optional[int] = None,
+        home_score: Optional[int] = None,
+        away_score: Optional[int] = None,
+    ) -> Optional[Match]:
+        """Atualiza uma partida. Retorna None se não encontrada."""
+        if home_team_id is not None and home_team_id == away_team_id:
+            raise ValueError("Mandante e visitante devem ser times diferentes")
+
+        if any(score is not None and score < 0 for score in [home_score, away_score]):
+            raise ValueError("Placar não pode ser negativo")
+
+        return self.repository.update(
+            match_id,
+            home_team_id=home_team_id,
+            away_team_id=away_team_id,
+            championship_id=championship_id,
+            date=date,
+            stadium_id=stadium_id,
+            home_score=home_score,
+            away_score=away_score,
+        )
+
+    def delete_match(self, match_id: int) -> bool:
+        """Deleta uma partida. Retorna True se deletou, False se não encontrada."""
+        return self.repository.delete(match_id)
@@ -1,9 +1,23 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 from datetime import datetime
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
-from app.schemas.player import Player, Position, PlayerOutput
+from app.config.cache import get_cache
+
+from app.schemas.bulk import BulkCreateResult
+from app.schemas.player import CareerTotals, Player, PlayerCareer, Position, PlayerOutput
 from app.repositories.playerRepository import PlayerRepository
+from app.repositories.statsRepository import StatsRepository
+from app.services.StatsService import categorize
+from app.services.bulk import BulkMode, bulk_create
+
+
+POSITIONS_CACHE_NAMESPACE = "position"
+# Tables the career aggregates are computed from.
+CAREER_TABLES = (
+    "players", "lineups", "substitutions", "match_events", "event_types", "matches", "championships", "teams",
+)
 
 
 class PlayerService:
@@ -33,49 +47,61 @@ class PlayerService:
             team_id=team_id,
         )
 
-    def create_players(self, players: List[Player]) -> List[Player]:
-        """Cria múltiplos jogadores. Lança ValueError para erros de validação."""
-        created_players = []
-        for idx, player in enumerate(players):
+    def create_players(
+        self, players: List[Player], mode: BulkMode = BulkMode.atomic
+    ) -> BulkCreateResult:
+        """
+        Cria múltiplos jogadores em uma única transação.
+        Valida o lote inteiro antes de inserir: no modo atômico lança
+        BulkValidationError com os erros de cada índice; no modo best_effort
+        insere os válidos e devolve os erros junto com os criados.
+        """
+
+        def validate(player: Player) -> dict:
             if not player.name or len(player.name.strip()) < 3:
-                raise ValueError(f"Nome inválido no jogador índice {idx}")
+                raise ValueError("Nome deve ter pelo menos 3 caracteres")
 
             if any(
                 not isinstance(id, int) or id < 1
                 for id in [player.country_id, player.position_id]
             ):
-                raise ValueError(f"IDs inválidos no jogador índice {idx}")
-
-            created = self.repository.create(
-                name=player.name.strip(),
-                birth_date=player.birth_date,
-                country_id=player.country_id,
-                position_id=player.position_id,
-                team_id=player.team_id,
-            )
-            created_players.append(created)
-        return created_players
-
-    def get_player(self, player_id: int) -> Optional[Player]:
+                raise ValueError("IDs de país e posição devem ser números positivos")
+
+            return {
+                "name": player.name.strip(),
+                "birth_date": player.birth_date,
+                "country_id": player.country_id,
+                "position_id": player.position_id,
+                "team_id": player.team_id,
+            }
+
+        return bulk_create(players, validate, self.repository.bulk_create, mode)
+
+    def get_player(self, player_id: int) -> Optional[PlayerOutput]:
         """Obtém um jogador por ID. Retorna None se não encontrado."""
-        player = self.repository.get_by_id(player_id)
-        position = self.repository.get_position_by_player_id(player_id)
-        team = self.repository.get_team_by_player_id(player_id)
-        country = self.repository.get_country_by_player_id(player_id)
-        player_output = PlayerOutput(
-            id=player.id,
-            name=player.name,
-            birth_date=player.birth_date,
-            position=position.name,
-            team=team.name,
-            country=country.name,
-        )
+        return self.repository.get_output_by_id(player_id)
+
+    def get_players_details(self, player_ids: List[int]) -> List[PlayerOutput]:
+        """Obtém vários jogadores por ID, na ordem pedida. IDs inexistentes são ignorados.
 
-        return player_output if player else None
+        Formato legado de GET /players/details; usa a mesma consulta de ``get_players_by_ids``.
+        """
+        found = self.get_players_by_ids(player_ids)
+        ordered = dict.fromkeys(player_ids)
+        return [found[player_id] for player_id in ordered if player_id in found]
 
-    def get_all_players(self) -> List[Player]:
-        """Lista todos os jogadores."""
-        return self.repository.get_all()
+    def get_players_by_ids(self, player_ids: List[int]) -> Dict[int, PlayerOutput]:
+        """Obtém vários jogadores (com posição, time e país) em uma única consulta: {id: jogador}."""
+        return {player.id: player for player in self.repository.get_outputs_by_ids(list(set(player_ids)))}
+
+    def get_all_players(
+        self,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Row]:
+        """Lista os jogadores (ou uma página deles), ordenados por ID."""
+        return self.repository.get_all(after, limit, fields)
 
     def update_player(
         self,
@@ -121,4 +147,40 @@ class PlayerService:
             if len(name.strip()) < 3 or len(name.strip()) > 50:
                 raise ValueError(f"Nome inválido: '{name}' (3-50 caracteres)")
 
-        return self.repository.create_positions([name.strip() for name in names])
+        positions = self.repository.create_positions([name.strip() for name in names])
+        get_cache().invalidate(POSITIONS_CACHE_NAMESPACE)
+        return positions
+
+    def get_positions(self) -> List[Position]:
+        """Lista as posições, ordenadas por ID."""
+        return get_cache().get_or_load(POSITIONS_CACHE_NAMESPACE, "all", self.repository.get_positions)
+
+    def get_player_career(self, player_id: int) -> Optional[PlayerCareer]:
+        """Carreira do jogador por temporada e time. Retorna None se não encontrado."""
+        careers = self._careers(player_ids=[player_id])
+        return careers[0] if careers else None
+
+    def get_team_careers(self, team_id: int) -> List[PlayerCareer]:
+        """Carreira de cada jogador do elenco atual de um time, em uma única consulta agregada."""
+        return self._careers(team_id=team_id)
+
+    def _careers(self, player_ids: Optional[List[int]] = None, team_id: Optional[int] = None) -> List[PlayerCareer]:
+        players = self.repository.get_names(player_ids=player_ids, team_id=team_id)
+        if not players:
+            return []
+        categories = {
+            category: ids.tolist()
+            for category, ids in categorize(StatsRepository().event_type_names()).items()
+        }
+        rows: Dict[int, list] = {}
+        for player_id, row in self.repository.get_career_rows(categories, player_ids=player_ids, team_id=team_id):
+            rows.setdefault(player_id, []).append(row)
+
+        careers: List[PlayerCareer] = []
+        for player_id, name in players:
+            seasons = rows.get(player_id, [])
+            totals = CareerTotals(**{
+                field: sum(getattr(row, field) for row in seasons) for field in CareerTotals.model_fields
+            })
+            careers.append(PlayerCareer(player_id=player_id, player=name, seasons=seasons, totals=totals))
+        return careers
@@ -0,0 +1,128 @@
+import logging
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, List, Optional, Sequence
+
+from app.config.versions import table_versions
+from app.repositories.searchRepository import SEARCHABLE, SearchRepository
+from app.schemas.search import SearchResult
+from app.services.ngram import NgramIndex
+from app.services.text import normalize
+
+logger = logging.getLogger(__name__)
+
+
+class SearchEntity(str, Enum):
+    team = "team"
+    player = "player"
+    championship = "championship"
+    stadium = "stadium"
+    country = "country"
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """NgramIndex of an entity: ``base`` holds the rows up to ``last_id``, ``delta`` the rows inserted since."""
+
+    engine: int
+    version: tuple
+    base: NgramIndex
+    last_id: int
+    delta: Optional[NgramIndex] = None
+
+    @property
+    def indexes(self) -> List[NgramIndex]:
+        return [self.base] if self.delta is None else [self.base, self.delta]
+
+
+class SearchService:
+    """
+    Name search across entities. On PostgreSQL the database ranks the names
+    with pg_trgm (migration V005); elsewhere an NgramIndex per entity is built
+    in this process. When the entity's table changes, the rows inserted since
+    the index was built go into a small delta index right away, and the full
+    index (which also picks up updates and deletes) is rebuilt in the
+    background while the previous one keeps answering.
+    """
+
+    def __init__(self):
+        self.repository = SearchRepository()
+        self._indexes: Dict[str, _Snapshot] = {}
+        self._rebuilds: Dict[str, threading.Thread] = {}
+        self._lock = threading.Lock()
+
+    def search(self, query: str, entities: Optional[Sequence[SearchEntity]] = None, limit: int = 20) -> List[SearchResult]:
+        """Busca por nome (sem acentos, com erros de digitação e por prefixo), melhores resultados primeiro."""
+        key = normalize(query)
+        if not key:
+            return []
+        names = [entity.value for entity in entities] if entities else list(SEARCHABLE)
+        if self.repository.engine.dialect.name == "postgresql":
+            rows = self.repository.search(key, names, limit)
+        else:
+            rows = [
+                (entity, id, name, score)
+                for entity in names
+                for index in self._index(entity)
+                for id, name, score in index.search(key, limit)
+            ]
+            rows.sort(key=lambda row: (-row[3], normalize(row[2]), row[0]))
+        return [SearchResult(entity=entity, id=id, name=name, score=score) for entity, id, name, score in rows[:limit]]
+
+    def wait_for_rebuilds(self, timeout: Optional[float] = None) -> None:
+        """Block until the background rebuilds running now are done (tests, shutdown)."""
+        with self._lock:
+            threads = list(self._rebuilds.values())
+        for thread in threads:
+            thread.join(timeout)
+
+    def _version(self, entity: str) -> tuple:
+        # The last ID catches rows inserted outside the API; the table version catches the API's writes.
+        token, versions, _ = table_versions([SEARCHABLE[entity].__tablename__])
+        return token, versions, self.repository.last_ids()[entity]
+
+    def _full(self, entity: str) -> _Snapshot:
+        engine = id(self.repository.engine)
+        version = self._version(entity)
+        ids, names = self.repository.load_names(entity)
+        return _Snapshot(engine, version, NgramIndex(ids, names), max(ids, default=0))
+
+    def _index(self, entity: str) -> List[NgramIndex]:
+        engine = id(self.repository.engine)
+        version = self._version(entity)
+        cached = self._indexes.get(entity)
+        if cached is not None and cached.engine == engine and cached.version == version:
+            return cached.indexes
+        with self._lock:
+            cached = self._indexes.get(entity)
+            if cached is None or cached.engine != engine:
+                # Nothing to answer with yet: the only build made on the request path.
+                cached = self._full(entity)
+            elif cached.version != version:
+                # Inserted rows are searchable at once: only IDs above the base are read (a primary key range).
+                ids, names = self.repository.load_names(entity, after=cached.last_id)
+                cached = _Snapshot(engine, version, cached.base, cached.last_id, NgramIndex(ids, names) if ids else None)
+                self._start_rebuild(entity)
+            self._indexes[entity] = cached
+            return cached.indexes
+
+    def _start_rebuild(self, entity: str) -> None:
+        """Rebuild the full index of ``entity`` in a thread, unless one is already running (caller holds the lock)."""
+        if entity in self._rebuilds:
+            return
+        thread = threading.Thread(target=self._rebuild, args=(entity,), name=f"search-index-{entity}", daemon=True)
+        self._rebuilds[entity] = thread
+        thread.start()
+
+    def _rebuild(self, entity: str) -> None:
+        try:
+            snapshot = self._full(entity)
+            with self._lock:
+                self._indexes[entity] = snapshot
+        except Exception:
+            # The previous index keeps answering; the next change starts another rebuild.
+            logger.exception("Search index rebuild failed for %s", entity)
+        finally:
+            with self._lock:
+                self._rebuilds.pop(entity, None)
@@ -0,0 +1,86 @@
+from itertools import groupby
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from app.repositories.standingRepository import StandingRepository
+from app.schemas.standing import POINTS_PER_DRAW, POINTS_PER_WIN, StandingRow
+
+TIEBREAKERS = ("wins", "goal_difference", "goals_for", "head_to_head")
+DEFAULT_TIEBREAKERS = TIEBREAKERS
+
+
+def rank(
+    rows: List[StandingRow],
+    tiebreakers: Sequence[str],
+    head_to_head: Callable[[List[int]], Dict[int, int]],
+) -> List[StandingRow]:
+    """
+    Ordena a tabela por pontos e depois pelos critérios de desempate, na ordem dada.
+    ``head_to_head`` recebe os times empatados e devolve os pontos de cada um
+    nos jogos entre eles; só é chamado para os grupos que continuam empatados.
+    Times empatados em todos os critérios ficam em ordem alfabética.
+    """
+    def order(group: List[StandingRow], criteria: Sequence[str]) -> List[StandingRow]:
+        if len(group) < 2 or not criteria:
+            return sorted(group, key=lambda row: row.team or "")
+        criterion, rest = criteria[0], criteria[1:]
+        if criterion == "head_to_head":
+            points = head_to_head([row.team_id for row in group])
+
+            def key(row: StandingRow) -> int:
+                return points.get(row.team_id, 0)
+        else:
+            key = attrgetter(criterion)
+        ranked: List[StandingRow] = []
+        for _, tied in groupby(sorted(group, key=key, reverse=True), key=key):
+            ranked += order(list(tied), rest)
+        return ranked
+
+    ranked = order(rows, ("points", *tiebreakers))
+    for position, row in enumerate(ranked, start=1):
+        row.position = position
+    return ranked
+
+
+class StandingService:
+    def __init__(self):
+        self.repository = StandingRepository()
+
+    def get_standings(
+        self, championship_id: int, tiebreakers: Optional[Sequence[str]] = None
+    ) -> Optional[List[StandingRow]]:
+        """
+        Tabela de classificação do campeonato, lida da tabela materializada.
+        Retorna None se o campeonato não existir.
+        Lança ValueError para critérios de desempate desconhecidos.
+        """
+        tiebreakers = DEFAULT_TIEBREAKERS if tiebreakers is None else tuple(tiebreakers)
+        unknown = [name for name in tiebreakers if name not in TIEBREAKERS]
+        if unknown:
+            raise ValueError(
+                f"Critério de desempate desconhecido: {', '.join(unknown)} (use {', '.join(TIEBREAKERS)})"
+            )
+
+        rows = self.repository.get_table(championship_id)
+        if rows is None:
+            return None
+
+        def head_to_head(team_ids: List[int]) -> Dict[int, int]:
+            points = dict.fromkeys(team_ids, 0)
+            for _, home, away, home_score, away_score in self.repository.get_results_between(
+                championship_id, team_ids
+            ):
+                if home_score > away_score:
+                    points[home] += POINTS_PER_WIN
+                elif home_score < away_score:
+                    points[away] += POINTS_PER_WIN
+                else:
+                    points[home] += POINTS_PER_DRAW
+                    points[away] += POINTS_PER_DRAW
+            return points
+
+        return rank(rows, tiebreakers, head_to_head)
+
+    def rebuild_standings(self, championship_ids: Optional[Iterable[int]] = None) -> int:
+        """Recalcula as tabelas a partir das partidas (todas, se nenhum campeonato for informado)."""
+        return self.repository.rebuild(championship_ids)
@@ -0,0 +1,188 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.config.cache import get_cache
+from app.config.versions import table_versions
+from app.repositories.statsRepository import EVENT, LINEUP, SUBSTITUTION, StatsRepository
+from app.schemas.stats import PlayerStat
+from app.services.text import normalize
+
+MATCH_MINUTES = 90
+CACHE_NAMESPACE = "stats"
+# Writes to these tables change the statistics (the cache key includes their versions).
+SOURCE_TABLES = ("match_events", "lineups", "substitutions", "matches", "event_types", "championships")
+
+# Event type names (without accents, lower case) counted in each category.
+EVENT_CATEGORIES = {
+    "goals": ("gol", "goal", "gol de penalti", "penalty goal"),
+    "assists": ("assistencia", "assist"),
+    "yellow_cards": ("cartao amarelo", "yellow card"),
+    "red_cards": ("cartao vermelho", "red card", "segundo cartao amarelo", "second yellow card"),
+}
+
+
+class StatMetric(str, Enum):
+    goals = "goals"
+    assists = "assists"
+    yellow_cards = "yellow_cards"
+    red_cards = "red_cards"
+    cards = "cards"
+    minutes = "minutes"
+    goals_per_90 = "goals_per_90"
+
+
+def categorize(event_types: Dict[int, str]) -> Dict[str, np.ndarray]:
+    """Event type IDs of each category, matched by name."""
+    return {
+        category: np.array([id for id, name in event_types.items() if normalize(name) in names], dtype=np.int64)
+        for category, names in EVENT_CATEGORIES.items()
+    }
+
+
+def _keys(match_ids: np.ndarray, player_ids: np.ndarray) -> np.ndarray:
+    # One int64 per (match, player) appearance.
+    return (match_ids << 32) | player_ids
+
+
+@dataclass(frozen=True)
+class SeasonTotals:
+    """Per-player totals as parallel arrays, ordered by player ID."""
+
+    player_ids: np.ndarray
+    appearances: np.ndarray
+    minutes: np.ndarray
+    goals: np.ndarray
+    assists: np.ndarray
+    yellow_cards: np.ndarray
+    red_cards: np.ndarray
+
+    def metric(self, metric: StatMetric) -> np.ndarray:
+        if metric is StatMetric.cards:
+            return (self.yellow_cards + self.red_cards).astype(np.float64)
+        if metric is StatMetric.goals_per_90:
+            per_90 = np.zeros(len(self.player_ids))
+            np.divide(self.goals * MATCH_MINUTES, self.minutes, out=per_90, where=self.minutes > 0)
+            return per_90
+        return getattr(self, metric.value).astype(np.float64)
+
+
+def compute_totals(rows: np.ndarray, categories: Dict[str, np.ndarray]) -> SeasonTotals:
+    """
+    Soma eventos e minutos por jogador sem laços em Python.
+    Titulares (escalação) jogam a partir do minuto 0 e reservas a partir da
+    substituição; saem na substituição, na expulsão ou no fim da partida.
+    """
+    kind = rows[:, 0]
+    events, lineups, subs = rows[kind == EVENT], rows[kind == LINEUP], rows[kind == SUBSTITUTION]
+
+    # Appearances and the minute each one started (the earliest, if the data repeats a player).
+    keys = np.concatenate([_keys(lineups[:, 1], lineups[:, 2]), _keys(subs[:, 1], subs[:, 3])])
+    starts = np.concatenate([np.zeros(len(lineups), dtype=np.int64), subs[:, 4]])
+    order = np.lexsort((starts, keys))
+    keys, starts = keys[order], starts[order]
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    keys, starts = keys[first], starts[first]
+
+    # The earliest exit of each appearance: substituted off or sent off.
+    ends = np.full(len(keys), MATCH_MINUTES, dtype=np.int64)
+    sent_off = events[np.isin(events[:, 3], categories["red_cards"])]
+    exit_keys = np.concatenate([_keys(subs[:, 1], subs[:, 2]), _keys(sent_off[:, 1], sent_off[:, 2])])
+    exit_minutes = np.concatenate([subs[:, 4], sent_off[:, 4]])
+    if len(keys):
+        positions = np.minimum(np.searchsorted(keys, exit_keys), len(keys) - 1)
+        found = keys[positions] == exit_keys
+        np.minimum.at(ends, positions[found], exit_minutes[found])
+    played = np.clip(ends - starts, 0, MATCH_MINUTES)
+
+    appearance_players = keys & 0xFFFFFFFF
+    player_ids = np.unique(np.concatenate([appearance_players, events[:, 2]]))
+
+    def per_player(ids: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+        counts = np.bincount(np.searchsorted(player_ids, ids), weights, minlength=len(player_ids))
+        return counts.astype(np.int64)
+
+    def count(category: str) -> np.ndarray:
+        return per_player(events[np.isin(events[:, 3], categories[category]), 2])
+
+    return SeasonTotals(
+        player_ids=player_ids,
+        appearances=per_player(appearance_players),
+        minutes=per_player(appearance_players, played),
+        goals=count("goals"),
+        assists=count("assists"),
+        yellow_cards=count("yellow_cards"),
+        red_cards=count("red_cards"),
+    )
+
+
+def leaderboard(totals: SeasonTotals, metric: StatMetric, limit: int, min_minutes: int = 0) -> np.ndarray:
+    """Indexes of the top ``limit`` players for the metric (ties by player ID); zeros are left out."""
+    values = totals.metric(metric)
+    candidates = np.flatnonzero((values > 0) & (totals.minutes >= min_minutes))
+    if len(candidates) > limit:
+        # Keep only the values that can make the top (ties included) before sorting.
+        cut = np.partition(values[candidates], len(candidates) - limit)[len(candidates) - limit]
+        candidates = candidates[values[candidates] >= cut]
+    order = np.lexsort((totals.player_ids[candidates], -values[candidates]))
+    return candidates[order][:limit]
+
+
+class StatsService:
+    def __init__(self):
+        self.repository = StatsRepository()
+
+    def get_championship_leaderboard(
+        self, championship_id: int, metric: StatMetric, limit: int = 20, min_minutes: int = 0
+    ) -> Optional[List[PlayerStat]]:
+        """Ranking de jogadores do campeonato. Retorna None se o campeonato não existir."""
+        if not self.repository.championship_exists(championship_id):
+            return None
+        totals = self._totals(("championship", championship_id), [championship_id])
+        return self._leaderboard(totals, metric, limit, min_minutes)
+
+    def get_season_leaderboard(
+        self, season: str, metric: StatMetric, limit: int = 20, min_minutes: int = 0
+    ) -> Optional[List[PlayerStat]]:
+        """Ranking de jogadores de todos os campeonatos da temporada. Retorna None se não houver nenhum."""
+        championship_ids = self.repository.championship_ids(season)
+        if not championship_ids:
+            return None
+        totals = self._totals(("season", season), championship_ids)
+        return self._leaderboard(totals, metric, limit, min_minutes)
+
+    def _totals(self, scope: Tuple, championship_ids: List[int]) -> SeasonTotals:
+        # The last IDs catch rows inserted outside the API; the table versions catch updates and deletes.
+        _, versions, _ = table_versions(SOURCE_TABLES)
+        key = (scope, self.repository.last_ids(), versions)
+        return get_cache().get_or_load(
+            CACHE_NAMESPACE,
+            key,
+            lambda: compute_totals(
+                self.repository.load_rows(championship_ids), categorize(self.repository.event_type_names())
+            ),
+        )
+
+    def _leaderboard(self, totals: SeasonTotals, metric: StatMetric, limit: int, min_minutes: int) -> List[PlayerStat]:
+        top = leaderboard(totals, metric, limit, min_minutes)
+        values = totals.metric(metric)
+        names = self.repository.player_names(totals.player_ids[top].tolist())
+
+        stats: List[PlayerStat] = []
+        rank, previous = 0, None
+        for position, index in enumerate(top.tolist(), start=1):
+            if values[index] != previous:
+                rank, previous = position, values[index]
+            player_id = int(totals.player_ids[index])
+            stats.append(PlayerStat(
+                rank=rank,
+                player_id=player_id,
+                player=names.get(player_id),
+                value=round(float(values[index]), 2) if metric is StatMetric.goals_per_90 else float(values[index]),
+                appearances=int(totals.appearances[index]),
+                minutes=int(totals.minutes[index]),
+            ))
+        return stats
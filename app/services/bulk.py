@@ -0,0 +1,51 @@
+from enum import Enum
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from app.schemas.bulk import BulkCreateResult, RowError
+
+
+class BulkMode(str, Enum):
+    """``atomic``: all items or none. ``best_effort``: skip and report the invalid items."""
+
+    atomic = "atomic"
+    best_effort = "best_effort"
+
+
+class BulkValidationError(ValueError):
+    """Raised in atomic mode when some items of the batch are invalid."""
+
+    def __init__(self, errors: List[RowError]):
+        super().__init__(f"{len(errors)} item(ns) inválido(s)")
+        self.errors = errors
+
+
+def bulk_create(
+    items: Sequence[Any],
+    validate: Callable[[Any], Dict[str, Any]],
+    insert: Callable[[List[Dict[str, Any]], bool], Tuple[List[Any], List[Tuple[int, str]]]],
+    mode: BulkMode = BulkMode.atomic,
+) -> BulkCreateResult:
+    """Validate the whole batch up front, then insert the valid rows in one transaction.
+
+    ``validate`` turns an item into the row to insert or raises ValueError.
+    ``insert`` receives the rows and whether to run in best-effort mode and
+    returns the created objects and the ``(index, message)`` of rejected rows.
+    """
+    rows: List[Dict[str, Any]] = []
+    positions: List[int] = []
+    errors: List[RowError] = []
+
+    for index, item in enumerate(items):
+        try:
+            rows.append(validate(item))
+            positions.append(index)
+        except ValueError as e:
+            errors.append(RowError(index=index, detail=str(e)))
+
+    if errors and mode == BulkMode.atomic:
+        raise BulkValidationError(errors)
+
+    created, failures = insert(rows, mode == BulkMode.best_effort) if rows else ([], [])
+    errors += [RowError(index=positions[i], detail=detail) for i, detail in failures]
+    errors.sort(key=lambda error: error.index)
+    return BulkCreateResult(created=created, errors=errors)
@@ -0,0 +1,142 @@
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from app.repositories.searchRepository import (
+    EXACT, FUZZY, PREFIX, SIMILARITY_THRESHOLD, SIMILARITY_WEIGHT, WORD_PREFIX,
+)
+from app.services.text import normalize, trigrams
+
+# Largest code point, to turn a prefix into the [prefix, prefix + MAX_CHAR) range.
+MAX_CHAR = "\uffff"
+
+
+def _postings(keys: np.ndarray, entries: np.ndarray, vocabulary: int) -> Tuple[np.ndarray, np.ndarray]:
+    """CSR layout: the entries of key k are postings[offsets[k]:offsets[k + 1]], in entry order."""
+    order = np.argsort(keys, kind="stable")
+    offsets = np.zeros(vocabulary + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=vocabulary), out=offsets[1:])
+    return offsets, entries[order]
+
+
+class NgramIndex:
+    """
+    In-memory search index over (id, name) pairs, for databases without pg_trgm.
+    Names are normalized (no accents, lower case) and indexed three ways:
+    sorted whole names (prefix), sorted words (word prefix / autocomplete) and
+    trigram postings (fuzzy similarity, computed like pg_trgm's similarity()).
+    """
+
+    def __init__(self, ids: Sequence[int], names: Sequence[str]):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.names = list(names)
+        self.keys = [normalize(name) for name in self.names]
+
+        order = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+        self._by_key = np.array(order, dtype=np.int32)
+        self._sorted_keys = [self.keys[entry] for entry in order]
+        # Position of each entry in key order: the tie-break between equal scores.
+        self._key_rank = np.empty(len(order), dtype=np.int32)
+        self._key_rank[self._by_key] = np.arange(len(order), dtype=np.int32)
+
+        words: Dict[str, int] = {}
+        grams: Dict[str, int] = {}
+        word_keys, word_entries = array("i"), array("i")
+        gram_keys, gram_entries = array("i"), array("i")
+        gram_counts = array("i")
+        for entry, key in enumerate(self.keys):
+            for word in set(key.split()):
+                word_keys.append(words.setdefault(word, len(words)))
+                word_entries.append(entry)
+            entry_grams = trigrams(key)
+            gram_counts.append(len(entry_grams))
+            for gram in entry_grams:
+                gram_keys.append(grams.setdefault(gram, len(grams)))
+                gram_entries.append(entry)
+
+        # Renumber the words in alphabetical order so a prefix is a contiguous range.
+        self._words = sorted(words)
+        rank = np.empty(len(words), dtype=np.int32)
+        rank[[words[word] for word in self._words]] = np.arange(len(words), dtype=np.int32)
+        self._word_offsets, self._word_postings = _postings(
+            rank[np.frombuffer(word_keys, dtype=np.int32)], np.frombuffer(word_entries, dtype=np.int32), len(words)
+        )
+
+        self._grams = grams
+        self._gram_offsets, self._gram_postings = _postings(
+            np.frombuffer(gram_keys, dtype=np.int32), np.frombuffer(gram_entries, dtype=np.int32), len(grams)
+        )
+        self._gram_counts = np.frombuffer(gram_counts, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _word_prefix(self, tokens: List[str]) -> np.ndarray:
+        """Entries with a word starting with each token (in any order)."""
+        matches = None
+        for token in tokens:
+            low = bisect_left(self._words, token)
+            high = bisect_left(self._words, token + MAX_CHAR)
+            entries = np.unique(self._word_postings[self._word_offsets[low]:self._word_offsets[high]])
+            matches = entries if matches is None else np.intersect1d(matches, entries, assume_unique=True)
+            if not len(matches):
+                break
+        return matches
+
+    def _shared(self, candidates: np.ndarray, postings: List[np.ndarray]) -> np.ndarray:
+        """Number of the query trigrams (given by their postings) each candidate has."""
+        shared = np.zeros(len(candidates), dtype=np.int64)
+        for entries in postings:
+            # Postings are in entry order: a binary search tells whether each candidate is in them.
+            found = np.minimum(np.searchsorted(entries, candidates), len(entries) - 1)
+            shared += entries[found] == candidates
+        return shared
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[int, str, float]]:
+        """Best matches as (id, name, score), highest score first (ties by name)."""
+        key = normalize(query)
+        if not key or not len(self.keys):
+            return []
+
+        low = bisect_left(self._sorted_keys, key)
+        exact_high = bisect_right(self._sorted_keys, key)
+        high = bisect_left(self._sorted_keys, key + MAX_CHAR)
+        prefix = self._by_key[low:high]
+        word_prefix = self._word_prefix(key.split())
+        matched = np.union1d(prefix, word_prefix)
+
+        key_grams = trigrams(key)
+        postings = [
+            self._gram_postings[self._gram_offsets[gram]:self._gram_offsets[gram + 1]]
+            for gram in (self._grams.get(gram) for gram in key_grams) if gram is not None
+        ]
+        if len(matched) >= limit:
+            # Prefix matches outrank any fuzzy one (FUZZY < WORD_PREFIX): only their similarity is needed.
+            candidates = matched
+            shared = self._shared(candidates, postings)
+        else:
+            counts = (np.bincount(np.concatenate(postings), minlength=len(self.keys))
+                      if postings else np.zeros(len(self.keys), dtype=np.int64))
+            # similarity >= t needs at least t * |query| / (1 + t) shared trigrams.
+            min_shared = max(1, math.ceil(SIMILARITY_THRESHOLD * len(key_grams) / (1 + SIMILARITY_THRESHOLD) - 1e-9))
+            candidates = np.union1d(np.flatnonzero(counts >= min_shared), matched)
+            shared = counts[candidates]
+        similarities = shared / (len(key_grams) + self._gram_counts[candidates] - shared)
+
+        is_prefix = np.isin(candidates, prefix)
+        is_word_prefix = np.isin(candidates, word_prefix)
+        bonus = SIMILARITY_WEIGHT * similarities
+        scores = np.where(is_word_prefix, WORD_PREFIX + bonus, FUZZY * similarities)
+        scores = np.where(is_prefix, PREFIX + bonus, scores)
+        scores = np.where(np.isin(candidates, self._by_key[low:exact_high]), EXACT, scores)
+        keep = is_prefix | is_word_prefix | (similarities >= SIMILARITY_THRESHOLD)
+        candidates, scores = candidates[keep], scores[keep]
+
+        top = np.lexsort((self._key_rank[candidates], -scores))[:limit]
+        return [
+            (int(self.ids[entry]), self.names[entry], round(value, 4))
+            for entry, value in zip(candidates[top].tolist(), scores[top].tolist())
+        ]
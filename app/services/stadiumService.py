@@ -1,8 +1,13 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
+from sqlalchemy.engine import Row
+from app.config.cache import get_cache
 from app.schemas.stadium import Stadium
 from app.repositories.stadiumRepository import StadiumRepository
 
 
+CACHE_NAMESPACE = "stadium"
+
+
 class StadiumService:
     def __init__(self):
         self.repository = StadiumRepository()
@@ -10,18 +15,38 @@ class StadiumService:
     def find_stadium_by_id(self, stadium_id: int) -> Stadium:
         """Find a stadium by its ID."""
         try:
-            stadium = self.repository.get_by_id(stadium_id)
+            stadium = get_cache().get_or_load(
+                CACHE_NAMESPACE, ("id", stadium_id), lambda: self.repository.get_by_id(stadium_id)
+            )
             if not stadium:
                 raise Exception("Stadium not found.")
         except Exception as e:
             raise e
         return stadium
     
+    def find_stadiums_by_ids(self, stadium_ids: List[int]) -> Dict[int, Stadium]:
+        """Find several stadiums by ID: the cached ones, then the others in one query ({id: stadium}, no missing IDs)."""
+        cache = get_cache()
+        version = cache.version(CACHE_NAMESPACE)
+        found, missing = {}, []
+        for stadium_id in set(stadium_ids):
+            stadium = cache.get(CACHE_NAMESPACE, ("id", stadium_id), version=version)
+            if stadium is not None:
+                found[stadium_id] = stadium
+            else:
+                missing.append(stadium_id)
+        for stadium in self.repository.get_by_ids(missing):
+            cache.set(CACHE_NAMESPACE, ("id", stadium.id), stadium, version)
+            found[stadium.id] = stadium
+        return found
+
     def find_stadium_by_name(self, name: str) -> Stadium:
         """Find a stadium by its name."""
         try:
             # Note: You might need to add a get_by_name method to StadiumRepository
-            stadium = self.repository.get_by_name(name)
+            stadium = get_cache().get_or_load(
+                CACHE_NAMESPACE, ("name", name), lambda: self.repository.get_by_name(name)
+            )
             if not stadium:
                 raise Exception("Stadium not found.")
         except Exception as e:
@@ -31,16 +56,24 @@ class StadiumService:
     def create_stadium(self, name: str, city: str, country_id: int) -> Stadium:
         """Create a new stadium."""
         stadium = self.repository.create(name, city, country_id)
+        get_cache().invalidate(CACHE_NAMESPACE)
         return stadium
 
-    def get_all_stadiums(self) -> List[Stadium]:
-        """Retrieve all stadiums."""
-        return self.repository.get_all()
+    def get_all_stadiums(
+        self,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Row]:
+        """Retrieve all stadiums (or one page of them)."""
+        key = ("all", after, limit, tuple(fields) if fields is not None else None)
+        return get_cache().get_or_load(CACHE_NAMESPACE, key, lambda: self.repository.get_all(after, limit, fields))
 
     def update_stadium(self, stadium_id: int, name: Optional[str] = None, 
                       city: Optional[str] = None, country_id: Optional[int] = None) -> Stadium:
         """Update a stadium by its ID."""
         stadium = self.repository.update(stadium_id, name, city, country_id)
+        get_cache().invalidate(CACHE_NAMESPACE)
         if not stadium:
             raise Exception("Stadium not found.")
         return stadium
@@ -50,4 +83,6 @@ class StadiumService:
         stadium = self.repository.get_by_id(stadium_id)
         if not stadium:
             raise Exception("Stadium not found.")
-        return self.repository.delete(stadium_id)
\ No newline at end of file
+        deleted = self.repository.delete(stadium_id)
+        get_cache().invalidate(CACHE_NAMESPACE)
+        return deleted
\ No newline at end of file
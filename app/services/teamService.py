@@ -1,11 +1,25 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 from datetime import datetime
 
+from sqlalchemy.engine import Row
+from app.config.cache import get_cache
+from app.config.versions import table_versions
 from app.schemas.team import Team
 from app.schemas.team import ChampionshipParticipation
 from app.schemas.championship import Championship
-from app.schemas.player import Player
+from app.schemas.player import PlayerCareer
 from app.repositories.teamRepository import TeamRepository
+from app.services.PlayerService import PlayerService
+
+# Relations GET /teams/{team_id}/squad can embed, and the tables each one reads.
+SQUAD_RELATIONS = ("country", "participations", "players")
+_SQUAD_RELATION_TABLES = {
+    "country": (),
+    "participations": ("championship_participations", "championships"),
+    "players": ("players", "positions"),
+}
+SQUAD_TABLES = ("teams", "countries", "championship_participations", "championships", "players", "positions")
+SQUAD_CACHE_NAMESPACE = "squads"
 
 
 class TeamService:
@@ -49,6 +63,10 @@ class TeamService:
         """
         return self.repository.get_by_id(team_id)
 
+    def get_teams_by_ids(self, team_ids: List[int]) -> Dict[int, Team]:
+        """Obtém vários times por ID em uma única consulta: {id: time}, sem os IDs inexistentes."""
+        return {team.id: team for team in self.repository.get_by_ids(list(set(team_ids)))}
+
     def search_teams(self, name: str) -> Optional[Team]:
         """
         Busca times por nome.
@@ -56,12 +74,17 @@ class TeamService:
         """
         return self.repository.get_by_name(name)
 
-    def get_all_teams(self) -> List[Team]:
+    def get_all_teams(
+        self,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Row]:
         """
-        Lista todos os times.
+        Lista os times (ou uma página deles), ordenados por ID.
         Propaga SQLAlchemyError para o router tratar.
         """
-        return self.repository.get_all()
+        return self.repository.get_all(after, limit, fields)
 
     def update_team(
         self,
@@ -102,13 +125,68 @@ class TeamService:
         """
         return self.repository.delete(team_id)
 
-    def get_players_by_team(self, team_id: int) -> List[Player]:
+    def get_players_by_team(
+        self,
+        team_id: int,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Row]:
         """
-        Retorna todos os jogadores de um time.
+        Retorna os jogadores de um time (ou uma página deles), ordenados por ID.
         Propaga SQLAlchemyError para o router tratar.
         """
-        return self.repository.get_players(team_id)
+        return self.repository.get_players(team_id, after, limit, fields)
     
+    def get_squad(self, team_id: int, include: Sequence[str] = SQUAD_RELATIONS) -> Optional[dict]:
+        """
+        Time com as relações de ``include`` (país, participações e jogadores
+        com os nomes de posição e nacionalidade), em uma consulta para o time,
+        o país e as participações e outra para os jogadores.
+        O resultado fica em cache com as versões das tabelas lidas na chave:
+        qualquer escrita nelas o substitui. Retorna None se o time não existe.
+        Propaga SQLAlchemyError para o router tratar.
+        """
+        include = tuple(relation for relation in SQUAD_RELATIONS if relation in include)
+        tables = ["teams", "countries"] + [table for relation in include for table in _SQUAD_RELATION_TABLES[relation]]
+        _, versions, _ = table_versions(tables)
+        return get_cache().get_or_load(
+            SQUAD_CACHE_NAMESPACE, (team_id, include, versions), lambda: self._load_squad(team_id, include)
+        )
+
+    def _load_squad(self, team_id: int, include: Sequence[str]) -> Optional[dict]:
+        rows = self.repository.get_squad_header(team_id, participations="participations" in include)
+        if not rows:
+            return None
+        first = rows[0]._mapping
+        squad = {"team": {name: first[name] for name in Team.__table__.columns.keys()}}
+        if "country" in include:
+            squad["country"] = {"id": first["country_id"], "name": first["country_name"]}
+        if "participations" in include:
+            squad["participations"] = [
+                {
+                    "id": row.participation_id,
+                    "championship_id": row.championship_id,
+                    "championship_name": row.championship_name,
+                    "season": row.season,
+                }
+                for row in rows
+                if row.participation_id is not None
+            ]
+        if "players" in include:
+            squad["players"] = [row._asdict() for row in self.repository.get_squad_players(team_id)]
+        return squad
+
+    def get_players_career(self, team_id: int) -> Optional[List[PlayerCareer]]:
+        """
+        Carreira de cada jogador do elenco do time.
+        Retorna None se o time não existe.
+        Propaga SQLAlchemyError para o router tratar.
+        """
+        if not self.repository.exists(team_id):
+            return None
+        return PlayerService().get_team_careers(team_id)
+
     def create_championship_participation(
         self,
         championship_id: int,
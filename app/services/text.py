@@ -0,0 +1,21 @@
+import re
+import unicodedata
+from typing import Set
+
+_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(name: str) -> str:
+    """Lower case, without accents and with punctuation turned into single spaces ("São Paulo F.C." -> "sao paulo f c")."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char)).lower()
+    return _NON_ALPHANUMERIC.sub(" ", stripped).strip()
+
+
+def trigrams(key: str) -> Set[str]:
+    """Trigrams of a normalized name, padded per word like PostgreSQL's pg_trgm ("  s", " sa", "sao", "ao ", ...)."""
+    grams = set()
+    for word in key.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
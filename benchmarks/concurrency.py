@@ -0,0 +1,144 @@
+"""Concurrency benchmark: latency of the API under many simultaneous clients.
+
+Serves the FastAPI app with uvicorn in a background thread (its own event loop)
+against a SQLite file whose statements are slowed down by a fixed delay,
+simulating the round trip to a remote database.
+The same load is run twice: with the blocking calls inline on the event loop
+(the behaviour before the thread pool offload) and with the bounded thread pool.
+
+    python -m benchmarks.concurrency --clients 128 --requests 5 --latency-ms 20
+
+Prints a JSON document with throughput and p50/p95/p99 latencies per mode.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import socket
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+import httpx
+import uvicorn
+from sqlalchemy import event
+from sqlmodel import SQLModel, create_engine
+
+import app.schemas.match  # noqa: F401 - registers every table in the metadata
+from app.config.concurrency import configure_db_threads
+from app.config.database import set_engine
+from app.repositories.countryRepository import CountryRepository
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    index = max(0, math.ceil(q * len(ordered)) - 1)
+    return ordered[index]
+
+
+def summarize(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    return {
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+    }
+
+
+def build_engine(path: str, latency_ms: float, pool_size: int):
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False},
+        pool_size=pool_size,
+        max_overflow=0,
+    )
+    SQLModel.metadata.create_all(engine)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _simulate_round_trip(*_):
+        time.sleep(latency_ms / 1000)
+
+    return engine
+
+
+@contextmanager
+def serve(app) -> Iterator[str]:
+    """Run the app with uvicorn in a background thread and yield its base URL."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = uvicorn.Server(
+        uvicorn.Config(
+            app, host="127.0.0.1", port=port, log_level="warning",
+            lifespan="off", timeout_keep_alive=60,
+        )
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+async def run_load(base_url: str, path: str, clients: int, requests_per_client: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=20)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=None) as client:
+
+        async def worker():
+            for _ in range(requests_per_client):
+                start = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+    return summarize(latencies, elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=128)
+    parser.add_argument("--requests", type=int, default=5, help="requests per client")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="simulated round trip")
+    parser.add_argument("--threads", type=int, default=10, help="database threads / pooled connections")
+    parser.add_argument("--path", default="/country/")
+    args = parser.parse_args()
+
+    from app.main import app
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_engine(os.path.join(tmp, "bench.db"), args.latency_ms, args.threads)
+        set_engine(engine)
+        repository = CountryRepository()
+        for i in range(20):
+            repository.create(f"Country {i}")
+
+        results = {}
+        for mode, threads in (("inline", 0), ("threadpool", args.threads)):
+            configure_db_threads(threads)
+            with serve(app) as base_url:
+                results[mode] = asyncio.run(
+                    run_load(base_url, args.path, args.clients, args.requests)
+                )
+
+        configure_db_threads(None)
+        set_engine(None)
+        engine.dispose()
+
+    print(json.dumps({"config": vars(args), "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
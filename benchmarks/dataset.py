@@ -0,0 +1,279 @@
+"""Synthetic football data at realistic ratios, for benchmarks.
+
+Every country has one league of ``teams_per_league`` clubs (one stadium each,
+``players_per_team`` players) played as a double round robin per season.
+Each match gets two starting elevens, three substitutions per side and
+goals, assists and cards drawn around the usual per-match averages.
+The same seed always produces the same data.
+
+    python -m benchmarks.dataset --scale medium --database-url postgresql://...
+"""
+import argparse
+import json
+import math
+import random
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import insert, select, func, text
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel
+
+import app.schemas.match  # noqa: F401 - registers every table in the metadata
+import app.schemas.standing  # noqa: F401
+from app.config.migrations import apply_migrations
+from app.repositories.standingRepository import rebuild_standings
+from app.schemas.championship import Championship
+from app.schemas.country import Country
+from app.schemas.match import EventType, Lineup, Match, MatchEvent, Substitution
+from app.schemas.player import Player, Position
+from app.schemas.stadium import Stadium
+from app.schemas.team import ChampionshipParticipation, Team
+
+POSITIONS = ("Goleiro", "Zagueiro", "Lateral", "Volante", "Meia", "Atacante")
+# Players per position in a squad and in a starting eleven.
+SQUAD_SHAPE = (3, 5, 4, 4, 5, 4)
+ELEVEN_SHAPE = (1, 2, 2, 2, 2, 2)
+EVENT_TYPES = ("Gol", "Assistência", "Cartão amarelo", "Cartão vermelho")
+GOAL, ASSIST, YELLOW, RED = 1, 2, 3, 4
+
+HOME_GOALS, AWAY_GOALS = 1.5, 1.1
+ASSISTED_GOALS = 0.7
+YELLOWS_PER_SIDE, REDS_PER_SIDE = 2.0, 0.1
+SUBSTITUTIONS_PER_SIDE = 3
+FIRST_SEASON = 2015
+CHUNK_SIZE = 5000
+
+
+@dataclass(frozen=True)
+class Scale:
+    countries: int
+    teams_per_league: int
+    players_per_team: int
+    seasons: int
+
+
+SCALES = {
+    "tiny": Scale(countries=2, teams_per_league=4, players_per_team=sum(SQUAD_SHAPE), seasons=1),
+    "small": Scale(countries=4, teams_per_league=10, players_per_team=sum(SQUAD_SHAPE), seasons=2),
+    "medium": Scale(countries=10, teams_per_league=20, players_per_team=sum(SQUAD_SHAPE), seasons=3),
+    "large": Scale(countries=20, teams_per_league=20, players_per_team=sum(SQUAD_SHAPE), seasons=5),
+}
+
+
+def _poisson(rng: random.Random, mean: float) -> int:
+    limit, count, product = math.exp(-mean), 0, rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+def _round_robin(teams: List[int]) -> Iterator[List[tuple]]:
+    """Rounds of (home, away) pairs: every team plays every other once at home and once away."""
+    teams = list(teams) + ([None] if len(teams) % 2 else [])
+    half = len(teams) // 2
+    rounds = []
+    for _ in range(len(teams) - 1):
+        pairs = [(teams[i], teams[-1 - i]) for i in range(half)]
+        rounds.append([(home, away) for home, away in pairs if home is not None and away is not None])
+        teams = [teams[0], teams[-1], *teams[1:-1]]
+    yield from rounds
+    for pairs in rounds:
+        yield [(away, home) for home, away in pairs]
+
+
+class Generator:
+    """Rows of every table, with explicit IDs, produced table by table."""
+
+    def __init__(self, scale: Scale, seed: int = 42):
+        self.scale = scale
+        self.rng = random.Random(seed)
+        self.teams = scale.countries * scale.teams_per_league
+        self.players = self.teams * scale.players_per_team
+
+    def league_teams(self, country: int) -> List[int]:
+        first = (country - 1) * self.scale.teams_per_league + 1
+        return list(range(first, first + self.scale.teams_per_league))
+
+    def squad(self, team: int) -> List[int]:
+        first = (team - 1) * self.scale.players_per_team + 1
+        return list(range(first, first + self.scale.players_per_team))
+
+    def positions(self, team: int) -> List[int]:
+        """Position ID of each player of the squad (same order as ``squad``)."""
+        shape = [index + 1 for index, count in enumerate(SQUAD_SHAPE) for _ in range(count)]
+        return [shape[i % len(shape)] for i in range(self.scale.players_per_team)]
+
+    def reference_rows(self) -> Dict[type, List[dict]]:
+        scale, rng = self.scale, self.rng
+        countries = [{"id": i, "name": f"País {i}"} for i in range(1, scale.countries + 1)]
+        teams, stadiums, players = [], [], []
+        for country in range(1, scale.countries + 1):
+            for team in self.league_teams(country):
+                city = f"Cidade {team}"
+                stadiums.append({"id": team, "name": f"Estádio {team}", "city": city, "country_id": country})
+                teams.append({
+                    "id": team, "name": f"Clube {team}", "nickname": f"C{team}", "city": city,
+                    "country_id": country, "founding_date": datetime(rng.randint(1880, 1990), 1, 1),
+                })
+                for player, position in zip(self.squad(team), self.positions(team)):
+                    players.append({
+                        "id": player, "name": f"Jogador {player}",
+                        "birth_date": datetime(1985, 1, 1) + timedelta(days=rng.randint(0, 6000)),
+                        # Most players are from the club's country.
+                        "country_id": country if rng.random() < 0.8 else rng.randint(1, scale.countries),
+                        "position_id": position, "team_id": team,
+                    })
+        championships, participations = [], []
+        for season_index in range(scale.seasons):
+            season = str(FIRST_SEASON + season_index)
+            for country in range(1, scale.countries + 1):
+                championship = season_index * scale.countries + country
+                championships.append({
+                    "id": championship, "name": f"Liga {country} {season}", "country_id": country,
+                    "type": "league", "season": season,
+                })
+                participations += [
+                    {"championship_id": championship, "team_id": team, "season": season}
+                    for team in self.league_teams(country)
+                ]
+        return {
+            Country: countries,
+            Position: [{"id": i, "name": name} for i, name in enumerate(POSITIONS, start=1)],
+            EventType: [{"id": i, "name": name} for i, name in enumerate(EVENT_TYPES, start=1)],
+            Stadium: stadiums,
+            Team: teams,
+            Player: players,
+            Championship: championships,
+            ChampionshipParticipation: participations,
+        }
+
+    def _eleven(self, team: int) -> List[int]:
+        squad, positions = self.squad(team), self.positions(team)
+        eleven = []
+        for position, count in enumerate(ELEVEN_SHAPE, start=1):
+            options = [player for player, own in zip(squad, positions) if own == position]
+            eleven += self.rng.sample(options, min(count, len(options)))
+        return eleven
+
+    def match_rows(self) -> Iterator[Dict[type, List[dict]]]:
+        """The matches of one championship (and their lineups, substitutions and events) at a time."""
+        scale, rng = self.scale, self.rng
+        match_id = 0
+        for season_index in range(scale.seasons):
+            season_start = datetime(FIRST_SEASON + season_index, 8, 1, 16)
+            for country in range(1, scale.countries + 1):
+                championship = season_index * scale.countries + country
+                rows: Dict[type, List[dict]] = {Match: [], Lineup: [], Substitution: [], MatchEvent: []}
+                for round_index, pairs in enumerate(_round_robin(self.league_teams(country))):
+                    for slot, (home, away) in enumerate(pairs):
+                        match_id += 1
+                        scores = {home: _poisson(rng, HOME_GOALS), away: _poisson(rng, AWAY_GOALS)}
+                        rows[Match].append({
+                            "id": match_id, "home_team_id": home, "away_team_id": away,
+                            "championship_id": championship, "stadium_id": home,
+                            "date": season_start + timedelta(days=7 * round_index, hours=2 * (slot % 3)),
+                            "home_score": scores[home], "away_score": scores[away],
+                        })
+                        for team in (home, away):
+                            self._side(rows, match_id, team, scores[team])
+                yield rows
+
+    def _side(self, rows: Dict[type, List[dict]], match_id: int, team: int, goals: int) -> None:
+        rng = self.rng
+        eleven = self._eleven(team)
+        bench = [player for player in self.squad(team) if player not in eleven]
+        rows[Lineup] += [{"match_id": match_id, "team_id": team, "player_id": player} for player in eleven]
+        on_pitch = list(eleven)
+        for player_out, player_in in zip(
+            rng.sample(eleven[1:], SUBSTITUTIONS_PER_SIDE), rng.sample(bench, SUBSTITUTIONS_PER_SIDE)
+        ):
+            rows[Substitution].append({
+                "match_id": match_id, "player_out_id": player_out, "player_in_id": player_in,
+                "minute": rng.randint(46, 89),
+            })
+            on_pitch.append(player_in)
+
+        def event(event_type: int, player: int) -> None:
+            rows[MatchEvent].append({
+                "match_id": match_id, "player_id": player, "event_type_id": event_type, "minute": rng.randint(1, 90),
+            })
+
+        outfield = on_pitch[1:]
+        for _ in range(goals):
+            scorer = rng.choice(outfield)
+            event(GOAL, scorer)
+            if rng.random() < ASSISTED_GOALS:
+                event(ASSIST, rng.choice([player for player in outfield if player != scorer]))
+        for _ in range(_poisson(rng, YELLOWS_PER_SIDE)):
+            event(YELLOW, rng.choice(on_pitch))
+        for _ in range(_poisson(rng, REDS_PER_SIDE)):
+            event(RED, rng.choice(on_pitch))
+
+
+def _insert(connection, model, rows: List[dict]) -> None:
+    for start in range(0, len(rows), CHUNK_SIZE):
+        connection.execute(insert(model.__table__), rows[start:start + CHUNK_SIZE])
+
+
+def seed(engine: Engine, scale: Scale, seed: int = 42) -> Dict[str, int]:
+    """
+    Create the schema and load the generated data into an empty database.
+    Returns the number of rows of each table.
+    """
+    SQLModel.metadata.create_all(engine)
+    apply_migrations(engine)
+    with engine.connect() as connection:
+        if connection.execute(select(func.count()).select_from(Country.__table__)).scalar():
+            raise ValueError("The benchmark database must be empty")
+
+    generator = Generator(scale, seed)
+    counts: Dict[str, int] = {}
+    with engine.begin() as connection:
+        for model, rows in generator.reference_rows().items():
+            _insert(connection, model, rows)
+            counts[model.__tablename__] = len(rows)
+    for rows_by_model in generator.match_rows():
+        with engine.begin() as connection:
+            for model, rows in rows_by_model.items():
+                _insert(connection, model, rows)
+                counts[model.__tablename__] = counts.get(model.__tablename__, 0) + len(rows)
+
+    with Session(engine) as session:
+        counts["standings"] = rebuild_standings(session)
+        session.commit()
+    with engine.begin() as connection:
+        if engine.dialect.name == "postgresql":
+            # The IDs were given explicitly: move the sequences past them.
+            for table in SQLModel.metadata.sorted_tables:
+                if "id" in table.c and table.c.id.autoincrement:
+                    connection.execute(text(
+                        f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                        f"COALESCE((SELECT MAX(id) FROM {table.name}), 0) + 1, false)"
+                    ))
+            connection.execute(text("ANALYZE"))
+        elif engine.dialect.name == "sqlite":
+            connection.exec_driver_sql("ANALYZE")
+    return counts
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    from app.config.database import create_db_engine
+    from app.config.settings import get_database_settings
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database-url", help="empty database to fill (default: DATABASE_URL)")
+    args = parser.parse_args(argv)
+
+    engine = create_db_engine(get_database_settings(args.database_url))
+    counts = seed(engine, SCALES[args.scale], args.seed)
+    engine.dispose()
+    print(json.dumps({"scale": asdict(SCALES[args.scale]), "rows": counts}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
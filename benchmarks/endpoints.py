@@ -0,0 +1,257 @@
+"""Endpoint benchmark: throughput and latency of every router against seeded data.
+
+Seeds an empty database with benchmarks.dataset (a temporary SQLite file, or
+the database given with --database-url), serves the app with uvicorn and runs
+each scenario with concurrent clients. Prints (or writes with --output) a JSON
+document with throughput and p50/p95/p99 per endpoint; with --baseline, the
+p95 of each endpoint is compared with a previous run and the command fails
+when one regressed by more than --tolerance.
+
+    python -m benchmarks.endpoints --scale small --clients 16 --requests 20 --output bench.json
+    python -m benchmarks.endpoints --scale small --baseline bench.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from app.config.cache import set_cache
+from app.config.database import create_db_engine, set_engine
+from app.config.settings import get_database_settings
+from benchmarks.concurrency import serve, summarize
+from benchmarks.dataset import FIRST_SEASON, SCALES, Generator, Scale, seed
+
+# (path, JSON/NDJSON body or None) of the i-th request of a scenario.
+RequestFactory = Callable[[random.Random, int], Tuple[str, Optional[bytes]]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    method: str
+    request: RequestFactory
+
+
+def scenarios(scale: Scale) -> List[Scenario]:
+    """One or more scenarios per router, with IDs drawn from the seeded data."""
+    generator = Generator(scale)
+    countries, teams, players = scale.countries, generator.teams, generator.players
+    championships = scale.countries * scale.seasons
+    matches = championships * scale.teams_per_league * (scale.teams_per_league - 1)
+    seasons = [str(FIRST_SEASON + index) for index in range(scale.seasons)]
+    run = time.time_ns()
+
+    def get(name: str, path: Callable[[random.Random], str]) -> Scenario:
+        return Scenario(name, "GET", lambda rng, i: (path(rng), None))
+
+    def country(rng): return rng.randint(1, countries)
+    def team(rng): return rng.randint(1, teams)
+    def player(rng): return rng.randint(1, players)
+    def championship(rng): return rng.randint(1, championships)
+
+    def fixture_day(rng):
+        return date(FIRST_SEASON + rng.randrange(scale.seasons), 8, 1) + timedelta(days=7 * rng.randrange(30))
+
+    def head_to_head(rng):
+        home = team(rng)
+        rivals = generator.league_teams((home - 1) // scale.teams_per_league + 1)
+        away = rng.choice([rival for rival in rivals if rival != home])
+        return f"/matches/head-to-head?home_team_id={home}&away_team_id={away}"
+
+    def import_countries(rng, i):
+        body = "".join(json.dumps({"name": f"Bench {run}-{i}-{n}"}) + "\n" for n in range(10))
+        return "/import/country", body.encode()
+
+    return [
+        get("GET /country/", lambda rng: "/country/?limit=50"),
+        get("GET /country/{country_id}", lambda rng: f"/country/{country(rng)}"),
+        get("GET /country/{country_id}/teams", lambda rng: f"/country/{country(rng)}/teams?limit=50"),
+        get("GET /country/{country_id}/players", lambda rng: f"/country/{country(rng)}/players?limit=50"),
+        get("GET /country/{country_id}/stadiums", lambda rng: f"/country/{country(rng)}/stadiums?limit=50"),
+        get("GET /country/{country_id}/summary", lambda rng: f"/country/{country(rng)}/summary"),
+        get("GET /country/summary", lambda rng: "/country/summary"),
+        get("GET /championship/", lambda rng: "/championship/?limit=50"),
+        get("GET /championship/id/{championship_id}", lambda rng: f"/championship/id/{championship(rng)}"),
+        get("GET /championship/name/{championship_name}",
+            lambda rng: f"/championship/name/Liga {country(rng)} {rng.choice(seasons)}"),
+        get("GET /championship/{championship_id}/standings",
+            lambda rng: f"/championship/{championship(rng)}/standings"),
+        get("GET /championship/{championship_id}/stats/{metric}",
+            lambda rng: f"/championship/{championship(rng)}/stats/goals"),
+        get("GET /championship/seasons/{season}/stats/{metric}",
+            lambda rng: f"/championship/seasons/{rng.choice(seasons)}/stats/minutes"),
+        get("GET /stadiums/", lambda rng: "/stadiums/?limit=50"),
+        get("GET /stadiums/{stadium_id}", lambda rng: f"/stadiums/{team(rng)}"),
+        get("GET /stadiums?ids", lambda rng: "/stadiums?ids=" + ",".join(str(team(rng)) for _ in range(10))),
+        get("GET /players/", lambda rng: "/players/?limit=50"),
+        get("GET /players/{player_id}", lambda rng: f"/players/{player(rng)}"),
+        get("GET /players?ids", lambda rng: "/players?ids=" + ",".join(str(player(rng)) for _ in range(20))),
+        get("GET /players/details", lambda rng: "/players/details?ids=" + ",".join(
+            str(player(rng)) for _ in range(20))),
+        get("GET /players/positions", lambda rng: "/players/positions"),
+        get("GET /players/{player_id}/career", lambda rng: f"/players/{player(rng)}/career"),
+        get("GET /teams/", lambda rng: "/teams/?limit=50"),
+        get("GET /teams/{team_id}", lambda rng: f"/teams/{team(rng)}"),
+        get("GET /teams?ids", lambda rng: "/teams?ids=" + ",".join(str(team(rng)) for _ in range(20))),
+        get("GET /teams/{team_id}/players", lambda rng: f"/teams/{team(rng)}/players"),
+        get("GET /teams/{team_id}/squad", lambda rng: f"/teams/{team(rng)}/squad"),
+        get("GET /teams/{team_id}/participations", lambda rng: f"/teams/{team(rng)}/participations"),
+        get("GET /teams/{team_id}/players/career", lambda rng: f"/teams/{team(rng)}/players/career"),
+        get("GET /matches/?championship_id", lambda rng: f"/matches/?championship_id={championship(rng)}&limit=50"),
+        get("GET /matches/?team_id", lambda rng: f"/matches/?team_id={team(rng)}&limit=50"),
+        get("GET /matches/{match_id}", lambda rng: f"/matches/{rng.randint(1, matches)}"),
+        get("GET /matches/fixtures", lambda rng: f"/matches/fixtures?date={fixture_day(rng)}&days=3"),
+        get("GET /matches/head-to-head", head_to_head),
+        get("GET /matches/{match_id}/events", lambda rng: f"/matches/{rng.randint(1, matches)}/events"),
+        get("GET /search", lambda rng: f"/search?q=Jogador {player(rng)}"),
+        get("GET /search?type", lambda rng: "/search?q=clube&type=team&limit=10"),
+        get("GET /health/db", lambda rng: "/health/db"),
+        get("GET /health/cache", lambda rng: "/health/cache"),
+        get("GET /metrics", lambda rng: "/metrics"),
+        get("GET /export/{entity}.{format}", lambda rng: "/export/team.ndjson"),
+        Scenario("POST /import/{entity}", "POST", import_countries),
+    ]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, scenario: Scenario, clients: int, requests_per_client: int, warmup: int, seed: int
+) -> Dict[str, float]:
+    rng = random.Random(f"{seed}:{scenario.name}")
+    counter = iter(range(10 ** 9))
+
+    async def send() -> Tuple[float, bool]:
+        path, body = scenario.request(rng, next(counter))
+        start = time.perf_counter()
+        response = await client.request(
+            scenario.method, path, content=body,
+            headers={"content-type": "application/x-ndjson"} if body is not None else None,
+        )
+        await response.aread()
+        return time.perf_counter() - start, response.is_success
+
+    for _ in range(warmup):
+        await send()
+
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        for _ in range(requests_per_client):
+            latency, ok = await send()
+            if ok:
+                latencies.append(latency)
+            else:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    result = summarize(latencies, elapsed) if latencies else {"requests": 0}
+    result["errors"] = errors
+    return result
+
+
+async def run_all(
+    base_url: str, selected: List[Scenario], clients: int, requests_per_client: int, warmup: int, seed: int
+) -> Dict[str, Dict[str, float]]:
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=None) as client:
+        return {
+            scenario.name: await run_scenario(client, scenario, clients, requests_per_client, warmup, seed)
+            for scenario in selected
+        }
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[dict]:
+    """Endpoints whose p95 grew by more than ``tolerance`` (0.2 = 20%) against the baseline."""
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name, {}).get("p95_ms")
+        after = result.get("p95_ms")
+        if before and after and after > before * (1 + tolerance):
+            regressions.append({"endpoint": name, "baseline_p95_ms": before, "p95_ms": after,
+                                "change": round(after / before - 1, 3)})
+    return regressions
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database-url", help="empty Postgres/SQLite database (default: temporary SQLite file)")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=20, help="requests per client and endpoint")
+    parser.add_argument("--warmup", type=int, default=3, help="requests per endpoint before measuring")
+    parser.add_argument("--only", action="append", default=[], help="run the endpoints containing this text")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="JSON report of a previous run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p95 growth against the baseline")
+    args = parser.parse_args(argv)
+
+    from app.main import app
+
+    scale = SCALES[args.scale]
+    selected = [
+        scenario for scenario in scenarios(scale)
+        if not args.only or any(text in scenario.name for text in args.only)
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.database_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        engine = create_db_engine(get_database_settings(url))
+        started = time.perf_counter()
+        rows = seed(engine, scale, args.seed)
+        seed_seconds = round(time.perf_counter() - started, 2)
+        set_engine(engine)
+        set_cache(None)
+        try:
+            with serve(app) as base_url:
+                results = asyncio.run(run_all(base_url, selected, args.clients, args.requests, args.warmup, args.seed))
+        finally:
+            set_engine(None)
+            engine.dispose()
+
+    report = {
+        "commit": _commit(),
+        "dialect": engine.dialect.name,
+        "config": {key: value for key, value in vars(args).items() if key not in ("database_url", "output", "baseline")},
+        "scale": asdict(scale),
+        "rows": rows,
+        "seed_seconds": seed_seconds,
+        "results": results,
+    }
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        report["baseline_commit"] = baseline.get("commit")
+        report["regressions"] = compare(results, baseline.get("results", {}), args.tolerance)
+
+    document = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(document + "\n")
+    print(document)
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""Live events benchmark: fan-out of one match feed to many subscribers in one worker.
+
+Opens ``--subscribers`` Server-Sent Events streams (the ``sse_stream``
+generator the endpoint returns, each replaying the match from an in-memory
+SQLite database first) on one event loop, then publishes ``--events`` goals
+through the hub, ``--interval-ms`` apart. A ``--slow`` fraction of the
+subscribers never reads, to show that they are dropped once their queue is
+full instead of holding up the others.
+
+    python -m benchmarks.live --subscribers 10000 --events 20 --interval-ms 200
+
+Prints the time to deliver each event to every subscriber (p50/p95/p99),
+the per-delivery latency and the memory held per subscriber.
+"""
+import argparse
+import asyncio
+import json
+import resource
+import time
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, create_engine
+
+import app.schemas.match  # noqa: F401 - registers every table in the metadata
+from app.config.database import set_engine
+from app.config.live import LiveHub, get_hub, set_hub
+from app.routes.routes_live import _message, sse_stream
+from app.schemas.championship import Championship
+from app.schemas.country import Country
+from app.schemas.match import EventType, Match, MatchEvent
+from app.schemas.player import Player, Position
+from app.schemas.stadium import Stadium
+from app.schemas.team import Team
+from app.services.LiveService import START, FeedItem
+from benchmarks.concurrency import percentile
+
+
+def _engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        def load(model, rows):
+            connection.execute(insert(model.__table__), rows)
+
+        load(Country, [{"name": "Brasil"}])
+        load(Position, [{"name": "Atacante"}])
+        load(Team, [{"name": "Santos", "country_id": 1}, {"name": "Bahia", "country_id": 1}])
+        load(Player, [{"name": "Pelé", "country_id": 1, "position_id": 1, "team_id": 1}])
+        load(Stadium, [{"name": "Vila Belmiro", "city": "Santos", "country_id": 1}])
+        load(Championship, [{"name": "Brasileirão", "season": "1959"}])
+        load(EventType, [{"name": "Gol"}])
+        load(Match, [{"home_team_id": 1, "away_team_id": 2, "championship_id": 1, "stadium_id": 1,
+                      "date": datetime(1959, 12, 30, 16)}])
+        load(MatchEvent, [{"match_id": 1, "player_id": 1, "event_type_id": 1, "minute": 1}])
+    return engine
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
+
+
+async def run(subscribers: int, events: int, interval: float, slow: float, queue_size: int) -> dict:
+    set_hub(LiveHub(queue_size=queue_size, heartbeat=15))
+    hub = get_hub()
+    published: List[float] = [0.0] * events
+    received = [[] for _ in range(events)]
+    bytes_sent = 0
+    ready = asyncio.Event()
+    opened = 0
+
+    async def subscriber(reads: bool) -> None:
+        nonlocal bytes_sent, opened
+        stream = sse_stream(1, START)
+        async for frame in stream:
+            if frame.startswith("id: 1.0"):
+                # Replay done: the stored goal is the only entry before the live ones.
+                opened += 1
+                if opened == subscribers:
+                    ready.set()
+                if not reads:
+                    # Subscribed but never reads again (a stalled connection).
+                    await asyncio.sleep(3600)
+                continue
+            if frame.startswith("id: "):
+                index = int(frame[4:frame.index(".")]) - 2
+                received[index].append(time.perf_counter())
+                bytes_sent += len(frame)
+
+    slow_count = int(subscribers * slow)
+    # Peak resident memory (KiB on Linux): it only grows while the streams are opened.
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(subscriber(reads=index >= slow_count)) for index in range(subscribers)]
+    await ready.wait()
+    connect_seconds = time.perf_counter() - started
+    memory_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before
+
+    for index in range(events):
+        item = FeedItem("event", index + 2, index + 2, {"id": index + 2, "match_id": 1, "player_id": 1,
+                                                        "event_type_id": 1, "minute": index + 2})
+        published[index] = time.perf_counter()
+        hub.publish(1, _message(item))
+        await asyncio.sleep(interval)
+    # Let the last event reach everyone.
+    await asyncio.sleep(max(interval, 0.5))
+
+    stats = hub.stats()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    fan_out = [max(times) - published[index] for index, times in enumerate(received) if times]
+    deliveries = [at - published[index] for index, times in enumerate(received) for at in times]
+    return {
+        "subscribers": subscribers,
+        "slow_subscribers": slow_count,
+        "events": events,
+        "queue_size": queue_size,
+        "connect_seconds": round(connect_seconds, 2),
+        "memory_per_subscriber_kb": round(memory_kb / subscribers, 1),
+        "deliveries": len(deliveries),
+        "fan_out_ms": {
+            "p50": _ms(percentile(fan_out, 0.50)),
+            "p95": _ms(percentile(fan_out, 0.95)),
+            "p99": _ms(percentile(fan_out, 0.99)),
+        },
+        "delivery_ms": {
+            "p50": _ms(percentile(deliveries, 0.50)),
+            "p99": _ms(percentile(deliveries, 0.99)),
+        },
+        "bytes_sent": bytes_sent,
+        "hub": stats,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subscribers", type=int, default=10_000)
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--interval-ms", type=float, default=200)
+    parser.add_argument("--slow", type=float, default=0.01, help="Fraction of subscribers that never read")
+    parser.add_argument("--queue-size", type=int, default=16)
+    args = parser.parse_args(argv)
+
+    set_engine(_engine())
+    try:
+        result = asyncio.run(run(args.subscribers, args.events, args.interval_ms / 1000, args.slow, args.queue_size))
+    finally:
+        set_engine(None)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Search benchmark: the in-process n-gram index over synthetic names.
+
+Builds an NgramIndex over ``--names`` generated player-like names (first name,
+surname and an optional second surname, some with accents) and reports the
+build time and the p50/p95/p99 latency of exact, prefix, multi-word prefix and
+misspelled queries. PostgreSQL (pg_trgm) is measured by the endpoint benchmark.
+
+    python -m benchmarks.search --names 1000000 --queries 200
+"""
+import argparse
+import json
+import random
+import time
+from typing import Dict, List, Optional
+
+from app.services.ngram import NgramIndex
+from benchmarks.concurrency import percentile
+
+FIRST = ("João", "José", "Lucas", "Gabriel", "Mateus", "Rafael", "Kylian", "Lionel", "Érling", "Thiago",
+         "André", "Vinícius", "Rodrigo", "Bruno", "Diego", "Sérgio", "Luís", "Antoine", "Mohamed", "Harry",
+         "Pedro", "Marcos", "Jürgen", "Álvaro", "Kenji", "Oluwaseun", "Wojciech", "Zlatan", "Hakim", "Ngolo")
+ONSETS = ("", "b", "c", "d", "f", "g", "h", "j", "k", "l", "m", "n", "p", "r", "s", "t", "v", "w", "z",
+          "br", "ch", "cr", "dr", "gr", "lh", "nh", "pr", "st", "tr", "sch")
+VOWELS = ("a", "e", "i", "o", "u", "á", "é", "í", "ó", "ú", "ã", "õ", "ü", "y", "ei", "ou")
+CODAS = ("", "", "", "n", "r", "s", "l", "m", "z", "k")
+SYLLABLES = tuple(onset + vowel + coda for onset in ONSETS for vowel in VOWELS for coda in CODAS)
+
+
+def _surname(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+
+
+def names(count: int, seed: int = 42) -> List[str]:
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(FIRST)} {_surname(rng)}" + (f" {_surname(rng)}" if rng.random() < 0.5 else "")
+        for _ in range(count)
+    ]
+
+
+def _misspell(rng: random.Random, name: str) -> str:
+    position = rng.randrange(1, len(name) - 1)
+    return name[:position] + name[position + 1:]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--names", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200, help="queries of each kind")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    generated = names(args.names, args.seed)
+    started = time.perf_counter()
+    index = NgramIndex(range(1, len(generated) + 1), generated)
+    build_seconds = time.perf_counter() - started
+
+    rng = random.Random(args.seed)
+    sample = [rng.choice(generated) for _ in range(args.queries)]
+    kinds = {
+        "exact": sample,
+        "prefix": [name[:rng.randint(3, 6)] for name in sample],
+        "word_prefix": [" ".join(word[:3] for word in name.split()[1:]) for name in sample],
+        "misspelled": [_misspell(rng, name) for name in sample],
+    }
+    results: Dict[str, Dict[str, float]] = {}
+    for kind, queries in kinds.items():
+        latencies = []
+        for query in queries:
+            started = time.perf_counter()
+            index.search(query, 20)
+            latencies.append(time.perf_counter() - started)
+        results[kind] = {f"p{p}_ms": round(percentile(latencies, p / 100) * 1000, 2) for p in (50, 95, 99)}
+
+    print(json.dumps({"names": len(index), "build_seconds": round(build_seconds, 2), "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Serialization benchmark: a 10k-row list response, before and after the fast path.
+
+Loads ``--rows`` players into an in-memory SQLite database and times building
+the JSON body of Page[Player] both ways:
+
+* orm: ``select(Player)`` ORM objects, then FastAPI's response_model step
+  (validation and serialization of every row) and the default JSONResponse;
+* rows: ``rows_of(Player)`` tuples turned into dicts and encoded by
+  FastJSONResponse (orjson when installed), as the list endpoints do now;
+* fields: the same, reading only ``--fields`` (``?fields=id,name``).
+
+It also prints the size of the page in each encoding the list endpoints
+negotiate (JSON, columnar JSON, MessagePack when installed), raw and gzipped.
+
+    python -m benchmarks.serialization --rows 10000 --repeat 20
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import insert
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+import app.schemas.match  # noqa: F401 - registers every table in the metadata
+from app.repositories.base import rows_of
+from app.routes.responses import ColumnarJSONResponse, FastJSONResponse, MsgPackResponse, as_dicts, msgpack, orjson
+from app.schemas.country import Country
+from app.schemas.pagination import Page
+from app.schemas.player import Player, Position
+
+
+def _engine(rows: int):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(Country.__table__), [{"name": "Brasil"}])
+        connection.execute(insert(Position.__table__), [{"name": "Atacante"}])
+        connection.execute(insert(Player.__table__), [
+            {"name": f"Jogador {i}", "birth_date": datetime(1990, 1, 1) + timedelta(days=i % 5000),
+             "country_id": 1, "position_id": 1, "team_id": None}
+            for i in range(rows)
+        ])
+    return engine
+
+
+def _timed(step: Callable[[], object], repeat: int) -> Dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        step()
+        samples.append(time.perf_counter() - started)
+    return {"median_ms": round(statistics.median(samples) * 1000, 2), "min_ms": round(min(samples) * 1000, 2)}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--fields", default="id,name", help="Columns of the projected query")
+    args = parser.parse_args(argv)
+
+    engine = _engine(args.rows)
+    field = create_model_field("Response_get_all_players", Page[Player], mode="serialization")
+
+    def orm_query():
+        with Session(engine) as session:
+            return session.exec(select(Player).order_by(Player.id)).all()
+
+    def rows_query():
+        with Session(engine) as session:
+            return session.execute(rows_of(Player).order_by(Player.id)).all()
+
+    fields = tuple(args.fields.split(","))
+
+    def fields_query():
+        with Session(engine) as session:
+            return session.execute(rows_of(Player, fields).order_by(Player.id)).all()
+
+    def orm_encode(players):
+        content = asyncio.run(serialize_response(field=field, response_content={"items": players, "next": None}))
+        return JSONResponse(content).body
+
+    def rows_encode(rows):
+        return FastJSONResponse({"items": as_dicts(rows), "next": None}).body
+
+    orm_players, rows, projected = orm_query(), rows_query(), fields_query()
+    assert json.loads(orm_encode(orm_players)) == json.loads(rows_encode(rows))
+
+    results = {
+        "orm": {
+            "query": _timed(orm_query, args.repeat),
+            "encode": _timed(lambda: orm_encode(orm_players), args.repeat),
+            "total": _timed(lambda: orm_encode(orm_query()), args.repeat),
+        },
+        "rows": {
+            "query": _timed(rows_query, args.repeat),
+            "encode": _timed(lambda: rows_encode(rows), args.repeat),
+            "total": _timed(lambda: rows_encode(rows_query()), args.repeat),
+        },
+        "fields": {
+            "query": _timed(fields_query, args.repeat),
+            "encode": _timed(lambda: rows_encode(projected), args.repeat),
+            "total": _timed(lambda: rows_encode(fields_query()), args.repeat),
+        },
+    }
+    page = {"items": rows, "next": None}
+    encodings = [FastJSONResponse, ColumnarJSONResponse] + ([MsgPackResponse] if msgpack is not None else [])
+    sizes = {}
+    for response_class in encodings:
+        body = response_class.for_page(page).body
+        sizes[response_class.media_type] = {"bytes": len(body), "gzip_bytes": len(gzip.compress(body, 6))}
+    body = FastJSONResponse.for_page({"items": projected, "next": None}).body
+    sizes[f"application/json ?fields={args.fields}"] = {"bytes": len(body), "gzip_bytes": len(gzip.compress(body, 6))}
+
+    speedup = results["orm"]["total"]["median_ms"] / results["rows"]["total"]["median_ms"]
+    print(json.dumps({
+        "rows": args.rows,
+        "encoder": "orjson" if orjson is not None else "json",
+        "results": results,
+        "speedup": round(speedup, 1),
+        "sizes": sizes,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
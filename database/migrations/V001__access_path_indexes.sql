@@ -0,0 +1,35 @@
+-- Indexes for the columns the repositories filter, join and sort on.
+-- Foreign key indexes used by the paginated sub-collections also include the
+-- primary key, so "WHERE fk = ? AND id > ? ORDER BY id LIMIT ?" is a single
+-- index range scan.
+
+-- Players of a team / of a country, player search by name
+CREATE INDEX IF NOT EXISTS ix_players_team_id ON players (team_id, id);
+CREATE INDEX IF NOT EXISTS ix_players_country_id ON players (country_id, id);
+CREATE INDEX IF NOT EXISTS ix_players_name ON players (name);
+
+-- Teams of a country, team search by name
+CREATE INDEX IF NOT EXISTS ix_teams_country_id ON teams (country_id, id);
+CREATE INDEX IF NOT EXISTS ix_teams_name ON teams (name);
+
+-- Stadiums of a country
+CREATE INDEX IF NOT EXISTS ix_stadiums_country_id ON stadiums (country_id, id);
+
+-- Championship search by name, participations of a team
+CREATE INDEX IF NOT EXISTS ix_championships_name ON championships (name);
+CREATE INDEX IF NOT EXISTS ix_championship_participations_team_id ON championship_participations (team_id);
+
+-- Matches by championship, team, stadium and date
+CREATE INDEX IF NOT EXISTS ix_matches_championship_id ON matches (championship_id, date);
+CREATE INDEX IF NOT EXISTS ix_matches_home_team_id ON matches (home_team_id, away_team_id);
+CREATE INDEX IF NOT EXISTS ix_matches_away_team_id ON matches (away_team_id);
+CREATE INDEX IF NOT EXISTS ix_matches_stadium_id ON matches (stadium_id);
+CREATE INDEX IF NOT EXISTS ix_matches_date ON matches (date);
+
+-- Child rows of matches, players and teams (relationship loads)
+CREATE INDEX IF NOT EXISTS ix_match_events_match_id ON match_events (match_id);
+CREATE INDEX IF NOT EXISTS ix_match_events_player_id ON match_events (player_id);
+CREATE INDEX IF NOT EXISTS ix_match_events_event_type_id ON match_events (event_type_id);
+CREATE INDEX IF NOT EXISTS ix_substitutions_match_id ON substitutions (match_id);
+CREATE INDEX IF NOT EXISTS ix_lineups_team_id ON lineups (team_id);
+CREATE INDEX IF NOT EXISTS ix_lineups_player_id ON lineups (player_id);
@@ -0,0 +1,3 @@
+-- Match list filtered by season: the championships of the season are looked
+-- up first, then ix_matches_championship_id serves each of them.
+CREATE INDEX IF NOT EXISTS ix_championships_season ON championships (season);
@@ -0,0 +1,14 @@
+-- Materialized league tables, maintained by the API when match scores change.
+-- Fill it for existing matches with: python -m app.cli standings
+CREATE TABLE IF NOT EXISTS standings (
+    championship_id INTEGER NOT NULL REFERENCES championships(id),
+    team_id INTEGER NOT NULL REFERENCES teams(id),
+    played INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    draws INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    goals_for INTEGER NOT NULL DEFAULT 0,
+    goals_against INTEGER NOT NULL DEFAULT 0,
+    points INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (championship_id, team_id)
+);
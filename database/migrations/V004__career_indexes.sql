@@ -0,0 +1,4 @@
+-- Player careers: the substitutions a player came on or went off in are
+-- looked up by player, like lineups and match events already are.
+CREATE INDEX IF NOT EXISTS ix_substitutions_player_in_id ON substitutions (player_in_id);
+CREATE INDEX IF NOT EXISTS ix_substitutions_player_out_id ON substitutions (player_out_id);
@@ -0,0 +1,18 @@
+-- Name search (/search): trigram indexes over the normalized names.
+-- footballhub_search_key() mirrors app.services.text.normalize (no accents,
+-- lower case, punctuation turned into single spaces). unaccent() is only
+-- STABLE, so the wrapper names its dictionary and is declared IMMUTABLE to be
+-- usable in the index expressions. The GIN gin_trgm_ops indexes serve both the
+-- similarity operator (%) and the LIKE 'prefix%' / '%word%' filters.
+CREATE EXTENSION IF NOT EXISTS unaccent;
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE OR REPLACE FUNCTION footballhub_search_key(name text) RETURNS text
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS
+$$ SELECT trim(regexp_replace(lower(public.unaccent('public.unaccent'::regdictionary, name)), '[^a-z0-9]+', ' ', 'g')) $$;
+
+CREATE INDEX IF NOT EXISTS ix_players_search_key ON players USING gin (footballhub_search_key(name) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_teams_search_key ON teams USING gin (footballhub_search_key(name) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_championships_search_key ON championships USING gin (footballhub_search_key(name) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_stadiums_search_key ON stadiums USING gin (footballhub_search_key(name) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_countries_search_key ON countries USING gin (footballhub_search_key(name) gin_trgm_ops);
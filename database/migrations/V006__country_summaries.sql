@@ -0,0 +1,20 @@
+-- Materialized per-country counters, maintained by the API when teams, players,
+-- stadiums or championships are created, moved or deleted.
+-- Recompute them after writes made outside the API with: python -m app.cli summaries
+CREATE TABLE IF NOT EXISTS country_summaries (
+    country_id INTEGER PRIMARY KEY REFERENCES countries(id),
+    teams INTEGER NOT NULL DEFAULT 0,
+    players INTEGER NOT NULL DEFAULT 0,
+    stadiums INTEGER NOT NULL DEFAULT 0,
+    championships INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT INTO country_summaries (country_id, teams, players, stadiums, championships)
+SELECT
+    c.id,
+    (SELECT COUNT(*) FROM teams t WHERE t.country_id = c.id),
+    (SELECT COUNT(*) FROM players p WHERE p.country_id = c.id),
+    (SELECT COUNT(*) FROM stadiums s WHERE s.country_id = c.id),
+    (SELECT COUNT(*) FROM championships ch WHERE ch.country_id = c.id)
+FROM countries c
+WHERE NOT EXISTS (SELECT 1 FROM country_summaries cs WHERE cs.country_id = c.id);
@@ -0,0 +1,25 @@
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, create_engine
+
+import app.schemas.match  # noqa: F401 - registers every table in the metadata
+import app.schemas.standing  # noqa: F401
+from app.config.cache import set_cache
+from app.config.database import set_engine
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite database injected as the process-wide engine."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    set_engine(engine)
+    set_cache(None)
+    yield engine
+    set_engine(None)
+    set_cache(None)
+    engine.dispose()
@@ -0,0 +1,51 @@
+from sqlalchemy import func, select
+
+from app.schemas.match import Lineup, Match, MatchEvent, Substitution
+from benchmarks.dataset import GOAL, SCALES, seed
+from benchmarks.endpoints import compare
+
+
+class TestDataset:
+
+    def test_seed__tiny_scale__expected_double_round_robin_and_consistent_events(self, engine):
+        # Fixture
+        scale = SCALES["tiny"]
+
+        # Exercise
+        rows = seed(engine, scale)
+
+        # Assert
+        teams = scale.countries * scale.teams_per_league
+        matches = scale.countries * scale.seasons * scale.teams_per_league * (scale.teams_per_league - 1)
+        assert rows["teams"] == teams
+        assert rows["players"] == teams * scale.players_per_team
+        assert rows["matches"] == matches
+        assert rows["lineups"] == 22 * matches
+        assert rows["substitutions"] == 6 * matches
+        assert rows["standings"] == teams * scale.seasons
+        with engine.connect() as connection:
+            goals = connection.execute(select(func.sum(Match.home_score + Match.away_score))).scalar()
+            goal_events = connection.execute(
+                select(func.count()).select_from(MatchEvent).where(MatchEvent.event_type_id == GOAL)
+            ).scalar()
+            # Substitutes come from the bench, never from the starting eleven.
+            starters_subbed_on = connection.execute(
+                select(func.count()).select_from(Substitution).join(
+                    Lineup, (Lineup.match_id == Substitution.match_id) & (Lineup.player_id == Substitution.player_in_id)
+                )
+            ).scalar()
+        assert goals == goal_events
+        assert starters_subbed_on == 0
+
+    def test_compare__p95_over_tolerance__expected_regression(self):
+        # Fixture
+        baseline = {"GET /teams/": {"p95_ms": 10.0}, "GET /players/": {"p95_ms": 10.0}}
+        results = {"GET /teams/": {"p95_ms": 11.5}, "GET /players/": {"p95_ms": 13.0}, "GET /new": {"p95_ms": 1.0}}
+
+        # Exercise
+        regressions = compare(results, baseline, tolerance=0.2)
+
+        # Assert
+        assert regressions == [
+            {"endpoint": "GET /players/", "baseline_p95_ms": 10.0, "p95_ms": 13.0, "change": 0.3}
+        ]
@@ -0,0 +1,152 @@
+from sqlalchemy import event
+
+from app.config.cache import SharedVersions, TTLCache
+from app.services.CountryService import CountryService
+
+
+class FakeRedis:
+    """Local stand-in for a Redis server: only the commands the cache uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+    def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+
+    def test_get_or_load__second_call__expected_loader_called_once(self):
+        # Fixture
+        cache = TTLCache()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return ["Brasil"]
+
+        # Exercise
+        first = cache.get_or_load("country", "all", loader)
+        second = cache.get_or_load("country", "all", loader)
+
+        # Assert
+        assert first == second == ["Brasil"]
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_get_or_load__invalidated_while_loading__expected_stale_value_not_served(self):
+        # Fixture
+        cache = TTLCache()
+
+        def loader():
+            # A write commits (and invalidates) while the old value is being read.
+            cache.invalidate("country")
+            return ["Brasil"]
+
+        # Exercise
+        stale = cache.get_or_load("country", "all", loader)
+        fresh = cache.get_or_load("country", "all", lambda: ["Brasil", "Argentina"])
+
+        # Assert
+        assert stale == ["Brasil"]
+        assert fresh == ["Brasil", "Argentina"]
+
+    def test_get__expired_entry__expected_miss(self):
+        # Fixture
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.set("country", 1, "Brasil")
+
+        # Exercise
+        clock.now = 11
+        value = cache.get("country", 1)
+
+        # Assert
+        assert value is None
+        assert cache.stats()["entries"] == 0
+
+    def test_set__over_max_entries__expected_least_recently_used_evicted(self):
+        # Fixture
+        cache = TTLCache(max_entries=2)
+        cache.set("country", 1, "Brasil")
+        cache.set("country", 2, "Chile")
+        cache.get("country", 1)
+
+        # Exercise
+        cache.set("country", 3, "Peru")
+
+        # Assert
+        assert cache.get("country", 1) == "Brasil"
+        assert cache.get("country", 2) is None
+        assert cache.stats()["evictions"] == 1
+
+    def test_invalidate__namespace__expected_only_that_namespace_dropped(self):
+        # Fixture
+        cache = TTLCache()
+        cache.set("country", 1, "Brasil")
+        cache.set("stadium", 1, "Maracanã")
+
+        # Exercise
+        cache.invalidate("country")
+
+        # Assert
+        assert cache.get("country", 1) is None
+        assert cache.get("stadium", 1) == "Maracanã"
+
+    def test_invalidate__shared_backend__expected_other_worker_sees_it(self):
+        # Fixture
+        server = FakeRedis()
+        worker_a = TTLCache(versions=SharedVersions(server))
+        worker_b = TTLCache(versions=SharedVersions(server))
+        worker_a.set("country", "all", ["Brasil"])
+        worker_b.set("country", "all", ["Brasil"])
+
+        # Exercise
+        worker_a.invalidate("country")
+
+        # Assert
+        assert worker_b.get("country", "all") is None
+        assert worker_a.get("country", "all") is None
+
+
+class TestCountryServiceCache:
+
+    def test_get_all_countries__repeated__expected_one_query_until_create(self, engine):
+        # Fixture
+        service = CountryService()
+        service.create_country("Brasil")
+        selects = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count)
+
+        # Exercise
+        service.get_all_countries()
+        service.get_all_countries()
+        queries_before_create = len(selects)
+        service.create_country("Chile")
+        countries = service.get_all_countries()
+
+        # Assert
+        event.remove(engine, "before_cursor_execute", count)
+        assert queries_before_create == 1
+        assert [country.name for country in countries] == ["Brasil", "Chile"]
@@ -0,0 +1,55 @@
+import asyncio
+import threading
+import time
+
+from app.config.concurrency import configure_db_threads, run_db
+
+
+class TestRunDb:
+
+    def teardown_method(self):
+        configure_db_threads(None)
+
+    def test_run_db__blocking_call__expected_worker_thread(self):
+        # Fixture
+        configure_db_threads(2)
+
+        # Exercise
+        thread_id = asyncio.run(run_db(threading.get_ident))
+
+        # Assert
+        assert thread_id != threading.get_ident()
+
+    def test_run_db__more_calls_than_threads__expected_bounded_concurrency(self):
+        # Fixture
+        configure_db_threads(2)
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def blocking_call():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.pop()
+
+        async def exercise():
+            await asyncio.gather(*(run_db(blocking_call) for _ in range(8)))
+
+        # Exercise
+        asyncio.run(exercise())
+
+        # Assert
+        assert max(peak) == 2
+
+    def test_run_db__zero_threads__expected_inline_call(self):
+        # Fixture
+        configure_db_threads(0)
+
+        # Exercise
+        thread_id = asyncio.run(run_db(threading.get_ident))
+
+        # Assert
+        assert thread_id == threading.get_ident()
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from app.config.live import LiveHub, SlowConsumer
+
+
+class TestLiveHub:
+
+    def test_publish__two_channels__expected_only_channel_subscribers_get_it(self):
+        async def scenario():
+            # Fixture
+            hub = LiveHub(heartbeat=0.01)
+            first, second = hub.subscribe(1), hub.subscribe(1)
+            other = hub.subscribe(2)
+
+            # Exercise
+            delivered = hub.publish(1, "gol")
+
+            # Assert
+            assert delivered == 2
+            assert await first.get() == await second.get() == "gol"
+            assert await other.get() is None  # woken by the heartbeat
+
+        asyncio.run(scenario())
+
+    def test_publish__subscriber_queue_full__expected_dropped_after_queued_messages(self):
+        async def scenario():
+            # Fixture
+            hub = LiveHub(queue_size=2)
+            slow, fast = hub.subscribe(1), hub.subscribe(1)
+
+            # Exercise
+            for minute in range(3):
+                hub.publish(1, minute)
+                if minute < 2:
+                    assert await fast.get() == minute
+
+            # Assert
+            assert await fast.get() == 2
+            assert [await slow.get(), await slow.get()] == [0, 1]
+            with pytest.raises(SlowConsumer):
+                await slow.get()
+            assert hub.subscribers(1) == 1
+            assert hub.stats()["dropped"] == 1
+
+        asyncio.run(scenario())
+
+    def test_unsubscribe__last_subscriber__expected_channel_removed(self):
+        async def scenario():
+            # Fixture
+            hub = LiveHub()
+            subscription = hub.subscribe(1)
+
+            # Exercise
+            hub.unsubscribe(subscription)
+
+            # Assert
+            assert hub.stats()["channels"] == 0
+            assert hub.publish(1, "gol") == 0
+
+        asyncio.run(scenario())
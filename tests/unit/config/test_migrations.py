@@ -0,0 +1,55 @@
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import OperationalError
+
+from app.config.migrations import apply_migrations
+
+
+class TestApplyMigrations:
+
+    def _engine(self):
+        return create_engine("sqlite://")
+
+    def test_apply_migrations__run_twice__expected_each_file_applied_once(self, tmp_path):
+        # Fixture
+        engine = self._engine()
+        (tmp_path / "V001__create.sql").write_text("-- tabela de teste\nCREATE TABLE t (id INTEGER PRIMARY KEY);")
+        (tmp_path / "V002__index.sql").write_text("CREATE INDEX ix_t_id ON t (id);")
+
+        # Exercise
+        first = apply_migrations(engine, tmp_path)
+        second = apply_migrations(engine, tmp_path)
+
+        # Assert
+        assert first == ["V001__create.sql", "V002__index.sql"]
+        assert second == []
+        assert [index["name"] for index in inspect(engine).get_indexes("t")] == ["ix_t_id"]
+
+    def test_apply_migrations__other_dialect_file__expected_skipped(self, tmp_path):
+        # Fixture
+        engine = self._engine()
+        (tmp_path / "V001__create.sql").write_text("CREATE TABLE t (id INTEGER PRIMARY KEY);")
+        (tmp_path / "V002__concurrently.postgresql.sql").write_text("CREATE INDEX CONCURRENTLY ix ON t (id);")
+
+        # Exercise
+        applied = apply_migrations(engine, tmp_path)
+
+        # Assert
+        assert applied == ["V001__create.sql"]
+
+    def test_apply_migrations__failing_file__expected_rolled_back_and_not_recorded(self, tmp_path):
+        # Fixture
+        engine = self._engine()
+        (tmp_path / "V001__create.sql").write_text("CREATE TABLE t (id INTEGER PRIMARY KEY);")
+        (tmp_path / "V002__broken.sql").write_text("INSERT INTO t (id) VALUES (1);\nINSERT INTO missing VALUES (1);")
+
+        # Exercise
+        with pytest.raises(OperationalError):
+            apply_migrations(engine, tmp_path)
+
+        # Assert
+        with engine.connect() as connection:
+            versions = connection.execute(text("SELECT version FROM schema_migrations")).scalars().all()
+            rows = connection.execute(text("SELECT COUNT(*) FROM t")).scalar()
+        assert versions == ["V001__create.sql"]
+        assert rows == 0
@@ -0,0 +1,62 @@
+from sqlalchemy import event
+
+from app.repositories.countryRepository import CountryRepository
+from app.repositories.playerRepository import PlayerRepository
+from app.repositories.teamRepository import TeamRepository
+from app.services.PlayerService import PlayerService
+
+
+def _seed():
+    country = CountryRepository().create("Brasil")
+    team = TeamRepository().create("Flamengo", country.id)
+    repository = PlayerRepository()
+    position = repository.create_positions(["Atacante"])[0]
+    with_team = repository.create("Gabriel Barbosa", None, country.id, position.id, team.id)
+    free_agent = repository.create("Diego Costa", None, country.id, position.id)
+    return with_team, free_agent
+
+
+class TestPlayerOutput:
+
+    def test_get_output_by_id__existing_player__expected_one_query(self, engine):
+        # Fixture
+        player, _ = _seed()
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        # Exercise
+        output = PlayerRepository().get_output_by_id(player.id)
+
+        # Assert
+        assert len(statements) == 1
+        assert output.name == "Gabriel Barbosa"
+        assert output.country == "Brasil"
+        assert output.position == "Atacante"
+        assert output.team == "Flamengo"
+
+    def test_get_output_by_id__player_without_team__expected_team_none(self, engine):
+        # Fixture
+        _, free_agent = _seed()
+
+        # Exercise
+        output = PlayerRepository().get_output_by_id(free_agent.id)
+
+        # Assert
+        assert output.team is None
+
+    def test_get_output_by_id__non_existing_player__expected_none(self, engine):
+        # Exercise
+        output = PlayerRepository().get_output_by_id(999)
+
+        # Assert
+        assert output is None
+
+    def test_get_players_details__many_ids__expected_request_order(self, engine):
+        # Fixture
+        first, second = _seed()
+
+        # Exercise
+        outputs = PlayerService().get_players_details([second.id, 999, first.id, second.id])
+
+        # Assert
+        assert [output.id for output in outputs] == [second.id, first.id]
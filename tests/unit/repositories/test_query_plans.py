@@ -0,0 +1,166 @@
+"""Every query the repositories issue must be served by an index.
+
+The database is created from the models, stripped of its secondary indexes
+and then migrated with database/migrations, so the test checks the migration
+set. Each repository call is recorded and its statements are run again
+under EXPLAIN; a sequential scan on a seeded table fails the test.
+"""
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, insert
+from sqlmodel import SQLModel
+
+from app.config.migrations import apply_migrations
+from app.repositories.championshipRepository import ChampionshipRepository
+from app.repositories.countryRepository import CountryRepository
+from app.repositories.matchRepository import MatchRepository
+from app.repositories.playerRepository import PlayerRepository
+from app.repositories.stadiumRepository import StadiumRepository
+from app.repositories.standingRepository import StandingRepository
+from app.repositories.statsRepository import StatsRepository
+from app.repositories.teamRepository import TeamRepository
+from app.schemas.championship import Championship
+from app.schemas.country import Country
+from app.schemas.match import EventType, Lineup, Match, MatchEvent, Substitution
+from app.schemas.player import Player, Position
+from app.schemas.stadium import Stadium
+from app.schemas.team import ChampionshipParticipation, Team
+from app.services.teamService import TeamService
+
+COUNTRIES, TEAMS, PLAYERS, MATCHES = 20, 400, 8000, 2000
+
+
+def _seed(engine):
+    rng = random.Random(42)
+    start = datetime(2020, 1, 1)
+    with engine.begin() as connection:
+        def load(model, rows):
+            connection.execute(insert(model.__table__), rows)
+
+        load(Country, [{"name": f"Country {i}"} for i in range(COUNTRIES)])
+        load(Position, [{"name": name} for name in ["Goleiro", "Zagueiro", "Meia", "Atacante"]])
+        load(EventType, [{"name": name} for name in ["Gol", "Assistência", "Cartão amarelo"]])
+        load(Stadium, [{"name": f"Stadium {i}", "city": "City", "country_id": i % COUNTRIES + 1} for i in range(40)])
+        load(Team, [{"name": f"Team {i}", "country_id": i % COUNTRIES + 1} for i in range(TEAMS)])
+        load(Championship, [{"name": f"League {i}", "country_id": i + 1, "season": "2024"} for i in range(10)])
+        load(Player, [
+            {"name": f"Player {i}", "country_id": rng.randint(1, COUNTRIES), "position_id": rng.randint(1, 4),
+             "team_id": rng.randint(1, TEAMS)}
+            for i in range(PLAYERS)
+        ])
+        load(ChampionshipParticipation, [
+            {"championship_id": i % 10 + 1, "team_id": i + 1, "season": "2024"} for i in range(TEAMS)
+        ])
+        load(Match, [
+            {"home_team_id": i % TEAMS + 1, "away_team_id": (i + 7) % TEAMS + 1, "championship_id": i % 10 + 1,
+             "date": start + timedelta(days=i % 365), "stadium_id": i % 40 + 1, "home_score": 1, "away_score": 0}
+            for i in range(MATCHES)
+        ])
+        load(MatchEvent, [
+            {"match_id": i % MATCHES + 1, "player_id": rng.randint(1, PLAYERS), "event_type_id": i % 3 + 1, "minute": i % 90}
+            for i in range(2 * MATCHES)
+        ])
+        load(Lineup, [
+            {"match_id": i % MATCHES + 1, "team_id": i % TEAMS + 1, "player_id": i % PLAYERS + 1}
+            for i in range(2 * MATCHES)
+        ])
+        load(Substitution, [
+            {"match_id": i + 1, "player_out_id": i + 1, "player_in_id": i + 2, "minute": 60} for i in range(MATCHES // 2)
+        ])
+        if engine.dialect.name == "sqlite":
+            connection.exec_driver_sql("ANALYZE")
+
+
+@pytest.fixture
+def seeded_engine(engine):
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.drop(engine)
+    apply_migrations(engine)
+    _seed(engine)
+    return engine
+
+
+def _sequential_scans(connection, statement, parameters):
+    if connection.dialect.name == "sqlite":
+        plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+        details = [row[-1] for row in plan]
+        # Scans of subqueries (already filtered through an index) are fine; scans of tables are not.
+        return [
+            detail for detail in details
+            if detail.startswith("SCAN ") and " USING " not in detail
+            and detail.split()[1] in SQLModel.metadata.tables
+        ]
+    plan = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).scalars().all()
+    return [line.strip() for line in plan if "Seq Scan" in line]
+
+
+def _repository_calls():
+    countries, teams, players = CountryRepository(), TeamRepository(), PlayerRepository()
+    return {
+        "country.get_by_name": lambda: countries.get_by_name("Country 3"),
+        "country.get_all(after)": lambda: countries.get_all(after=5, limit=10),
+        "country.get_teams": lambda: countries.get_teams(3, after=10, limit=10),
+        "country.get_players": lambda: countries.get_players(3, after=10, limit=10),
+        "country.get_stadiums": lambda: countries.get_stadiums(3, after=1, limit=10),
+        "team.get_by_id": lambda: teams.get_by_id(7),
+        "team.get_by_name": lambda: teams.get_by_name("Team 7"),
+        "team.get_all(after)": lambda: teams.get_all(after=100, limit=10),
+        "team.get_players": lambda: teams.get_players(7, after=10, limit=10),
+        "team.get_participations": lambda: TeamService().get_participations_by_team(7),
+        "player.get_by_id": lambda: players.get_by_id(11),
+        "player.get_by_name": lambda: players.get_by_name("Player 11"),
+        "player.get_all(after)": lambda: players.get_all(after=4000, limit=10),
+        "player.get_output_by_id": lambda: players.get_output_by_id(11),
+        "player.get_outputs_by_ids": lambda: players.get_outputs_by_ids([11, 12, 13]),
+        "player.get_career_rows(player)": lambda: players.get_career_rows(
+            {"goals": [1], "assists": [2], "yellow_cards": [3]}, player_ids=[11]
+        ),
+        "player.get_career_rows(team)": lambda: players.get_career_rows({"goals": [1]}, team_id=7),
+        "player.get_names(team)": lambda: players.get_names(team_id=7),
+        "team.exists": lambda: teams.exists(7),
+        "championship.get_by_id": lambda: ChampionshipRepository().get_by_id(2),
+        "championship.get_by_name": lambda: ChampionshipRepository().get_by_name("League 2"),
+        "stadium.get_by_id": lambda: StadiumRepository().get_by_id(2),
+        "match.get_by_id": lambda: MatchRepository().get_by_id(5),
+        "match.get_by_teams": lambda: MatchRepository().get_by_teams(5, 12),
+        "match.search(championship)": lambda: MatchRepository().search(championship_id=3, limit=10),
+        "match.search(team)": lambda: MatchRepository().search(team_id=12, limit=10),
+        "match.search(stadium)": lambda: MatchRepository().search(stadium_id=4, limit=10),
+        "match.search(season)": lambda: MatchRepository().search(season="2024", limit=10),
+        "match.search(date range, after)": lambda: MatchRepository().search(
+            date_from=datetime(2020, 3, 1), date_to=datetime(2020, 4, 1), after=(datetime(2020, 3, 5), 100), limit=10
+        ),
+        "standing.get_table": lambda: StandingRepository().get_table(3),
+        "standing.get_results_between": lambda: StandingRepository().get_results_between(3, [1, 2, 3]),
+        "stats.load_rows": lambda: StatsRepository().load_rows([3]),
+        "stats.last_ids": lambda: StatsRepository().last_ids(),
+        "match.get_fixtures": lambda: MatchRepository().get_fixtures(datetime(2020, 3, 1), datetime(2020, 3, 2)),
+    }
+
+
+@pytest.mark.parametrize("name", sorted(_repository_calls()))
+def test_repository_query__seeded_database__expected_no_sequential_scan(seeded_engine, name):
+    # Fixture
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(seeded_engine, "before_cursor_execute", record)
+
+    # Exercise
+    try:
+        _repository_calls()[name]()
+    finally:
+        event.remove(seeded_engine, "before_cursor_execute", record)
+
+    # Assert
+    assert statements
+    with seeded_engine.connect() as connection:
+        for statement, parameters in statements:
+            scans = _sequential_scans(connection, statement, parameters)
+            assert not scans, f"{name}: {scans} in\n{statement}"
@@ -0,0 +1,159 @@
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert
+
+from app.main import app
+from app.routes.batch import BatchLoader
+from app.schemas.country import Country
+from app.schemas.player import Player, Position
+from app.schemas.stadium import Stadium
+from app.schemas.team import Team
+
+
+def _seed(engine):
+    with engine.begin() as connection:
+        def load(model, rows):
+            connection.execute(insert(model.__table__), rows)
+
+        load(Country, [{"name": "Brasil"}])
+        load(Position, [{"name": "Atacante"}])
+        load(Team, [{"name": "Santos", "country_id": 1, "founding_date": datetime(1912, 4, 14)},
+                    {"name": "Bahia", "country_id": 1, "founding_date": None}])
+        load(Player, [{"name": "Pelé", "country_id": 1, "position_id": 1, "team_id": 1}])
+        load(Stadium, [{"name": "Vila Belmiro", "city": "Santos", "country_id": 1}])
+
+
+class TestBatchEndpoints:
+
+    def test_get_teams__ids_with_repeat_and_miss__expected_request_order_and_missing(self, engine):
+        # Fixture
+        _seed(engine)
+
+        # Exercise
+        response = TestClient(app).get("/teams", params={"ids": "2,99,1,2"})
+
+        # Assert
+        assert response.status_code == 200
+        body = response.json()
+        assert [item and item["name"] for item in body["items"]] == ["Bahia", None, "Santos", "Bahia"]
+        assert body["missing"] == [99]
+        assert response.headers["etag"]
+
+    @pytest.mark.parametrize("url, name", [("/players?ids=1", "Pelé"), ("/stadiums?ids=1", "Vila Belmiro")])
+    def test_get_by_ids__other_entities__expected_items(self, engine, url, name):
+        # Fixture
+        _seed(engine)
+
+        # Exercise
+        response = TestClient(app).get(url)
+
+        # Assert
+        assert response.json() == {"items": [response.json()["items"][0]], "missing": []}
+        assert response.json()["items"][0]["name"] == name
+
+    def test_get_players_details__legacy_endpoint__expected_same_players_and_deprecated(self, engine):
+        # Fixture
+        _seed(engine)
+        client = TestClient(app)
+
+        # Exercise
+        details = client.get("/players/details", params={"ids": "1,99"})
+        batch = client.get("/players", params={"ids": "1,99"})
+
+        # Assert
+        assert details.json() == [batch.json()["items"][0]]
+        assert [route.deprecated for route in app.routes if getattr(route, "path", None) == "/players/details"] == [True]
+
+    def test_get_teams__without_ids__expected_redirect_to_list(self, engine):
+        # Fixture
+        _seed(engine)
+
+        # Exercise
+        response = TestClient(app).get("/teams", params={"limit": 1}, follow_redirects=False)
+
+        # Assert
+        assert response.status_code == 307
+        assert response.headers["location"].endswith("/teams/?limit=1")
+
+    def test_get_teams__invalid_ids__expected_400(self, engine):
+        # Exercise / Assert
+        assert TestClient(app).get("/teams", params={"ids": "1,a"}).status_code == 400
+
+    def test_get_team__concurrent_single_lookups__expected_one_query(self, engine):
+        # Fixture
+        _seed(engine)
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+
+        async def lookups():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await asyncio.gather(*(client.get(f"/teams/{team_id}") for team_id in [1, 2, 1, 3]))
+
+        # Exercise
+        responses = asyncio.run(lookups())
+
+        # Assert
+        assert [response.status_code for response in responses] == [200, 200, 200, 404]
+        assert responses[1].json()["name"] == "Bahia"
+        assert len(statements) == 1
+
+
+class TestBatchLoader:
+
+    def test_load__concurrent_keys__expected_one_batch_in_each_window(self):
+        # Fixture
+        calls = []
+
+        def load_many(ids):
+            calls.append(sorted(ids))
+            return {key: key * 10 for key in ids if key != 3}
+
+        loader = BatchLoader(load_many)
+
+        async def scenario():
+            first = await asyncio.gather(*(loader.load(key) for key in [1, 2, 3, 1]))
+            second = await loader.load(4)
+            return first, second
+
+        # Exercise
+        first, second = asyncio.run(scenario())
+
+        # Assert
+        assert first == [10, 20, None, 10]
+        assert second == 40
+        assert calls == [[1, 2, 3], [4]]
+
+    def test_load__max_batch_reached__expected_batch_sent_early(self):
+        # Fixture
+        calls = []
+        loader = BatchLoader(lambda ids: calls.append(len(ids)) or {}, max_batch=2)
+
+        async def scenario():
+            return await asyncio.gather(*(loader.load(key) for key in range(5)))
+
+        # Exercise
+        asyncio.run(scenario())
+
+        # Assert
+        assert calls == [2, 2, 1]
+
+    def test_load__load_many_fails__expected_error_for_every_lookup(self):
+        # Fixture
+        def load_many(ids):
+            raise RuntimeError("banco fora do ar")
+
+        loader = BatchLoader(load_many)
+
+        async def scenario():
+            return await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+
+        # Exercise
+        results = asyncio.run(scenario())
+
+        # Assert
+        assert [str(result) for result in results] == ["banco fora do ar"] * 2
@@ -0,0 +1,111 @@
+import gzip
+
+import brotli
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.config.settings import CompressionSettings
+from app.routes.compression import CompressionMiddleware, choose_encoding
+
+
+def _client(minimum_size=100, enabled=True):
+    api = FastAPI()
+
+    @api.get("/text/{size}")
+    def text(size: int):
+        return PlainTextResponse("gol " * size)
+
+    @api.get("/stream/{size}")
+    def stream(size: int):
+        return StreamingResponse(iter(["gol " * size] * 3), media_type="text/plain")
+
+    api.add_middleware(CompressionMiddleware, settings=CompressionSettings(enabled=enabled, minimum_size=minimum_size))
+    return TestClient(api)
+
+
+class TestCompressionMiddleware:
+
+    def test_large_body__gzip_accepted__expected_gzip_body(self):
+        # Fixture
+        client = _client()
+
+        # Exercise
+        response = client.get("/text/1000", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        assert response.headers["content-encoding"] == "gzip"
+        assert int(response.headers["content-length"]) < 4000
+        assert response.text == "gol " * 1000
+        assert "Accept-Encoding" in response.headers["vary"]
+
+    def test_body_below_minimum_size__expected_sent_uncompressed(self):
+        # Fixture
+        client = _client(minimum_size=1000)
+
+        # Exercise
+        response = client.get("/text/10", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        assert "content-encoding" not in response.headers
+        assert response.text == "gol " * 10
+
+    def test_compression_disabled__expected_sent_uncompressed(self):
+        # Fixture
+        client = _client(enabled=False)
+
+        # Exercise
+        response = client.get("/text/1000", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        assert "content-encoding" not in response.headers
+
+    def test_gzip_level__expected_standard_gzip_stream(self):
+        # Fixture
+        client = _client()
+
+        # Exercise
+        with client.stream("GET", "/text/1000", headers={"Accept-Encoding": "gzip"}) as response:
+            raw = b"".join(response.iter_raw())
+
+        # Assert
+        assert gzip.decompress(raw) == b"gol " * 1000
+
+    def test_large_body__br_accepted__expected_brotli_round_trip(self):
+        # Fixture
+        client = _client()
+
+        # Exercise
+        with client.stream("GET", "/text/1000", headers={"Accept-Encoding": "br, gzip"}) as response:
+            raw = b"".join(response.iter_raw())
+
+        # Assert
+        assert response.headers["content-encoding"] == "br"
+        assert len(raw) < 4000
+        assert brotli.decompress(raw) == b"gol " * 1000
+
+    def test_streamed_body__br_accepted__expected_whole_stream_decoded(self):
+        # Fixture
+        client = _client()
+
+        # Exercise
+        with client.stream("GET", "/stream/500", headers={"Accept-Encoding": "br"}) as response:
+            raw = b"".join(response.iter_raw())
+
+        # Assert
+        assert response.headers["content-encoding"] == "br"
+        assert brotli.decompress(raw) == b"gol " * 1500
+
+    @pytest.mark.parametrize("header, expected", [
+        ("gzip, deflate", "gzip"),
+        ("gzip;q=0", None),
+        ("identity", None),
+        ("", None),
+        ("*", "br"),
+        ("gzip, br", "br"),
+        ("br;q=0.5, gzip;q=0.8", "gzip"),
+    ])
+    def test_choose_encoding__accept_encoding__expected_coding(self, header, expected):
+        # Exercise / Assert
+        assert choose_encoding(header) == expected
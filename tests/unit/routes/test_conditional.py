@@ -0,0 +1,98 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.main import app
+from app.repositories.championshipRepository import ChampionshipRepository
+from app.repositories.countryRepository import CountryRepository
+from app.repositories.teamRepository import TeamRepository
+
+
+class TestConditionalRequests:
+
+    def test_get_team__matching_if_none_match__expected_304_without_query(self, engine):
+        # Fixture
+        country = CountryRepository().create("Brasil")
+        team = TeamRepository().create(name="Santos", country_id=country.id)
+        client = TestClient(app)
+        etag = client.get(f"/teams/{team.id}").headers["ETag"]
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        # Exercise
+        response = client.get(f"/teams/{team.id}", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        assert statements == []
+
+    def test_get_team__write_after_etag__expected_200_with_new_etag(self, engine):
+        # Fixture
+        country = CountryRepository().create("Brasil")
+        team = TeamRepository().create(name="Santos", country_id=country.id)
+        client = TestClient(app)
+        etag = client.get(f"/teams/{team.id}").headers["ETag"]
+
+        # Exercise
+        client.put(f"/teams/{team.id}", json={"name": "Santos FC", "country_id": country.id})
+        response = client.get(f"/teams/{team.id}", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["name"] == "Santos FC"
+        assert response.headers["ETag"] != etag
+
+    def test_get_all_countries__other_table_written__expected_still_304(self, engine):
+        # Fixture
+        country = CountryRepository().create("Brasil")
+        client = TestClient(app)
+        etag = client.get("/country/").headers["ETag"]
+
+        # Exercise
+        TeamRepository().create(name="Santos", country_id=country.id)
+        response = client.get("/country/", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == 304
+
+    def test_get_all_countries__different_page__expected_different_etag(self, engine):
+        # Fixture
+        CountryRepository().create("Brasil")
+        client = TestClient(app)
+
+        # Exercise
+        first = client.get("/country/?limit=1").headers["ETag"]
+        second = client.get("/country/?limit=2").headers["ETag"]
+
+        # Assert
+        assert first != second
+
+    def test_get_all_countries__if_modified_since_last_modified__expected_304(self, engine):
+        # Fixture
+        CountryRepository().create("Brasil")
+        client = TestClient(app)
+        last_modified = client.get("/country/").headers["Last-Modified"]
+
+        # Exercise
+        response = client.get("/country/", headers={"If-Modified-Since": last_modified})
+
+        # Assert
+        assert response.status_code == 304
+
+    def test_get_participations__championship_renamed__expected_200_with_new_name(self, engine):
+        # Fixture
+        country = CountryRepository().create("Brasil")
+        team = TeamRepository().create(name="Santos", country_id=country.id)
+        championship = ChampionshipRepository().create("Paulista", country.id)
+        TeamRepository().create_championshipParticipation(championship.id, team.id, "2024")
+        client = TestClient(app)
+        etag = client.get(f"/teams/{team.id}/participations").headers["ETag"]
+
+        # Exercise
+        ChampionshipRepository().update(championship.id, name="Paulistão")
+        response = client.get(f"/teams/{team.id}/participations", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == 200
+        assert "Paulistão" in response.text
@@ -0,0 +1,51 @@
+import csv
+import io
+import json
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.repositories.countryRepository import CountryRepository
+from app.repositories.teamRepository import TeamRepository
+
+
+class TestExport:
+
+    def test_export__ndjson__expected_one_line_per_row(self, engine):
+        # Fixture
+        country = CountryRepository().create("Brasil")
+        TeamRepository().create("Flamengo", country.id)
+        TeamRepository().create("Vasco da Gama", country.id)
+        client = TestClient(app)
+
+        # Exercise
+        response = client.get("/export/team.ndjson")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["name"] for row in rows] == ["Flamengo", "Vasco da Gama"]
+
+    def test_export__csv__expected_header_and_rows(self, engine):
+        # Fixture
+        CountryRepository().create("Brasil")
+        CountryRepository().create("São Tomé")
+        client = TestClient(app)
+
+        # Exercise
+        response = client.get("/export/country.csv")
+
+        # Assert
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert rows == [["id", "name"], ["1", "Brasil"], ["2", "São Tomé"]]
+
+    def test_export__unknown_entity__expected_404(self, engine):
+        # Fixture
+        client = TestClient(app)
+
+        # Exercise
+        response = client.get("/export/planet.csv")
+
+        # Assert
+        assert response.status_code == 404
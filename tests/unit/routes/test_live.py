@@ -0,0 +1,180 @@
+import asyncio
+import json
+import time
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from starlette.websockets import WebSocketDisconnect
+
+from app.config.live import LiveHub, get_hub, set_hub
+from app.main import app
+from app.routes import routes_live
+from app.routes.routes_live import _message, add_event, sse_stream
+from app.schemas.championship import Championship
+from app.schemas.country import Country
+from app.schemas.match import EventType, Match
+from app.schemas.player import Player, Position
+from app.schemas.stadium import Stadium
+from app.schemas.team import Team
+from app.schemas.live import MatchEventCreate
+from app.services.LiveService import START, FeedItem, advance, format_cursor
+
+
+@pytest.fixture
+def match(engine):
+    """Santos x Bahia, with two players on each side and the goal/card event types."""
+    with engine.begin() as connection:
+        def load(model, rows):
+            connection.execute(insert(model.__table__), rows)
+
+        load(Country, [{"name": "Brasil"}])
+        load(Position, [{"name": "Atacante"}])
+        load(Team, [{"name": "Santos", "country_id": 1}, {"name": "Bahia", "country_id": 1}])
+        load(Player, [{"name": name, "country_id": 1, "position_id": 1, "team_id": team}
+                      for name, team in [("Pelé", 1), ("Coutinho", 1), ("Bobô", 2), ("Charles", 2)]])
+        load(Stadium, [{"name": "Vila Belmiro", "city": "Santos", "country_id": 1}])
+        load(Championship, [{"name": "Brasileirão", "season": "1959"}])
+        load(EventType, [{"name": "Gol"}, {"name": "Cartão amarelo"}])
+        load(Match, [{"home_team_id": 1, "away_team_id": 2, "championship_id": 1, "stadium_id": 1,
+                      "date": datetime(1959, 12, 30, 16)}])
+    set_hub(LiveHub(queue_size=8, heartbeat=0.01))
+    yield 1
+    set_hub(None)
+
+
+class TestLiveRoutes:
+
+    def test_get_events__after_cursor__expected_only_later_entries_in_minute_order(self, match):
+        # Fixture
+        client = TestClient(app)
+        client.post("/matches/1/events", json={"player_id": 1, "event_type_id": 1, "minute": 10})
+        client.post("/matches/1/substitutions", json={"player_out_id": 3, "player_in_id": 4, "minute": 46})
+        client.post("/matches/1/events", json={"player_id": 2, "event_type_id": 2, "minute": 30})
+        first = client.get("/matches/1/events").json()[0]
+
+        # Exercise
+        response = client.get("/matches/1/events", params={"after": first["id"]})
+
+        # Assert
+        assert response.status_code == 200
+        assert [(entry["type"], entry["data"]["minute"]) for entry in response.json()] == [
+            ("event", 30), ("substitution", 46),
+        ]
+        assert response.json()[-1]["id"] == "2.1"
+
+    def test_get_events__resumed_from_first_replayed_cursor__expected_no_entry_lost(self, match):
+        # Fixture
+        client = TestClient(app)
+        client.post("/matches/1/events", json={"player_id": 1, "event_type_id": 1, "minute": 30})
+        client.post("/matches/1/events", json={"player_id": 2, "event_type_id": 2, "minute": 10})
+        client.post("/matches/1/substitutions", json={"player_out_id": 3, "player_in_id": 4, "minute": 20})
+        replay = client.get("/matches/1/events").json()
+
+        # Exercise
+        resumed = client.get("/matches/1/events", params={"after": replay[0]["id"]}).json()
+
+        # Assert
+        assert [(entry["type"], entry["data"]["minute"]) for entry in replay] == [
+            ("substitution", 20), ("event", 30), ("event", 10),
+        ]
+        assert resumed == replay[1:]
+
+    def test_add_substitution__same_player__expected_400(self, match):
+        # Fixture
+        client = TestClient(app)
+
+        # Exercise
+        response = client.post("/matches/1/substitutions", json={"player_out_id": 3, "player_in_id": 3, "minute": 60})
+
+        # Assert
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("url, expected", [("/matches/99/events", 404), ("/matches/1/events?after=x", 400)])
+    def test_get_events__unknown_match_or_bad_cursor__expected_error(self, match, url, expected):
+        # Exercise / Assert
+        assert TestClient(app).get(url).status_code == expected
+
+    def test_websocket__event_posted_while_connected__expected_replay_then_live_message(self, match):
+        # Fixture
+        with TestClient(app) as client:
+            client.post("/matches/1/events", json={"player_id": 1, "event_type_id": 1, "minute": 10})
+            with client.websocket_connect("/matches/1/events/ws") as websocket:
+                replayed = websocket.receive_json()
+
+                # Exercise
+                client.post("/matches/1/events", json={"player_id": 3, "event_type_id": 1, "minute": 12})
+                live = websocket.receive_json()
+
+        # Assert
+        assert (replayed["id"], replayed["data"]["player_id"]) == ("1.0", 1)
+        assert (live["id"], live["type"], live["data"]["player_id"]) == ("2.0", "event", 3)
+        assert get_hub().stats()["subscribers"] == 0
+
+    def test_add_event__concurrent_writes__expected_published_in_id_order_and_resumable(self, match, monkeypatch):
+        # Fixture
+        repository = routes_live.service.repository
+        add = repository.add
+
+        def slow_add(row):
+            # The minute 10 write gets the lower ID but takes longer to return:
+            # without ordering, the minute 11 one would be published first.
+            if row.minute == 11:
+                time.sleep(0.1)
+            row = add(row)
+            if row.minute == 10:
+                time.sleep(0.3)
+            return row
+
+        monkeypatch.setattr(repository, "add", slow_add)
+
+        async def write_both():
+            subscription = get_hub().subscribe(1)
+            await asyncio.gather(
+                add_event(1, MatchEventCreate(player_id=1, event_type_id=1, minute=10)),
+                add_event(1, MatchEventCreate(player_id=3, event_type_id=1, minute=11)),
+            )
+            return [message.item for message in subscription.messages]
+
+        # Exercise
+        published = asyncio.run(write_both())
+        cursor = format_cursor(advance(START, published[0]))
+        resumed = TestClient(app).get("/matches/1/events", params={"after": cursor}).json()
+
+        # Assert
+        assert [item.id for item in published] == [1, 2]
+        assert [entry["data"]["minute"] for entry in resumed] == [11]
+
+    def test_websocket__unknown_match__expected_connection_refused(self, match):
+        # Exercise / Assert
+        with pytest.raises(WebSocketDisconnect):
+            with TestClient(app).websocket_connect("/matches/99/events/ws") as websocket:
+                websocket.receive_json()
+
+    def test_sse_stream__replay_heartbeat_and_slow_consumer__expected_frames_then_end(self, match):
+        # Fixture
+        client = TestClient(app)
+        client.post("/matches/1/events", json={"player_id": 1, "event_type_id": 1, "minute": 10})
+
+        async def read():
+            frames = []
+            async for frame in sse_stream(1, START):
+                frames.append(frame)
+                if frame.startswith(":"):
+                    # Idle: flood the (8 messages) queue, the stream ends once it is drained.
+                    for minute in range(9):
+                        item = FeedItem("event", 100 + minute, minute, {"id": 100 + minute, "minute": minute})
+                        get_hub().publish(1, _message(item))
+            return frames
+
+        # Exercise
+        frames = asyncio.run(read())
+
+        # Assert
+        assert frames[0] == "retry: 1000\n\n"
+        assert frames[1].startswith("id: 1.0\nevent: event\ndata: ")
+        assert json.loads(frames[1].split("data: ")[1])["player_id"] == 1
+        assert frames[2] == ": keep-alive\n\n"
+        assert len(frames) == 3 + 8
+        assert frames[-1].startswith("id: 107.0\n")
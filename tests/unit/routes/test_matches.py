@@ -0,0 +1,123 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.repositories.championshipRepository import ChampionshipRepository
+from app.repositories.countryRepository import CountryRepository
+from app.repositories.matchRepository import MatchRepository
+from app.repositories.stadiumRepository import StadiumRepository
+from app.repositories.teamRepository import TeamRepository
+
+
+@pytest.fixture
+def season(engine):
+    """Three teams, two championships and matches spread over two days."""
+    country = CountryRepository().create("Brasil")
+    teams = [TeamRepository().create(name=name, country_id=country.id) for name in ["Santos", "Palmeiras", "Grêmio"]]
+    league = ChampionshipRepository().create("Brasileirão", country.id, "league", "2024")
+    cup = ChampionshipRepository().create("Copa do Brasil", country.id, "cup", "2023")
+    stadium = StadiumRepository().create("Vila Belmiro", "Santos", country.id)
+    repository = MatchRepository()
+    matches = [
+        repository.create(teams[0].id, teams[1].id, league.id, datetime(2024, 5, 12, 16), stadium.id, 2, 1),
+        repository.create(teams[1].id, teams[2].id, league.id, datetime(2024, 5, 12, 18), stadium.id),
+        repository.create(teams[2].id, teams[0].id, league.id, datetime(2024, 5, 13, 20), stadium.id),
+        repository.create(teams[0].id, teams[2].id, cup.id, datetime(2023, 8, 1, 21), stadium.id),
+    ]
+    return {"teams": teams, "league": league, "cup": cup, "matches": matches}
+
+
+class TestMatchRoutes:
+
+    def test_get_matches__follow_next_links__expected_date_order(self, season):
+        # Fixture
+        client = TestClient(app)
+
+        # Exercise
+        ids, url = [], "/matches/?limit=1"
+        while url:
+            body = client.get(url).json()
+            ids += [match["id"] for match in body["items"]]
+            url = body["next"]
+
+        # Assert
+        matches = season["matches"]
+        assert ids == [matches[3].id, matches[0].id, matches[1].id, matches[2].id]
+
+    def test_get_matches__team_filter__expected_home_and_away_matches(self, season):
+        # Fixture
+        client = TestClient(app)
+        santos = season["teams"][0]
+
+        # Exercise
+        body = client.get(f"/matches/?team_id={santos.id}").json()
+
+        # Assert
+        matches = season["matches"]
+        assert [match["id"] for match in body["items"]] == [matches[3].id, matches[0].id, matches[2].id]
+
+    def test_get_matches__season_and_date_range__expected_filtered(self, season):
+        # Fixture
+        client = TestClient(app)
+
+        # Exercise
+        body = client.get("/matches/?season=2024&date_from=2024-05-12T00:00:00&date_to=2024-05-13T00:00:00").json()
+
+        # Assert
+        matches = season["matches"]
+        assert [match["id"] for match in body["items"]] == [matches[0].id, matches[1].id]
+
+    def test_get_matches__inverted_date_range__expected_400(self, season):
+        # Fixture
+        client = TestClient(app)
+
+        # Exercise
+        response = client.get("/matches/?date_from=2024-05-13T00:00:00&date_to=2024-05-12T00:00:00")
+
+        # Assert
+        assert response.status_code == 400
+
+    def test_get_fixtures__matchday__expected_names_resolved(self, season):
+        # Fixture
+        client = TestClient(app)
+
+        # Exercise
+        response = client.get(f"/matches/fixtures?date=2024-05-12&championship_id={season['league'].id}")
+
+        # Assert
+        assert response.status_code == 200
+        fixtures = response.json()
+        assert [(f["home_team"], f["away_team"]) for f in fixtures] == [("Santos", "Palmeiras"), ("Palmeiras", "Grêmio")]
+        assert fixtures[0]["stadium"] == "Vila Belmiro"
+        assert fixtures[0]["championship"] == "Brasileirão"
+
+    def test_create_match__same_teams__expected_400(self, season):
+        # Fixture
+        client = TestClient(app)
+        team = season["teams"][0]
+        payload = {
+            "home_team_id": team.id,
+            "away_team_id": team.id,
+            "championship_id": season["league"].id,
+            "date": "2024-06-01T16:00:00",
+            "stadium_id": season["matches"][0].stadium_id,
+        }
+
+        # Exercise
+        response = client.post("/matches/", json=payload)
+
+        # Assert
+        assert response.status_code == 400
+
+    def test_get_head_to_head__two_teams__expected_every_meeting(self, season):
+        # Fixture
+        client = TestClient(app)
+        santos, palmeiras = season["teams"][0], season["teams"][1]
+
+        # Exercise
+        response = client.get(f"/matches/head-to-head?home_team_id={santos.id}&away_team_id={palmeiras.id}")
+
+        # Assert
+        assert [match["id"] for match in response.json()] == [season["matches"][0].id]
@@ -0,0 +1,107 @@
+import logging
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config.metrics import Metrics, get_metrics
+from app.main import app
+from app.repositories.championshipRepository import ChampionshipRepository
+from app.repositories.countryRepository import CountryRepository
+from app.repositories.teamRepository import TeamRepository
+
+
+@pytest.fixture
+def metrics():
+    get_metrics().clear()
+    yield get_metrics()
+    get_metrics().clear()
+
+
+@pytest.fixture
+def teams(engine):
+    country = CountryRepository().create("Brasil")
+    ChampionshipRepository().create("Brasileirão", country.id, "league", "2024")
+    return [TeamRepository().create(name=name, country_id=country.id) for name in ["Santos", "Bahia"]]
+
+
+def _timings(response):
+    """Server-Timing entries as {name: (duration, description)}."""
+    timings = {}
+    for entry in response.headers["server-timing"].split(", "):
+        name, *params = entry.split(";")
+        values = dict(param.split("=", 1) for param in params)
+        timings[name] = (float(values["dur"]), values.get("desc"))
+    return timings
+
+
+class TestMetrics:
+
+    def test_get__list_endpoint__expected_server_timing_header(self, teams, metrics):
+        # Fixture
+        client = TestClient(app)
+
+        # Exercise
+        response = client.get("/teams/")
+
+        # Assert
+        timings = _timings(response)
+        assert set(timings) == {"db", "db-slowest", "serialize", "app"}
+        assert timings["db"][1] == '"1 queries"'
+        assert 0 < timings["db-slowest"][0] <= timings["db"][0] <= timings["app"][0]
+        assert timings["serialize"][0] > 0
+
+    def test_metrics__after_requests__expected_counters_per_route_template(self, teams, metrics):
+        # Fixture
+        client = TestClient(app)
+        client.get(f"/teams/{teams[0].id}")
+        client.get(f"/teams/{teams[1].id}")
+        client.post("/country/", json={"name": "Argentina"})
+
+        # Exercise
+        response = client.get("/metrics")
+
+        # Assert
+        assert response.headers["content-type"].startswith("text/plain")
+        body = response.text
+        assert 'footballhub_http_requests_total{method="GET",route="/teams/{team_id}",status="200"} 2' in body
+        assert 'footballhub_db_queries_total{route="/teams/{team_id}"} 2' in body
+        assert 'footballhub_db_rows_total{route="/country/"} 1' in body
+        assert 'footballhub_db_queries_per_request_bucket{route="/teams/{team_id}",le="1"} 2' in body
+        assert "# TYPE footballhub_http_request_duration_seconds histogram" in body
+
+    def test_get__over_query_threshold__expected_n_plus_one_warning(self, teams, metrics, monkeypatch, caplog):
+        # Fixture
+        monkeypatch.setenv("N_PLUS_ONE_THRESHOLD", "1")
+        client = TestClient(app)
+
+        # Exercise
+        with caplog.at_level(logging.WARNING, logger="app.config.metrics"):
+            client.get("/championship/1/standings")
+            client.get("/teams/")
+
+        # Assert
+        warnings = [record.getMessage() for record in caplog.records]
+        assert len(warnings) == 1
+        assert re.match(r"Possible N\+1 in GET /championship/\{championship_id\}/standings: 2 queries", warnings[0])
+        assert 'footballhub_n_plus_one_total{route="/championship/{championship_id}/standings"} 1' in metrics.render()
+
+    def test_render__histogram__expected_cumulative_buckets(self):
+        # Fixture
+        metrics = Metrics()
+        metrics.describe("latency_seconds", "histogram", "Latency.", (0.1, 1.0))
+
+        # Exercise
+        for value in (0.05, 0.5, 5.0):
+            metrics.observe("latency_seconds", value, route="/x")
+
+        # Assert
+        assert metrics.render().splitlines() == [
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{route="/x",le="0.1"} 1',
+            'latency_seconds_bucket{route="/x",le="1"} 2',
+            'latency_seconds_bucket{route="/x",le="+Inf"} 3',
+            'latency_seconds_sum{route="/x"} 5.55',
+            'latency_seconds_count{route="/x"} 3',
+        ]
@@ -0,0 +1,46 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.repositories.countryRepository import CountryRepository
+from app.routes.pagination import decode_cursor, encode_cursor
+
+
+class TestPagination:
+
+    def test_cursor__round_trip__expected_same_key(self):
+        # Exercise
+        cursor = encode_cursor(1234)
+
+        # Assert
+        assert decode_cursor(cursor) == 1234
+
+    def test_get_all_countries__follow_next_links__expected_every_country_once(self, engine):
+        # Fixture
+        repository = CountryRepository()
+        for name in ["Brasil", "Argentina", "Uruguai", "Chile", "Peru"]:
+            repository.create(name)
+        client = TestClient(app)
+
+        # Exercise
+        names = []
+        url = "/country/?limit=2"
+        pages = 0
+        while url:
+            body = client.get(url).json()
+            names += [country["name"] for country in body["items"]]
+            url = body["next"]
+            pages += 1
+
+        # Assert
+        assert names == ["Brasil", "Argentina", "Uruguai", "Chile", "Peru"]
+        assert pages == 3
+
+    def test_get_all_countries__invalid_cursor__expected_400(self, engine):
+        # Fixture
+        client = TestClient(app)
+
+        # Exercise
+        response = client.get("/country/?after=not-a-cursor")
+
+        # Assert
+        assert response.status_code == 400
@@ -0,0 +1,231 @@
+from datetime import datetime
+
+import msgpack
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+from sqlalchemy import event, insert, select
+
+from app.main import app
+from app.routes.responses import COLUMNAR_JSON, MSGPACK, as_columns, checked, dumps, projection
+from app.schemas.championship import Championship
+from app.schemas.country import Country
+from app.schemas.match import Match
+from app.schemas.player import Player, Position
+from app.schemas.stadium import Stadium
+from app.schemas.team import Team
+
+
+def _seed(engine):
+    with engine.begin() as connection:
+        def load(model, rows):
+            connection.execute(insert(model.__table__), rows)
+
+        load(Country, [{"name": "Brasil"}])
+        load(Position, [{"name": "Atacante"}])
+        load(Team, [{"name": "Santos", "country_id": 1, "founding_date": datetime(1912, 4, 14)},
+                    {"name": "Bahia", "country_id": 1, "founding_date": None}])
+        load(Player, [{"name": "Pelé", "country_id": 1, "position_id": 1, "team_id": 1,
+                       "birth_date": datetime(1940, 10, 23)}])
+        load(Stadium, [{"name": "Vila Belmiro", "city": "Santos", "country_id": 1}])
+        load(Championship, [{"name": "Paulista", "season": "1962"}])
+        load(Match, [{"home_team_id": 1, "away_team_id": 2, "championship_id": 1, "stadium_id": 1,
+                      "date": datetime(1962, 5, 1, 16, 30), "home_score": 2, "away_score": 0}])
+
+
+class TestTrustedResponses:
+
+    @pytest.mark.parametrize("url", ["/teams/", "/players/", "/matches/?championship_id=1", "/country/1/teams"])
+    def test_list_endpoint__trusted_rows__expected_same_body_as_validated(self, engine, monkeypatch, url):
+        # Fixture
+        _seed(engine)
+        client = TestClient(app)
+        monkeypatch.setenv("VALIDATE_RESPONSES", "1")
+        validated = client.get(url)
+        monkeypatch.setenv("VALIDATE_RESPONSES", "0")
+
+        # Exercise
+        response = client.get(url)
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == validated.json()
+        assert response.json()["items"]
+
+    def test_list_endpoint__conditional_dependency__expected_etag_kept_and_304(self, engine):
+        # Fixture
+        _seed(engine)
+        client = TestClient(app)
+
+        # Exercise
+        first = client.get("/teams/")
+        second = client.get("/teams/", headers={"If-None-Match": first.headers["etag"]})
+
+        # Assert
+        assert first.headers["content-type"] == "application/json"
+        assert first.headers["cache-control"] == "no-cache"
+        assert second.status_code == 304
+
+    def test_dumps__rows_and_datetimes__expected_objects_with_iso_dates(self, engine):
+        # Fixture
+        _seed(engine)
+        with engine.connect() as connection:
+            rows = connection.execute(select(Team.id, Team.name, Team.founding_date).order_by(Team.id)).all()
+
+        # Exercise
+        body = dumps({"items": rows})
+
+        # Assert
+        assert body == (
+            b'{"items":[{"id":1,"name":"Santos","founding_date":"1912-04-14T00:00:00"},'
+            b'{"id":2,"name":"Bahia","founding_date":null}]}'
+        )
+
+    def test_checked__validation_enabled_and_invalid_row__expected_validation_error(self, monkeypatch):
+        # Fixture
+        monkeypatch.setenv("VALIDATE_RESPONSES", "1")
+
+        # Exercise / Assert
+        with pytest.raises(ValidationError):
+            checked([{"id": 1, "country_id": 1}], Team)
+
+    def test_checked__validation_disabled__expected_same_rows(self, monkeypatch):
+        # Fixture
+        monkeypatch.delenv("VALIDATE_RESPONSES", raising=False)
+        rows = [{"id": 1}]
+
+        # Exercise
+        result = checked(rows, Team)
+
+        # Assert
+        assert result is rows
+
+
+class TestNegotiatedResponses:
+
+    def test_list_endpoint__columnar_accept__expected_field_names_once(self, engine):
+        # Fixture
+        _seed(engine)
+        client = TestClient(app)
+        items = client.get("/teams/").json()["items"]
+
+        # Exercise
+        response = client.get("/teams/", headers={"Accept": COLUMNAR_JSON})
+
+        # Assert
+        body = response.json()
+        assert response.headers["content-type"] == COLUMNAR_JSON
+        assert [dict(zip(body["columns"], row)) for row in body["rows"]] == items
+        assert body["next"] is None
+
+    def test_list_endpoint__columnar_and_json__expected_distinct_etags_varying_on_accept(self, engine):
+        # Fixture
+        _seed(engine)
+        client = TestClient(app)
+
+        # Exercise
+        json_response = client.get("/players/")
+        columnar = client.get("/players/", headers={"Accept": f"application/json;q=0.5, {COLUMNAR_JSON}"})
+
+        # Assert
+        assert columnar.headers["content-type"] == COLUMNAR_JSON
+        assert columnar.headers["etag"] != json_response.headers["etag"]
+        assert "Accept" in columnar.headers["vary"]
+
+    def test_list_endpoint__wildcard_accept__expected_json(self, engine):
+        # Fixture
+        _seed(engine)
+        client = TestClient(app)
+
+        # Exercise
+        response = client.get("/teams/", headers={"Accept": "*/*"})
+
+        # Assert
+        assert response.headers["content-type"] == "application/json"
+
+    def test_list_endpoint__msgpack_accept__expected_msgpack_body(self, engine):
+        # Fixture
+        _seed(engine)
+        client = TestClient(app)
+        page = client.get("/players/").json()
+
+        # Exercise
+        response = client.get("/players/", headers={"Accept": MSGPACK})
+
+        # Assert
+        assert response.headers["content-type"] == MSGPACK
+        assert msgpack.unpackb(response.content) == page
+
+    def test_as_columns__validated_models__expected_same_columns_as_rows(self, engine):
+        # Fixture
+        _seed(engine)
+        with engine.connect() as connection:
+            rows = connection.execute(select(Team.id, Team.name, Team.country_id).order_by(Team.id)).all()
+
+        # Exercise
+        columns = as_columns([Team.model_validate(row, from_attributes=True) for row in rows])
+
+        # Assert
+        assert as_columns(rows)["rows"] == [(1, "Santos", 1), (2, "Bahia", 1)]
+        assert [row[columns["columns"].index("name")] for row in columns["rows"]] == ["Santos", "Bahia"]
+
+
+class TestSparseFieldsets:
+
+    @pytest.mark.parametrize("url", ["/players/?fields=name", "/teams/?fields=name,id", "/country/1/stadiums?fields=city"])
+    def test_list_endpoint__fields__expected_only_those_columns_plus_id(self, engine, monkeypatch, url):
+        # Fixture
+        _seed(engine)
+        client = TestClient(app)
+        monkeypatch.setenv("VALIDATE_RESPONSES", "1")
+        validated = client.get(url)
+        monkeypatch.setenv("VALIDATE_RESPONSES", "0")
+
+        # Exercise
+        response = client.get(url)
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == validated.json()
+        assert set(response.json()["items"][0]) == {"id", url.split("fields=")[1].split(",")[0]}
+
+    def test_list_endpoint__fields__expected_only_those_columns_selected(self, engine):
+        # Fixture
+        _seed(engine)
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        # Exercise
+        TestClient(app).get("/players/", params={"fields": "name"})
+
+        # Assert
+        select_list = statements[-1].split(" FROM ")[0]
+        assert "players.name" in select_list and "players.id" in select_list
+        assert "birth_date" not in select_list
+
+    def test_list_endpoint__fields_and_limit__expected_next_page_with_same_fields(self, engine):
+        # Fixture
+        _seed(engine)
+        client = TestClient(app)
+        first = client.get("/teams/", params={"fields": "name", "limit": 1}).json()
+
+        # Exercise
+        second = client.get(first["next"]).json()
+
+        # Assert
+        assert first["items"] == [{"id": 1, "name": "Santos"}]
+        assert second["items"] == [{"id": 2, "name": "Bahia"}]
+
+    def test_list_endpoint__unknown_field__expected_400(self, engine):
+        # Exercise
+        response = TestClient(app).get("/players/", params={"fields": "name,salary"})
+
+        # Assert
+        assert response.status_code == 400
+        assert "salary" in response.json()["detail"]
+
+    def test_projection__no_fields__expected_full_model(self):
+        # Exercise / Assert
+        assert projection(Team, None) is Team
+        assert projection(Team, ("id", "name")) is projection(Team, ("id", "name"))
+        assert set(projection(Team, ("id", "name")).model_fields) == {"id", "name"}
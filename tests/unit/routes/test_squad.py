@@ -0,0 +1,87 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert
+
+from app.main import app
+from app.schemas.championship import Championship
+from app.schemas.country import Country
+from app.schemas.player import Player, Position
+from app.schemas.team import ChampionshipParticipation, Team
+
+
+@pytest.fixture
+def squad(engine):
+    """Santos with two players of different nationalities and two participations; Bahia with nothing."""
+    with engine.begin() as connection:
+        def load(model, rows):
+            connection.execute(insert(model.__table__), rows)
+
+        load(Country, [{"name": "Brasil"}, {"name": "Argentina"}])
+        load(Position, [{"name": "Atacante"}, {"name": "Goleiro"}])
+        load(Team, [{"name": "Santos", "country_id": 1, "founding_date": datetime(1912, 4, 14)},
+                    {"name": "Bahia", "country_id": 1, "founding_date": None}])
+        load(Player, [{"name": "Pelé", "country_id": 1, "position_id": 1, "team_id": 1},
+                      {"name": "Tevez", "country_id": 2, "position_id": 1, "team_id": 1},
+                      {"name": "Gylmar", "country_id": 1, "position_id": 2, "team_id": 1}])
+        load(Championship, [{"name": "Paulista", "season": "1962"}, {"name": "Libertadores", "season": "1962"}])
+        load(ChampionshipParticipation, [{"championship_id": 1, "team_id": 1, "season": "1962"},
+                                         {"championship_id": 2, "team_id": 1, "season": "1962"}])
+    return 1
+
+
+class TestSquad:
+
+    def test_get_squad__default_include__expected_every_relation_with_names(self, squad):
+        # Exercise
+        response = TestClient(app).get(f"/teams/{squad}/squad")
+
+        # Assert
+        assert response.status_code == 200
+        body = response.json()
+        assert (body["team"]["name"], body["team"]["founding_date"]) == ("Santos", "1912-04-14T00:00:00")
+        assert body["country"] == {"id": 1, "name": "Brasil"}
+        assert [entry["championship_name"] for entry in body["participations"]] == ["Paulista", "Libertadores"]
+        assert [(player["name"], player["position"], player["country"]) for player in body["players"]] == [
+            ("Pelé", "Atacante", "Brasil"), ("Tevez", "Atacante", "Argentina"), ("Gylmar", "Goleiro", "Brasil"),
+        ]
+
+    def test_get_squad__include_players__expected_other_relations_omitted(self, squad):
+        # Exercise
+        body = TestClient(app).get(f"/teams/{squad}/squad", params={"include": "players"}).json()
+
+        # Assert
+        assert set(body) == {"team", "players"}
+        assert len(body["players"]) == 3
+
+    def test_get_squad__team_without_players_or_participations__expected_empty_lists(self, squad):
+        # Exercise
+        body = TestClient(app).get("/teams/2/squad").json()
+
+        # Assert
+        assert (body["participations"], body["players"]) == ([], [])
+
+    @pytest.mark.parametrize("url, expected", [("/teams/99/squad", 404), ("/teams/1/squad?include=players,coach", 400)])
+    def test_get_squad__unknown_team_or_relation__expected_error(self, squad, url, expected):
+        # Exercise / Assert
+        assert TestClient(app).get(url).status_code == expected
+
+    def test_get_squad__repeated_then_player_added__expected_cached_until_the_write(self, engine, squad):
+        # Fixture
+        client = TestClient(app)
+        client.get(f"/teams/{squad}/squad")
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        # Exercise
+        cached = client.get(f"/teams/{squad}/squad")
+        cached_statements = len(statements)
+        client.post("/players/", json={"name": "Coutinho", "country_id": 1, "position_id": 1, "team_id": squad})
+        statements.clear()
+        fresh = client.get(f"/teams/{squad}/squad")
+
+        # Assert
+        assert cached.status_code == 200 and cached_statements == 0
+        assert len(fresh.json()["players"]) == 4
+        assert len(statements) == 2
@@ -0,0 +1,123 @@
+"""SQL statements issued per read endpoint.
+
+Relationships are never loaded implicitly, so an endpoint runs the queries of
+its repository method and nothing else, however many matches, lineups and
+events hang off the rows it returns.
+"""
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import Session
+
+from app.main import app
+from app.schemas.championship import Championship
+from app.schemas.country import Country
+from app.schemas.match import EventType, Lineup, Match, MatchEvent, Substitution
+from app.schemas.player import Player, Position
+from app.schemas.stadium import Stadium
+from app.schemas.team import ChampionshipParticipation, Team
+
+TEAMS, PLAYERS, MATCHES = 4, 40, 20
+
+STATEMENTS = {
+    "/country/": 1,
+    "/country/1": 1,
+    "/country/1/teams": 1,
+    "/country/1/players": 1,
+    "/country/1/stadiums": 1,
+    "/country/1/summary": 1,
+    "/country/summary": 1,
+    "/teams/": 1,
+    "/teams/1": 1,
+    "/teams?ids=3,1,99": 1,
+    "/teams/1/players": 1,
+    "/teams/1/participations": 1,
+    "/teams/1/squad": 2,
+    "/teams/1/squad?include=country,participations": 1,
+    "/stadiums/": 1,
+    "/stadiums/1": 1,
+    "/stadiums?ids=1,2": 1,
+    "/championship/": 1,
+    "/championship/id/1": 1,
+    "/championship/name/Liga": 1,
+    "/players/": 1,
+    "/players/1": 1,
+    "/players/details?ids=1,2": 1,
+    "/players?ids=2,1": 1,
+    "/matches/": 1,
+    "/matches/1": 1,
+    "/matches/head-to-head?home_team_id=1&away_team_id=2": 1,
+    "/matches/fixtures?date=2024-01-01&days=7": 1,
+    "/championship/1/standings": 2,
+}
+
+
+@pytest.fixture
+def seeded(engine):
+    with engine.begin() as connection:
+        def load(model, rows):
+            connection.execute(insert(model.__table__), rows)
+
+        load(Country, [{"name": "Brasil"}])
+        load(Position, [{"name": "Atacante"}])
+        load(EventType, [{"name": "Gol"}])
+        load(Team, [{"name": f"Team {i}", "country_id": 1} for i in range(TEAMS)])
+        load(Stadium, [{"name": "Maracanã", "city": "Rio de Janeiro", "country_id": 1}])
+        load(Championship, [{"name": "Liga", "country_id": 1, "season": "2024"}])
+        load(ChampionshipParticipation, [
+            {"championship_id": 1, "team_id": i + 1, "season": "2024"} for i in range(TEAMS)
+        ])
+        load(Player, [
+            {"name": f"Player {i}", "country_id": 1, "position_id": 1, "team_id": i % TEAMS + 1} for i in range(PLAYERS)
+        ])
+        load(Match, [
+            {"home_team_id": i % TEAMS + 1, "away_team_id": (i + 1) % TEAMS + 1, "championship_id": 1,
+             "stadium_id": 1, "date": datetime(2024, 1, i + 1), "home_score": 1, "away_score": 0}
+            for i in range(MATCHES)
+        ])
+        load(Lineup, [
+            {"match_id": i % MATCHES + 1, "team_id": i % TEAMS + 1, "player_id": i + 1} for i in range(PLAYERS)
+        ])
+        load(MatchEvent, [
+            {"match_id": i % MATCHES + 1, "player_id": i + 1, "event_type_id": 1, "minute": 10} for i in range(PLAYERS)
+        ])
+        load(Substitution, [
+            {"match_id": i + 1, "player_out_id": i + 1, "player_in_id": i + 2, "minute": 60} for i in range(MATCHES)
+        ])
+    return engine
+
+
+class TestStatementCounts:
+
+    @pytest.mark.parametrize("path", sorted(STATEMENTS))
+    def test_get__seeded_database__expected_statement_count(self, seeded, path):
+        # Fixture
+        client = TestClient(app)
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(seeded, "before_cursor_execute", record)
+
+        # Exercise
+        try:
+            response = client.get(path)
+        finally:
+            event.remove(seeded, "before_cursor_execute", record)
+
+        # Assert
+        assert response.status_code == 200
+        assert len(statements) == STATEMENTS[path], "\n\n".join(statements)
+
+    def test_relationship__not_loaded_by_query__expected_error_instead_of_lazy_load(self, seeded):
+        # Fixture
+        with Session(seeded) as session:
+            championship = session.get(Championship, 1)
+
+            # Exercise / Assert
+            with pytest.raises(InvalidRequestError):
+                championship.matches
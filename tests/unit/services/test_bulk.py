@@ -0,0 +1,55 @@
+import pytest
+
+from app.repositories.countryRepository import CountryRepository
+from app.services.CountryService import CountryService
+from app.services.bulk import BulkMode, BulkValidationError
+
+
+class TestBulkCreate:
+
+    def test_create_countries__atomic_with_invalid_item__expected_nothing_inserted(self, engine):
+        # Fixture
+        service = CountryService()
+
+        # Exercise & Assert
+        with pytest.raises(BulkValidationError) as exc_info:
+            service.create_countries(["Brasil", "", "Chile", "Brasil"])
+        assert [error.index for error in exc_info.value.errors] == [1, 3]
+        assert service.get_all_countries() == []
+
+    def test_create_countries__atomic__expected_all_created_in_order(self, engine):
+        # Fixture
+        service = CountryService()
+
+        # Exercise
+        result = service.create_countries(["Brasil", "Argentina", "Chile"])
+
+        # Assert
+        assert [country.name for country in result.created] == ["Brasil", "Argentina", "Chile"]
+        assert all(country.id is not None for country in result.created)
+        assert result.errors == []
+
+    def test_create_countries__best_effort__expected_invalid_items_reported(self, engine):
+        # Fixture
+        service = CountryService()
+        service.create_country("Brasil")
+
+        # Exercise
+        result = service.create_countries(["Argentina", "", "Brasil", "Chile"], BulkMode.best_effort)
+
+        # Assert
+        assert [country.name for country in result.created] == ["Argentina", "Chile"]
+        assert [error.index for error in result.errors] == [1, 2]
+
+    def test_bulk_create__failing_chunk__expected_only_bad_row_skipped(self, engine):
+        # Fixture
+        repository = CountryRepository()
+        repository.create("Peru")
+        rows = [{"name": name} for name in ["Brasil", "Peru", "Chile", "Uruguai", "Paraguai"]]
+
+        # Exercise
+        created, failures = repository.bulk_create(rows, best_effort=True, chunk_size=2)
+
+        # Assert
+        assert [country.name for country in created] == ["Brasil", "Chile", "Uruguai", "Paraguai"]
+        assert [index for index, _ in failures] == [1]
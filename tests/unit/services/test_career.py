@@ -0,0 +1,139 @@
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert, update
+
+from app.main import app
+from app.schemas.championship import Championship
+from app.schemas.country import Country
+from app.schemas.match import EventType, Lineup, Match, MatchEvent, Substitution
+from app.schemas.player import Player, Position
+from app.schemas.stadium import Stadium
+from app.schemas.team import Team
+
+
+def _seed(engine):
+    with engine.begin() as connection:
+        def load(model, rows):
+            connection.execute(insert(model.__table__), rows)
+
+        load(Country, [{"name": "Brasil"}])
+        load(Position, [{"name": "Atacante"}])
+        load(Team, [{"name": "Santos", "country_id": 1}, {"name": "Bahia", "country_id": 1}, {"name": "Vasco", "country_id": 1}])
+        # Pelé played for Santos in 1962 and moved to Vasco; Coutinho only came off the bench.
+        load(Player, [
+            {"name": "Pelé", "country_id": 1, "position_id": 1, "team_id": 3},
+            {"name": "Coutinho", "country_id": 1, "position_id": 1, "team_id": 1},
+            {"name": "Zito", "country_id": 1, "position_id": 1, "team_id": 1},
+        ])
+        load(Stadium, [{"name": "Vila", "city": "Santos", "country_id": 1}])
+        load(Championship, [{"name": "Paulista", "season": "1962"}, {"name": "Carioca", "season": "1963"}])
+        load(Match, [
+            {"home_team_id": 1, "away_team_id": 2, "championship_id": 1, "stadium_id": 1,
+             "date": datetime(1962, 5, day), "home_score": 2, "away_score": 0}
+            for day in (1, 8)
+        ] + [{"home_team_id": 3, "away_team_id": 2, "championship_id": 2, "stadium_id": 1,
+              "date": datetime(1963, 5, 1), "home_score": 1, "away_score": 1}])
+        load(EventType, [{"name": "Gol"}, {"name": "Assistência"}, {"name": "Cartão amarelo"}])
+        load(Lineup, [
+            {"match_id": 1, "team_id": 1, "player_id": 1},
+            {"match_id": 2, "team_id": 1, "player_id": 1},
+            {"match_id": 3, "team_id": 3, "player_id": 1},
+        ])
+        load(Substitution, [{"match_id": 1, "player_out_id": 1, "player_in_id": 2, "minute": 70}])
+        load(MatchEvent, [
+            {"match_id": 1, "player_id": 1, "event_type_id": 1, "minute": 10},
+            {"match_id": 1, "player_id": 2, "event_type_id": 1, "minute": 80},
+            {"match_id": 1, "player_id": 1, "event_type_id": 2, "minute": 80},
+            {"match_id": 2, "player_id": 1, "event_type_id": 1, "minute": 30},
+            {"match_id": 3, "player_id": 1, "event_type_id": 3, "minute": 30},
+        ])
+
+
+def _counters(row, *names):
+    return tuple(row[name] for name in names)
+
+
+class TestCareer:
+
+    def test_player_career__two_seasons__expected_rows_per_season_and_team(self, engine):
+        # Fixture
+        _seed(engine)
+        client = TestClient(app)
+
+        # Exercise
+        response = client.get("/players/1/career")
+
+        # Assert
+        assert response.status_code == 200
+        career = response.json()
+        assert career["player"] == "Pelé"
+        assert [(row["season"], row["team"]) for row in career["seasons"]] == [("1962", "Santos"), ("1963", "Vasco")]
+        santos, vasco = career["seasons"]
+        assert _counters(santos, "appearances", "starts", "subbed_off", "goals", "assists") == (2, 2, 1, 2, 1)
+        assert _counters(vasco, "appearances", "goals", "yellow_cards") == (1, 0, 1)
+        assert _counters(career["totals"], "appearances", "goals", "assists", "yellow_cards") == (3, 2, 1, 1)
+
+    def test_player_career__substitute_later_transferred__expected_team_of_replaced_player(self, engine):
+        # Fixture
+        _seed(engine)
+        with engine.begin() as connection:
+            connection.execute(update(Player.__table__).where(Player.__table__.c.id == 2).values(team_id=3))
+        client = TestClient(app)
+
+        # Exercise
+        response = client.get("/players/2/career")
+
+        # Assert
+        seasons = response.json()["seasons"]
+        assert [(row["season"], row["team"]) for row in seasons] == [("1962", "Santos")]
+        assert _counters(seasons[0], "appearances", "subbed_on", "goals") == (1, 1, 1)
+
+    def test_player_career__unknown_player__expected_404(self, engine):
+        # Fixture
+        client = TestClient(app)
+
+        # Exercise
+        response = client.get("/players/99/career")
+
+        # Assert
+        assert response.status_code == 404
+
+    def test_team_players_career__squad__expected_one_aggregated_query(self, engine):
+        # Fixture
+        _seed(engine)
+        client = TestClient(app)
+        aggregates = []
+
+        def listener(conn, cursor, statement, *args):
+            if "GROUP BY" in statement:
+                aggregates.append(statement)
+
+        event.listen(engine, "before_cursor_execute", listener)
+
+        # Exercise
+        try:
+            response = client.get("/teams/1/players/career")
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        # Assert
+        assert response.status_code == 200
+        careers = {career["player"]: career for career in response.json()}
+        assert list(careers) == ["Coutinho", "Zito"]
+        coutinho = careers["Coutinho"]["seasons"]
+        assert [(row["season"], row["team"]) for row in coutinho] == [("1962", "Santos")]
+        assert _counters(coutinho[0], "appearances", "starts", "subbed_on", "goals") == (1, 0, 1, 1)
+        assert careers["Zito"]["seasons"] == []
+        assert careers["Zito"]["totals"]["appearances"] == 0
+        assert len(aggregates) == 1
+
+    def test_team_players_career__unknown_team__expected_404(self, engine):
+        # Fixture
+        client = TestClient(app)
+
+        # Exercise
+        response = client.get("/teams/99/players/career")
+
+        # Assert
+        assert response.status_code == 404
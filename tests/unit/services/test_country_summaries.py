@@ -0,0 +1,113 @@
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.main import app
+from app.repositories.championshipRepository import ChampionshipRepository
+from app.repositories.countryRepository import CountryRepository
+from app.repositories.playerRepository import PlayerRepository
+from app.repositories.stadiumRepository import StadiumRepository
+from app.repositories.teamRepository import TeamRepository
+from app.schemas.country import CountrySummary
+from app.services.CountryService import CountryService
+from app.services.ImportService import ImportService
+
+
+@pytest.fixture
+def countries(engine):
+    repository = CountryRepository()
+    ids = [repository.create(name).id for name in ["Brasil", "Argentina", "Uruguai"]]
+    position = PlayerRepository().create_positions(["Atacante"])[0]
+    return {"countries": ids, "position": position.id}
+
+
+def _summaries():
+    return [row.model_dump() for row in CountryService().get_summaries()]
+
+
+class TestCountrySummaries:
+
+    def test_writes__random_sequence__expected_incremental_equals_rebuild(self, countries):
+        # Fixture
+        rng = random.Random(11)
+        country_ids = countries["countries"]
+        repositories = {
+            "team": (TeamRepository(), lambda country: TeamRepository().create("Time", country)),
+            "player": (PlayerRepository(),
+                       lambda country: PlayerRepository().create("Jogador", None, country, countries["position"])),
+            "stadium": (StadiumRepository(), lambda country: StadiumRepository().create("Estádio", "Cidade", country)),
+            "championship": (ChampionshipRepository(),
+                             lambda country: ChampionshipRepository().create("Liga", rng.choice([country, None]))),
+        }
+        created = {entity: [] for entity in repositories}
+
+        # Exercise
+        for _ in range(80):
+            entity = rng.choice(list(repositories))
+            repository, create = repositories[entity]
+            action = rng.random()
+            if action < 0.6 or not created[entity]:
+                created[entity].append(create(rng.choice(country_ids)).id)
+            elif action < 0.85:
+                repository.update(rng.choice(created[entity]), country_id=rng.choice(country_ids))
+            else:
+                repository.delete(created[entity].pop(rng.randrange(len(created[entity]))))
+        incremental = _summaries()
+        CountryService().rebuild_summaries()
+        rebuilt = _summaries()
+
+        # Assert
+        assert any(row["players"] for row in incremental)
+        assert incremental == rebuilt
+
+    def test_bulk_create_and_import__expected_counts_updated(self, countries):
+        # Fixture
+        brasil, argentina, _ = countries["countries"]
+        rows = [{"name": f"Jogador {i}", "country_id": brasil if i % 3 else argentina,
+                 "position_id": countries["position"]} for i in range(9)]
+        lines = ["name,country_id\n", f"Santos,{brasil}\n", f"Boca Juniors,{argentina}\n", f"River Plate,{argentina}\n"]
+
+        # Exercise
+        PlayerRepository().bulk_create(rows)
+        ImportService().import_lines("team", lines, "csv")
+
+        # Assert
+        summaries = {row.country: (row.teams, row.players) for row in CountryService().get_summaries()}
+        assert summaries == {"Brasil": (1, 6), "Argentina": (2, 3), "Uruguai": (0, 0)}
+
+    def test_delete_country__after_its_rows_moved_away__expected_summary_removed(self, engine, countries):
+        # Fixture
+        brasil, argentina, _ = countries["countries"]
+        team = TeamRepository().create("Santos", argentina)
+        TeamRepository().update(team.id, country_id=brasil)
+
+        # Exercise
+        deleted = CountryRepository().delete(argentina)
+
+        # Assert
+        with Session(engine) as session:
+            remaining = session.exec(select(CountrySummary.country_id)).all()
+        assert deleted
+        assert remaining == [brasil]
+
+    def test_get_summary__routes__expected_counts_and_404(self, countries):
+        # Fixture
+        brasil = countries["countries"][0]
+        TeamRepository().create("Santos", brasil)
+        StadiumRepository().create("Vila Belmiro", "Santos", brasil)
+        ChampionshipRepository().create("Paulista", brasil)
+        client = TestClient(app)
+
+        # Exercise
+        one = client.get(f"/country/{brasil}/summary")
+        every = client.get("/country/summary")
+        missing = client.get("/country/99/summary")
+
+        # Assert
+        assert one.json() == {"country_id": brasil, "country": "Brasil", "teams": 1, "players": 0,
+                              "stadiums": 1, "championships": 1}
+        assert [row["country"] for row in every.json()] == ["Brasil", "Argentina", "Uruguai"]
+        assert every.json()[1]["teams"] == 0
+        assert missing.status_code == 404
@@ -0,0 +1,124 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.repositories.playerRepository import PlayerRepository
+from app.services.ImportService import ImportService, decode_lines
+
+
+def _ndjson(*records):
+    return [json.dumps(record) + "\n" for record in records]
+
+
+class TestImport:
+
+    def test_decode_lines__lines_split_across_chunks__expected_whole_lines(self):
+        # Fixture
+        chunks = [b'{"name": "Bra', b'sil"}\n{"name": "Chi', "leé".encode()[:-1], "leé".encode()[-1:], b"\n"]
+
+        # Exercise
+        lines = list(decode_lines(chunks))
+
+        # Assert
+        assert lines == ['{"name": "Brasil"}\n', '{"name": "Chileé\n']
+
+    def test_import_lines__natural_keys__expected_foreign_keys_resolved(self, engine):
+        # Fixture
+        service = ImportService()
+        service.import_lines("country", _ndjson({"name": "Brasil"}, {"name": "Argentina"}))
+        service.import_lines("position", _ndjson({"name": "Atacante"}))
+        service.import_lines("team", ["name,country,city\n", "Flamengo,Brasil,Rio de Janeiro\n"], "csv")
+
+        # Exercise
+        report = service.import_lines(
+            "player",
+            _ndjson(
+                {"name": "Gabriel Barbosa", "country": "Brasil", "position": "Atacante", "team": "Flamengo"},
+                {"name": "Lionel Messi", "country": "Argentina", "position": "Atacante", "birth_date": "1987-06-24"},
+                {"name": "Ninguém", "country": "Atlântida", "position": "Atacante"},
+            ),
+            chunk_size=2,
+        )
+
+        # Assert
+        assert report.processed == 3
+        assert report.inserted == 2
+        assert [error.index for error in report.errors] == [2]
+        player = PlayerRepository().get_output_by_id(1)
+        assert (player.country, player.team) == ("Brasil", "Flamengo")
+
+    def test_import_lines__duplicate_unique_key__expected_row_reported(self, engine):
+        # Fixture
+        service = ImportService()
+
+        # Exercise
+        report = service.import_lines("country", _ndjson({"name": "Brasil"}, {"name": "Brasil"}, {"name": "Chile"}))
+
+        # Assert
+        assert report.inserted == 2
+        assert [error.index for error in report.errors] == [1]
+
+    def test_import_lines__malformed_ndjson_lines__expected_reported_and_rest_loaded(self, engine):
+        # Fixture
+        lines = _ndjson({"name": "A"}, {"name": "B"}) + ['{"name": "C"\n', '["D"]\n'] + _ndjson({"name": "E"})
+
+        # Exercise
+        report = ImportService().import_lines("country", lines, chunk_size=2)
+
+        # Assert
+        assert (report.processed, report.inserted) == (5, 3)
+        assert [error.index for error in report.errors] == [2, 3]
+        assert report.errors[0].detail.startswith("JSON inválido")
+
+    def test_import_lines__unhashable_natural_key__expected_reported_and_rest_loaded(self, engine):
+        # Fixture
+        service = ImportService()
+        service.import_lines("country", _ndjson({"name": "Brasil"}))
+        lines = _ndjson({"name": "Time A", "country": "Brasil"}, {"name": "Time B", "country": ["Brasil"]},
+                        {"name": "Time C", "country": {"name": "Brasil"}}, {"name": "Time D", "country": "Brasil"})
+
+        # Exercise
+        report = service.import_lines("team", lines, chunk_size=2)
+
+        # Assert
+        assert (report.processed, report.inserted) == (4, 2)
+        assert [error.index for error in report.errors] == [1, 2]
+        assert report.errors[0].detail.startswith("country deve ser")
+
+    def test_import_lines__csv_cell_over_field_limit__expected_reported_and_rest_loaded(self, engine):
+        # Fixture
+        service = ImportService()
+        lines = ["name\n", "Brasil\n", "x" * 200_000 + "\n", "Argentina\n"]
+
+        # Exercise
+        report = service.import_lines("country", lines, "csv")
+
+        # Assert
+        assert (report.processed, report.inserted) == (3, 2)
+        assert [error.index for error in report.errors] == [1]
+        assert report.errors[0].detail.startswith("CSV inválido")
+
+    def test_import_route__ndjson_body__expected_report(self, engine):
+        # Fixture
+        client = TestClient(app)
+        body = "".join(_ndjson({"name": "Brasil"}, {"name": "Chile"}))
+
+        # Exercise
+        response = client.post(
+            "/import/country", content=body, headers={"content-type": "application/x-ndjson"}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["inserted"] == 2
+
+    def test_import_route__unknown_entity__expected_400(self, engine):
+        # Fixture
+        client = TestClient(app)
+
+        # Exercise
+        response = client.post("/import/planet", content="{}\n")
+
+        # Assert
+        assert response.status_code == 400
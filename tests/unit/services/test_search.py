@@ -0,0 +1,195 @@
+import threading
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, update
+from sqlalchemy.dialects import postgresql
+
+from app.main import app
+from app.repositories.searchRepository import SearchRepository
+from app.schemas.championship import Championship
+from app.schemas.country import Country
+from app.schemas.player import Player, Position
+from app.schemas.stadium import Stadium
+from app.schemas.team import Team
+from app.services.SearchService import SearchEntity, SearchService
+from app.services.ngram import NgramIndex
+
+
+def _seed(engine):
+    with engine.begin() as connection:
+        def load(model, rows):
+            connection.execute(insert(model.__table__), rows)
+
+        load(Country, [{"name": "Brasil"}, {"name": "França"}])
+        load(Position, [{"name": "Atacante"}])
+        load(Team, [{"name": "São Paulo", "country_id": 1}, {"name": "Santos", "country_id": 1},
+                    {"name": "Paris Saint-Germain", "country_id": 2}])
+        load(Player, [
+            {"name": "Kylian Mbappé", "country_id": 2, "position_id": 1, "team_id": 3},
+            {"name": "Paulo Henrique Ganso", "country_id": 1, "position_id": 1, "team_id": 1},
+            {"name": "Santos Borré", "country_id": 1, "position_id": 1, "team_id": 2},
+        ])
+        load(Stadium, [{"name": "Estádio do Morumbi", "city": "São Paulo", "country_id": 1}])
+        load(Championship, [{"name": "Campeonato Paulista", "season": "2024"}])
+
+
+def _names(results):
+    return [(result.entity, result.name) for result in results]
+
+
+class TestNgramIndex:
+
+    def test_search__misspelled_query__expected_similar_name(self):
+        # Fixture
+        index = NgramIndex([1, 2], ["Kylian Mbappé", "Lionel Messi"])
+
+        # Exercise
+        results = index.search("mbape")
+
+        # Assert
+        assert [(id, name) for id, name, _ in results] == [(1, "Kylian Mbappé")]
+
+    def test_search__prefixes_of_several_words__expected_word_prefix_match(self):
+        # Fixture
+        index = NgramIndex([1, 2, 3], ["Paulo Henrique Ganso", "Paulinho", "Henrique"])
+
+        # Exercise
+        results = index.search("hen pau")
+
+        # Assert
+        assert [id for id, _, _ in results][0] == 1
+
+    def test_search__exact_prefix_and_fuzzy__expected_ranked_in_that_order(self):
+        # Fixture
+        index = NgramIndex([1, 2, 3], ["Santos Borré", "Santos", "Santo André"])
+
+        # Exercise
+        results = index.search("Santos")
+
+        # Assert
+        assert [id for id, _, _ in results] == [2, 1, 3]
+        assert results[0][2] == 1.0
+
+
+class TestSearchService:
+
+    def test_search__query_without_accents__expected_accented_name(self, engine):
+        # Fixture
+        _seed(engine)
+
+        # Exercise
+        results = SearchService().search("sao paulo")
+
+        # Assert
+        # The stadium is in São Paulo, but only names are searched.
+        assert _names(results) == [("team", "São Paulo")]
+
+    def test_search__type_filter__expected_only_that_entity(self, engine):
+        # Fixture
+        _seed(engine)
+
+        # Exercise
+        results = SearchService().search("santos", [SearchEntity.player])
+
+        # Assert
+        assert _names(results) == [("player", "Santos Borré")]
+
+    def test_search__row_inserted_after_first_search__expected_index_rebuilt(self, engine):
+        # Fixture
+        _seed(engine)
+        service = SearchService()
+        service.search("neymar")
+        with engine.begin() as connection:
+            connection.execute(insert(Player.__table__), [
+                {"name": "Neymar Jr", "country_id": 1, "position_id": 1, "team_id": 2},
+            ])
+
+        # Exercise
+        results = service.search("neymar")
+
+        # Assert
+        assert _names(results) == [("player", "Neymar Jr")]
+
+    def test_search__row_inserted__expected_found_without_full_rebuild_on_request(self, engine):
+        # Fixture
+        _seed(engine)
+        service = SearchService()
+        service.search("neymar", [SearchEntity.player])
+        loads = []
+        load_names = service.repository.load_names
+
+        def recording(entity, after=None):
+            loads.append((threading.current_thread() is threading.main_thread(), after))
+            return load_names(entity, after)
+
+        service.repository.load_names = recording
+        with engine.begin() as connection:
+            connection.execute(insert(Player.__table__), [
+                {"name": "Neymar Jr", "country_id": 1, "position_id": 1, "team_id": 2},
+            ])
+
+        # Exercise
+        results = service.search("neymar", [SearchEntity.player])
+        service.wait_for_rebuilds()
+
+        # Assert
+        assert _names(results) == [("player", "Neymar Jr")]
+        # On the request: only the rows above the indexed IDs; the full load ran in the background.
+        assert loads == [(True, 3), (False, None)]
+
+    def test_search__row_renamed__expected_new_name_after_background_rebuild(self, engine):
+        # Fixture
+        _seed(engine)
+        service = SearchService()
+        service.search("mbappe")
+        with engine.begin() as connection:
+            connection.execute(update(Player.__table__).where(Player.__table__.c.id == 1).values(name="Vinícius Júnior"))
+
+        # Exercise
+        service.search("vinicius")
+        service.wait_for_rebuilds()
+        results = service.search("vinicius")
+
+        # Assert
+        assert _names(results) == [("player", "Vinícius Júnior")]
+        assert service.search("mbappe") == []
+
+    def test_search_route__autocomplete__expected_prefix_matches_first(self, engine):
+        # Fixture
+        _seed(engine)
+        client = TestClient(app)
+
+        # Exercise
+        response = client.get("/search", params={"q": "Pau", "limit": 2})
+
+        # Assert
+        assert response.status_code == 200
+        assert [row["name"] for row in response.json()] == ["Paulo Henrique Ganso", "São Paulo"]
+        assert response.headers["etag"]
+
+    def test_search_repository__postgresql__expected_trigram_operator_and_key_function(self):
+        # Fixture
+        captured = []
+
+        class Session:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                return False
+
+            def execute(self, statement):
+                captured.append(statement)
+                return []
+
+        repository = SearchRepository()
+        repository._get_session = Session
+
+        # Exercise
+        repository.search("mbape", ["player", "team"], 10)
+
+        # Assert
+        sql = str(captured[0].compile(dialect=postgresql.psycopg2.dialect()))
+        assert "footballhub_search_key(players.name) %% " in sql
+        assert "similarity(footballhub_search_key(teams.name)" in sql
+        assert "UNION ALL" in sql
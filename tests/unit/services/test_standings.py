@@ -0,0 +1,145 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.main import app
+from app.repositories.championshipRepository import ChampionshipRepository
+from app.repositories.countryRepository import CountryRepository
+from app.repositories.matchRepository import MatchRepository
+from app.repositories.stadiumRepository import StadiumRepository
+from app.repositories.teamRepository import TeamRepository
+from app.schemas.standing import Standing, StandingRow
+from app.services.ImportService import ImportService
+from app.services.StandingService import StandingService, rank
+
+
+@pytest.fixture
+def league(engine):
+    country = CountryRepository().create("Brasil")
+    teams = [TeamRepository().create(name=name, country_id=country.id)
+             for name in ["Santos", "Palmeiras", "Grêmio", "Bahia"]]
+    championship = ChampionshipRepository().create("Brasileirão", country.id, "league", "2024")
+    stadium = StadiumRepository().create("Vila Belmiro", "Santos", country.id)
+    return {"teams": [team.id for team in teams], "championship": championship.id, "stadium": stadium.id}
+
+
+def _snapshot(engine):
+    with Session(engine) as session:
+        rows = session.exec(select(Standing).order_by(Standing.championship_id, Standing.team_id)).all()
+        return [row.model_dump() for row in rows]
+
+
+def _row(team_id, team, points, wins=0, goal_difference=0, goals_for=0):
+    return StandingRow(team_id=team_id, team=team, played=0, wins=wins, draws=0, losses=0,
+                       goals_for=goals_for, goals_against=goals_for - goal_difference,
+                       goal_difference=goal_difference, points=points)
+
+
+class TestStandings:
+
+    def test_match_changes__random_sequence__expected_incremental_equals_rebuild(self, engine, league):
+        # Fixture
+        rng = random.Random(7)
+        repository = MatchRepository()
+        match_ids = []
+
+        # Exercise
+        for day in range(40):
+            action = rng.random()
+            if action < 0.6 or not match_ids:
+                home, away = rng.sample(league["teams"], 2)
+                score = (rng.randint(0, 4), rng.randint(0, 4)) if rng.random() < 0.8 else (None, None)
+                match = repository.create(home, away, league["championship"], datetime(2024, 1, 1) + timedelta(days=day),
+                                          league["stadium"], *score)
+                match_ids.append(match.id)
+            elif action < 0.9:
+                repository.update(rng.choice(match_ids), home_score=rng.randint(0, 4), away_score=rng.randint(0, 4))
+            else:
+                repository.delete(match_ids.pop(rng.randrange(len(match_ids))))
+        incremental = _snapshot(engine)
+        StandingService().rebuild_standings()
+        rebuilt = _snapshot(engine)
+
+        # Assert
+        assert incremental
+        assert incremental == rebuilt
+
+    def test_import_matches__scored_matches__expected_standings_rebuilt(self, engine, league):
+        # Fixture
+        santos, palmeiras = league["teams"][:2]
+        lines = [
+            "home_team_id,away_team_id,championship_id,stadium_id,date,home_score,away_score\n",
+            f"{santos},{palmeiras},{league['championship']},{league['stadium']},2024-04-01T16:00:00,3,1\n",
+        ]
+
+        # Exercise
+        ImportService().import_lines("match", lines, "csv")
+
+        # Assert
+        table = StandingService().get_standings(league["championship"])
+        assert [(row.team_id, row.points, row.goal_difference) for row in table] == [(santos, 3, 2), (palmeiras, 0, -2)]
+
+    def test_rank__tied_on_points_and_goals__expected_head_to_head_decides(self):
+        # Fixture
+        rows = [_row(1, "Santos", 10, wins=3, goal_difference=2), _row(2, "Palmeiras", 10, wins=3, goal_difference=2),
+                _row(3, "Grêmio", 12)]
+
+        # Exercise
+        ranked = rank(rows, ["wins", "goal_difference", "head_to_head"], lambda team_ids: {2: 3, 1: 0})
+
+        # Assert
+        assert [(row.position, row.team) for row in ranked] == [(1, "Grêmio"), (2, "Palmeiras"), (3, "Santos")]
+
+    def test_rank__custom_tiebreakers__expected_goals_for_before_wins(self):
+        # Fixture
+        rows = [_row(1, "Santos", 10, wins=3, goals_for=5), _row(2, "Palmeiras", 10, wins=2, goals_for=9)]
+
+        # Exercise
+        ranked = rank(rows, ["goals_for", "wins"], lambda team_ids: {})
+
+        # Assert
+        assert [row.team for row in ranked] == ["Palmeiras", "Santos"]
+
+    def test_get_standings__route__expected_points_and_head_to_head(self, league):
+        # Fixture
+        santos, palmeiras, gremio, bahia = league["teams"]
+        repository = MatchRepository()
+        day = datetime(2024, 4, 1)
+        repository.create(santos, palmeiras, league["championship"], day, league["stadium"], 1, 0)
+        repository.create(palmeiras, gremio, league["championship"], day, league["stadium"], 1, 0)
+        repository.create(gremio, bahia, league["championship"], day, league["stadium"], 2, 2)
+        client = TestClient(app)
+
+        # Exercise
+        response = client.get(f"/championship/{league['championship']}/standings")
+
+        # Assert
+        assert response.status_code == 200
+        table = response.json()
+        assert [(row["team"], row["points"]) for row in table] == [
+            ("Santos", 3), ("Palmeiras", 3), ("Bahia", 1), ("Grêmio", 1)
+        ]
+        assert table[0]["goal_difference"] == 1
+
+    def test_get_standings__unknown_tiebreaker__expected_400(self, league):
+        # Fixture
+        client = TestClient(app)
+
+        # Exercise
+        response = client.get(f"/championship/{league['championship']}/standings?tiebreakers=luck")
+
+        # Assert
+        assert response.status_code == 400
+
+    def test_get_standings__missing_championship__expected_404(self, engine):
+        # Fixture
+        client = TestClient(app)
+
+        # Exercise
+        response = client.get("/championship/999/standings")
+
+        # Assert
+        assert response.status_code == 404
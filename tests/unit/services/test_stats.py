@@ -0,0 +1,143 @@
+import random
+from collections import defaultdict
+from datetime import datetime
+
+import numpy as np
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert
+
+from app.main import app
+from app.repositories.statsRepository import EVENT, LINEUP, SUBSTITUTION
+from app.schemas.championship import Championship
+from app.schemas.country import Country
+from app.schemas.match import EventType, Lineup, Match, MatchEvent
+from app.schemas.player import Player, Position
+from app.schemas.stadium import Stadium
+from app.schemas.team import Team
+from app.services.StatsService import StatMetric, categorize, compute_totals, leaderboard
+
+GOAL, ASSIST, YELLOW, RED = 1, 2, 3, 4
+CATEGORIES = categorize({GOAL: "Gol", ASSIST: "Assistência", YELLOW: "Cartão amarelo", RED: "Cartão Vermelho"})
+
+
+def _rows(*rows):
+    return np.array(rows, dtype=np.int64).reshape(-1, 5)
+
+
+def _reference_minutes(rows):
+    """Minutes per player computed one appearance at a time."""
+    starts, exits = {}, defaultdict(lambda: 90)
+    for kind, match, player, detail, minute in rows.tolist():
+        if kind == LINEUP:
+            starts[(match, player)] = min(starts.get((match, player), 0), 0)
+        elif kind == SUBSTITUTION:
+            starts[(match, detail)] = min(starts.get((match, detail), minute), minute)
+            exits[(match, player)] = min(exits[(match, player)], minute)
+        elif kind == EVENT and detail == RED:
+            exits[(match, player)] = min(exits[(match, player)], minute)
+    minutes = defaultdict(int)
+    for (match, player), start in starts.items():
+        minutes[player] += max(0, min(90, exits[(match, player)] - start))
+    return dict(minutes)
+
+
+class TestStats:
+
+    def test_compute_totals__substitution_and_red_card__expected_minutes_and_counts(self):
+        # Fixture
+        rows = _rows(
+            (LINEUP, 1, 10, 0, 0), (LINEUP, 1, 11, 0, 0), (LINEUP, 1, 12, 0, 0),
+            (SUBSTITUTION, 1, 10, 20, 60),
+            (EVENT, 1, 11, RED, 30), (EVENT, 1, 20, GOAL, 75), (EVENT, 1, 12, GOAL, 10), (EVENT, 1, 20, GOAL, 88),
+            (EVENT, 1, 12, ASSIST, 75),
+        )
+
+        # Exercise
+        totals = compute_totals(rows, CATEGORIES)
+
+        # Assert
+        assert totals.player_ids.tolist() == [10, 11, 12, 20]
+        assert totals.minutes.tolist() == [60, 30, 90, 30]
+        assert totals.goals.tolist() == [0, 0, 1, 2]
+        assert totals.assists.tolist() == [0, 0, 1, 0]
+        assert totals.red_cards.tolist() == [0, 1, 0, 0]
+        assert totals.metric(StatMetric.goals_per_90).tolist() == [0, 0, 1, 6]
+
+    def test_compute_totals__random_season__expected_same_minutes_as_reference(self):
+        # Fixture
+        rng = random.Random(3)
+        rows = []
+        for match in range(1, 60):
+            players = rng.sample(range(1, 80), 14)
+            starters, bench = players[:11], players[11:]
+            rows += [(LINEUP, match, player, 0, 0) for player in starters]
+            for player_in in bench:
+                rows.append((SUBSTITUTION, match, rng.choice(starters), player_in, rng.randint(46, 89)))
+            for _ in range(rng.randint(0, 6)):
+                rows.append((EVENT, match, rng.choice(players), rng.choice([GOAL, ASSIST, YELLOW, RED]), rng.randint(1, 90)))
+        rows = _rows(*rows)
+
+        # Exercise
+        totals = compute_totals(rows, CATEGORIES)
+
+        # Assert
+        minutes = dict(zip(totals.player_ids.tolist(), totals.minutes.tolist()))
+        expected = _reference_minutes(rows)
+        assert {player: minutes[player] for player in expected} == expected
+
+    def test_leaderboard__ties__expected_player_id_order_and_limit(self):
+        # Fixture
+        rows = _rows(*[(EVENT, 1, player, GOAL, 10) for player in [5, 3, 3, 9, 9, 7]])
+        totals = compute_totals(rows, CATEGORIES)
+
+        # Exercise
+        top = leaderboard(totals, StatMetric.goals, limit=3)
+
+        # Assert
+        assert totals.player_ids[top].tolist() == [3, 9, 5]
+
+    def test_championship_stats_route__goals__expected_ranking_and_cache(self, engine):
+        # Fixture
+        with engine.begin() as connection:
+            connection.execute(insert(Country.__table__), [{"name": "Brasil"}])
+            connection.execute(insert(Position.__table__), [{"name": "Atacante"}])
+            connection.execute(insert(Team.__table__), [{"name": "Santos", "country_id": 1}, {"name": "Bahia", "country_id": 1}])
+            connection.execute(insert(Player.__table__), [
+                {"name": name, "country_id": 1, "position_id": 1, "team_id": 1} for name in ["Pelé", "Coutinho"]
+            ])
+            connection.execute(insert(Stadium.__table__), [{"name": "Vila", "city": "Santos", "country_id": 1}])
+            connection.execute(insert(Championship.__table__), [{"name": "Paulista", "season": "1962"}])
+            connection.execute(insert(Match.__table__), [{
+                "home_team_id": 1, "away_team_id": 2, "championship_id": 1, "stadium_id": 1,
+                "date": datetime(1962, 5, 1), "home_score": 3, "away_score": 0,
+            }])
+            connection.execute(insert(EventType.__table__), [{"name": "Gol"}, {"name": "Assistência"}])
+            connection.execute(insert(Lineup.__table__), [
+                {"match_id": 1, "team_id": 1, "player_id": 1}, {"match_id": 1, "team_id": 1, "player_id": 2},
+            ])
+            connection.execute(insert(MatchEvent.__table__), [
+                {"match_id": 1, "player_id": 1, "event_type_id": 1, "minute": minute} for minute in (10, 50)
+            ] + [{"match_id": 1, "player_id": 2, "event_type_id": 1, "minute": 70}])
+        client = TestClient(app)
+        loads = []
+
+        def listener(conn, cursor, statement, *args):
+            if "UNION ALL" in statement:
+                loads.append(statement)
+
+        event.listen(engine, "before_cursor_execute", listener)
+
+        # Exercise
+        first = client.get("/championship/1/stats/goals").json()
+        client.get("/championship/1/stats/minutes")
+        loads_before_insert = len(loads)
+        with engine.begin() as connection:
+            connection.execute(insert(MatchEvent.__table__), [{"match_id": 1, "player_id": 2, "event_type_id": 1, "minute": 80}])
+        second = client.get("/championship/1/stats/goals").json()
+        event.remove(engine, "before_cursor_execute", listener)
+
+        # Assert
+        assert [(row["rank"], row["player"], row["value"]) for row in first] == [(1, "Pelé", 2.0), (2, "Coutinho", 1.0)]
+        assert loads_before_insert == 1
+        assert len(loads) == 2
+        assert [(row["rank"], row["player"]) for row in second] == [(1, "Pelé"), (1, "Coutinho")]